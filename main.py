@@ -5,17 +5,28 @@
 import os
 import sys
 import json
-from datetime import datetime
+import argparse
+import threading
+from datetime import datetime, timedelta
 import pytz
 
 from src.utils.logger import get_logger
 from src.utils.prompt_manager import PromptManager
+from src.utils.config_service import get_config_service, SETTINGS_PATH, SOURCES_PATH
 from src.database.db_manager import get_db_manager
-from src.database.models import Item, Execution
+from src.database.models import Item, Execution, Judgment, ExecutionCheckpoint
+from src.database.generations import bump_generation, ITEMS, EXECUTIONS
 from src.agents.twitter_agent import TwitterAgent
 from src.agents.yahoo_agent import YahooAgent
 from src.agents.modelpress_agent import ModelpressAgent
 from src.processors.claude_processor import ClaudeProcessor
+from src.processors.pre_filter import PreFilter
+from src.processors.near_duplicate import NearDuplicateClusterer, JUDGMENT_FIELDS
+from src.utils.url_canonicalizer import canonical_key
+from src.utils.circuit_breaker import SourceCircuitBreaker, SKIP, TRIAL
+from src.utils.http_client import HttpClient, RetryBudget
+from src.pipeline.streaming import StreamingPipeline
+from src.pipeline.events import EventRecorder
 
 # ロガーを取得
 logger = get_logger()
@@ -35,10 +46,10 @@ class NatsuAgentExecutor:
 
         # データベースマネージャー
         self.db_manager = get_db_manager()
+        self.db_lock = threading.RLock()
 
         # 設定を読み込み
-        with open('config/sources.json', 'r', encoding='utf-8') as f:
-            self.sources_config = json.load(f)
+        self.sources_config = get_config_service().sources()
 
         # 各Agentを初期化
         self.agents = [
@@ -47,89 +58,231 @@ class NatsuAgentExecutor:
             ModelpressAgent(self.prompt_manager, self.sources_config.get('modelpress', {}))
         ]
 
+        # 保存済みの記事は詳細ページを取得しない
+        for agent in self.agents:
+            agent.known_url_checker = self._is_known_url
+
+        # 事前フィルタ（Claude判定前に明らかな対象外を除外）
+        self.pre_filter = PreFilter(self.sources_config)
+
         # Claude プロセッサー
         self.claude_processor = ClaudeProcessor(self.prompt_manager)
 
-    def execute(self) -> dict:
+        # 読み込んだ設定ファイルのバージョン（編集されていれば実行の開始時に判定条件・事前フィルタを作り直す）
+        self.config_versions = self._config_versions()
+
+        # リクエスト単位のリトライ設定（リトライ予算は実行ごとに全Agentで共有）
+        self.http_settings = self.claude_processor.settings.get('http', {})
+        for agent in self.agents:
+            agent.http = HttpClient.from_settings(self.claude_processor.settings, name=agent.name)
+        self.retry_budget = None
+
+        # 実行対象のAgent（execute の sources で絞り込む）
+        self.active_agents = list(self.agents)
+
+        # ソースごとのサーキットブレーカー（失敗が続くソースはスキップして他のソースで続行）
+        self.circuit_breaker = SourceCircuitBreaker.from_settings(
+            self.db_manager, self.claude_processor.settings, lock=self.db_lock
+        )
+
+        # 近似重複クラスタリング（代表のみ判定し、結果をクラスタ内に伝播）
+        near_duplicate_settings = self.claude_processor.settings.get('dedup', {}).get('near_duplicate', {})
+        self.near_duplicate_clusterer = None
+        if near_duplicate_settings.get('enabled', True):
+            self.near_duplicate_clusterer = NearDuplicateClusterer.from_settings(self.claude_processor.settings)
+
+        # 進捗イベント（Web画面に GET /api/events で配信される）
+        self.events = EventRecorder(self.db_manager, lock=self.db_lock)
+        self.event_retention_hours = self.claude_processor.settings.get('events', {}).get('retention_hours', 24)
+        self.current_execution_id = None
+
+    def execute(self, streaming: bool = None, sources=None, execution_id: str = None) -> dict:
         """
         情報収集を実行
 
+        Args:
+            streaming: Trueの場合、収集・判定・保存を並行して進めるストリーミングモードで実行
+                （Noneの場合は config/settings.json の pipeline.streaming.enabled に従う）
+            sources: 収集するソース（Agent名）のリスト（Noneの場合は全ソース）
+            execution_id: 実行ID（省略時は開始日時から生成）
+
         Returns:
             実行結果の辞書
         """
+        self._refresh_config()
+
+        if streaming is None:
+            streaming = self.claude_processor.settings.get('pipeline', {}).get('streaming', {}).get('enabled', False)
+
+        agent_names = [agent.name for agent in self.agents]
+        unknown_sources = [source for source in (sources or []) if source not in agent_names]
+        if unknown_sources:
+            raise ValueError(f"不明なソースです: {', '.join(unknown_sources)}（{', '.join(agent_names)} から指定してください）")
+
+        # 今回の実行で使うAgent
+        self.active_agents = [
+            agent for agent in self.agents
+            if sources is None or agent.name in sources
+        ]
+
         # 実行IDを生成
         jst = pytz.timezone('Asia/Tokyo')
         started_at = datetime.now(jst)
-        execution_id = started_at.strftime('exec_%Y%m%d_%H%M%S')
+        execution_id = execution_id or started_at.strftime('exec_%Y%m%d_%H%M%S')
 
         logger.info("=" * 60)
-        logger.info(f"情報収集開始: {execution_id}")
+        logger.info(f"情報収集開始: {execution_id}" + ("（ストリーミング）" if streaming else ""))
+        if sources is not None:
+            logger.info(f"対象ソース: {', '.join(agent.name for agent in self.active_agents)}")
         logger.info("=" * 60)
 
         # 実行ログをDBに記録
         execution = self._create_execution_record(execution_id, started_at)
 
+        self.current_execution_id = execution_id
+        self._prune_events()
+        self._emit_event(
+            'execution_started',
+            streaming=bool(streaming),
+            sources=[agent.name for agent in self.active_agents]
+        )
+
+        # この実行で使えるリクエストのリトライ回数
+        self.retry_budget = RetryBudget(self.http_settings.get('retry_budget_per_run', 20))
+        for agent in self.active_agents:
+            agent.http.budget = self.retry_budget
+
+        self._load_near_duplicate_index()
+
+        if streaming:
+            return self._run_execution(execution, lambda: StreamingPipeline(self).run(execution_id))
+        return self._run_execution(execution, lambda: self._run_staged(execution_id))
+
+    def resume(self, execution_id: str) -> dict:
+        """
+        失敗した実行を、保存済みのチェックポイント（完了済みの段階）から再開
+
+        - judged: 判定済みのアイテムを保存する
+        - collected: 収集済みのアイテムから判定・保存する（収集を省略）
+
+        Args:
+            execution_id: 再開する実行ID
+
+        Returns:
+            実行結果の辞書（execute と同じ形式）
+        """
+        session = self.db_manager.get_session()
         try:
-            # 1. 各Agentで情報収集
-            logger.info("[1/4] 各Agentで情報収集中...")
-            all_items, agent_results = self._collect_from_agents()
+            execution = session.query(Execution).filter_by(id=execution_id).first()
+        finally:
+            session.close()
 
-            if not all_items:
-                logger.warning("収集されたアイテムがありません")
-                self._update_execution_record(
-                    execution,
-                    status='success',
-                    total_collected=0,
-                    total_saved=0,
-                    agent_results=agent_results
-                )
-                return {
-                    'status': 'success',
-                    'execution_id': execution_id,
-                    'total_collected': 0,
-                    'total_saved': 0,
-                    'message': '収集されたアイテムがありませんでした'
-                }
+        error = None
+        if execution is None:
+            error = f"実行が見つかりません: {execution_id}"
+        elif execution.status in ('success', 'partial'):
+            error = f"実行はすでに完了しています: {execution_id}"
 
-            logger.info(f"合計 {len(all_items)} 件のアイテムを収集")
+        checkpoints = {} if error else self._load_checkpoints(execution_id)
+        if not error and not checkpoints:
+            error = f"再開できるチェックポイントがありません（最初から実行してください）: {execution_id}"
 
-            # 2. データ統合（重複排除）
-            logger.info("[2/4] データ統合・重複排除中...")
-            unique_items = self._remove_duplicates(all_items)
-            logger.info(f"重複排除後: {len(unique_items)} 件")
+        if error:
+            logger.error(error)
+            return {
+                'status': 'failed',
+                'execution_id': execution_id,
+                'error': error,
+                'message': '実行を再開できませんでした'
+            }
 
-            # 3. Claude判定
-            logger.info("[3/4] Claude判定中...")
-            judged_items, claude_duration = self.claude_processor.judge_items(unique_items)
-            logger.info(f"判定完了: {len(judged_items)} 件が基準を満たしました")
+        self._refresh_config()
+
+        stage = 'judged' if 'judged' in checkpoints else 'collected'
+        logger.info("=" * 60)
+        logger.info(f"実行を再開: {execution_id}（{stage} から）")
+        logger.info("=" * 60)
+
+        self._update_execution_record(execution, status='running', completed_at=None, error_message=None)
+
+        self.current_execution_id = execution_id
+        self._emit_event('execution_started', resumed_from=stage)
+
+        # 再開時は収集しないため、リクエストのリトライ予算は使わない
+        self.retry_budget = None
+        self.active_agents = list(self.agents)
+        self._load_near_duplicate_index()
+
+        return self._run_execution(execution, lambda: self._run_staged(execution_id, checkpoints))
+
+    def _run_execution(self, execution, run):
+        """
+        実行本体を呼び出し、結果を実行ログに記録
+
+        Args:
+            execution: Executionオブジェクト
+            run: 集計結果の辞書を返す実行本体
+
+        Returns:
+            実行結果の辞書
+        """
+        execution_id = execution.id
+
+        try:
+            stats = run()
 
-            # 4. データベースに保存
-            logger.info("[4/4] データベースに保存中...")
-            saved_count = self._save_to_database(judged_items, execution_id)
-            logger.info(f"保存完了: {saved_count} 件")
+            # 失敗・スキップしたソースがあれば部分的な成功として記録
+            degraded_sources = [
+                agent.name for agent in self.active_agents
+                if stats['agent_results'].get(agent.name, {}).get('status') in ('failed', 'skipped')
+            ]
+            status = 'partial' if degraded_sources else 'success'
+
+            if self.retry_budget is not None:
+                stats['agent_results']['http_retries'] = self.retry_budget.summary()
 
             # 実行ログを更新
             self._update_execution_record(
                 execution,
-                status='success',
-                total_collected=len(all_items),
-                total_saved=saved_count,
-                agent_results=agent_results,
-                claude_processed=len(judged_items),
-                claude_duration=claude_duration
+                status=status,
+                total_collected=stats['total_collected'],
+                total_saved=stats['total_saved'],
+                agent_results=stats['agent_results'],
+                claude_processed=stats['claude_processed'],
+                claude_duration_sec=stats['claude_duration']
             )
 
+            # 完了した実行のチェックポイントは不要
+            self._clear_checkpoints(execution_id)
+
+            if stats['total_collected'] == 0:
+                message = '収集されたアイテムがありませんでした'
+            else:
+                message = f"{stats['total_saved']} 件の情報を保存しました"
+            if degraded_sources:
+                message += f"（失敗・スキップしたソース: {', '.join(degraded_sources)}）"
+
             logger.info("=" * 60)
             logger.info(f"情報収集完了: {execution_id}")
-            logger.info(f"収集: {len(all_items)} 件 -> 保存: {saved_count} 件")
+            logger.info(f"収集: {stats['total_collected']} 件 -> 保存: {stats['total_saved']} 件")
             logger.info("=" * 60)
 
+            self._emit_event(
+                'execution_finished',
+                status=status,
+                total_collected=stats['total_collected'],
+                total_saved=stats['total_saved'],
+                degraded_sources=degraded_sources,
+                message=message
+            )
+
             return {
-                'status': 'success',
+                'status': status,
                 'execution_id': execution_id,
-                'total_collected': len(all_items),
-                'total_saved': saved_count,
-                'message': f'{saved_count} 件の情報を保存しました'
+                'total_collected': stats['total_collected'],
+                'total_saved': stats['total_saved'],
+                'degraded_sources': degraded_sources,
+                'message': message
             }
 
         except Exception as e:
@@ -142,6 +295,8 @@ class NatsuAgentExecutor:
                 error_message=str(e)
             )
 
+            self._emit_event('execution_finished', status='failed', error=str(e), message='情報収集に失敗しました')
+
             return {
                 'status': 'failed',
                 'execution_id': execution_id,
@@ -149,59 +304,439 @@ class NatsuAgentExecutor:
                 'message': '情報収集に失敗しました'
             }
 
+    def _run_staged(self, execution_id, checkpoints=None):
+        """
+        収集 -> 重複排除 -> 判定 -> 保存 を段階的に実行
+
+        収集・判定の各段階の出力はチェックポイントとして保存し、
+        チェックポイントが渡された場合は完了済みの段階を省略する。
+
+        Args:
+            execution_id: 実行ID
+            checkpoints: 再開時のチェックポイント（{段階: 出力}）
+
+        Returns:
+            集計結果の辞書
+            {
+                "total_collected", "total_saved", "agent_results",
+                "claude_processed", "claude_duration"
+            }
+        """
+        checkpoints = checkpoints or {}
+
+        if 'judged' in checkpoints:
+            # 判定済み: 保存のみ行う
+            logger.info("[1-3/4] 判定済みのチェックポイントを使用（収集・判定を省略）")
+            judged = checkpoints['judged']
+            total_collected = judged['total_collected']
+            agent_results = judged['agent_results']
+            judged_items = judged['items']
+            claude_duration = judged['claude_duration']
+
+        else:
+            # 1. 各Agentで情報収集
+            if 'collected' in checkpoints:
+                logger.info("[1/4] 収集済みのチェックポイントを使用（収集を省略）")
+                all_items = checkpoints['collected']['items']
+                agent_results = checkpoints['collected']['agent_results']
+            else:
+                logger.info("[1/4] 各Agentで情報収集中...")
+                all_items, agent_results = self._collect_from_agents()
+                if all_items:
+                    self._save_checkpoint(execution_id, 'collected', {
+                        'items': all_items,
+                        'agent_results': agent_results
+                    })
+
+            if not all_items:
+                logger.warning("収集されたアイテムがありません")
+                return {
+                    'total_collected': 0,
+                    'total_saved': 0,
+                    'agent_results': agent_results,
+                    'claude_processed': 0,
+                    'claude_duration': 0.0
+                }
+
+            total_collected = len(all_items)
+            logger.info(f"合計 {total_collected} 件のアイテムを収集")
+
+            # 2. データ統合（重複排除）
+            logger.info("[2/4] データ統合・重複排除中...")
+            unique_items = self._remove_duplicates(all_items)
+            unique_items = self._remove_known_items(unique_items)
+            self._add_source_counts(agent_results, 'new', self._count_by_agent(unique_items))
+            logger.info(f"重複排除後: {len(unique_items)} 件")
+
+            # 事前フィルタ（明らかな対象外はClaudeに送らない）
+            unique_items, pre_filter_stats = self.pre_filter.apply(unique_items)
+            agent_results['pre_filter'] = pre_filter_stats
+            logger.info(
+                f"事前フィルタ後: {len(unique_items)} 件"
+                f"（除外 {pre_filter_stats['dropped']} 件: {pre_filter_stats['by_reason']}）"
+            )
+
+            # 3. Claude判定
+            logger.info("[3/4] Claude判定中...")
+            judged_items, claude_duration, cluster_stats = self._judge_batch(unique_items, execution_id)
+            agent_results['near_duplicate'] = cluster_stats
+            self._add_source_counts(agent_results, 'high', self._count_by_agent(
+                item for item in judged_items if item.get('importance_level') == 'high'
+            ))
+            logger.info(f"判定完了: {len(judged_items)} 件が基準を満たしました")
+
+            self._save_checkpoint(execution_id, 'judged', {
+                'items': judged_items,
+                'agent_results': agent_results,
+                'total_collected': total_collected,
+                'claude_duration': claude_duration
+            })
+
+        # 4. データベースに保存
+        logger.info("[4/4] データベースに保存中...")
+        saved_count = self._save_to_database(judged_items, execution_id)
+        logger.info(f"保存完了: {saved_count} 件")
+
+        return {
+            'total_collected': total_collected,
+            'total_saved': saved_count,
+            'agent_results': agent_results,
+            'claude_processed': len(judged_items),
+            'claude_duration': claude_duration
+        }
+
+    def _load_near_duplicate_index(self):
+        """
+        近似重複の照合に使う保存済みアイテム（公開日時が lookback_days 以内）を読み込む
+        """
+        if not self.near_duplicate_clusterer:
+            return
+
+        cutoff = datetime.now(pytz.timezone('Asia/Tokyo')) - timedelta(days=self.near_duplicate_clusterer.lookback_days)
+        columns = [Item.url, Item.simhash, Item.cluster_id] + [getattr(Item, field) for field in JUDGMENT_FIELDS]
+
+        # SQLiteは1接続を共有するため、ストリーミング実行時は並行アクセスを直列化する
+        with self.db_lock:
+            session = self.db_manager.get_session()
+            try:
+                rows = session.query(*columns).filter(
+                    Item.simhash.isnot(None),
+                    Item.published_at >= cutoff
+                ).all()
+            finally:
+                session.close()
+
+        self.near_duplicate_clusterer.reset_index(dict(row._mapping) for row in rows)
+        logger.info(f"近似重複: 保存済みアイテム {len(rows)} 件と照合します")
+
+    def _judge_batch(self, items, execution_id):
+        """
+        近似重複をまとめて代表のみ判定し、判定結果をクラスタ内に伝播
+
+        Args:
+            items: 重複排除・事前フィルタ済みのアイテムリスト
+            execution_id: 実行ID
+
+        Returns:
+            (基準を満たしたアイテムリスト, 判定時間（秒）, クラスタ集計)
+        """
+        cluster_stats = {'clusters': 0, 'duplicates': 0, 'stored_matches': 0}
+        if not items:
+            return [], 0.0, cluster_stats
+        item_count = len(items)
+
+        # 判定済みアイテム（保存済み・同じ実行の先のバッチ）の近似重複は判定結果を引き継ぐ
+        # 残りは近似重複をまとめ、各クラスタの代表のみ判定する
+        matched = []
+        clusters = {}
+        if self.near_duplicate_clusterer:
+            items, matched = self.near_duplicate_clusterer.match_known(items)
+            cluster_stats['stored_matches'] = len(matched)
+            if matched:
+                logger.info(f"近似重複: 判定済みのクラスタに {len(matched)} 件を追加（判定を省略）")
+            items, clusters = self.near_duplicate_clusterer.cluster(items)
+            cluster_stats['clusters'] = len(clusters)
+            cluster_stats['duplicates'] = sum(len(members) for members in clusters.values())
+            logger.info(f"近似重複: {len(clusters)} クラスタ（判定を省略 {cluster_stats['duplicates']} 件）")
+
+        self._emit_event('judge_started', items=item_count)
+        if items:
+            judged_items, claude_duration = self.claude_processor.judge_items(items)
+        else:
+            judged_items, claude_duration = [], 0.0
+
+        # 判定履歴を保存（ローカル分類器の学習データ）
+        self._save_judgments(self.claude_processor.last_judged_items, judged_items, execution_id)
+
+        # 代表の判定結果をクラスタ内に伝播
+        if clusters:
+            judged_items = self.near_duplicate_clusterer.propagate(judged_items, clusters)
+        if self.near_duplicate_clusterer:
+            self.near_duplicate_clusterer.remember(judged_items)
+        judged_items = judged_items + matched
+
+        self._emit_event(
+            'judge_finished',
+            items=item_count,
+            passed=len(judged_items),
+            duration_sec=round(claude_duration, 2)
+        )
+        return judged_items, claude_duration, cluster_stats
+
     def _collect_from_agents(self):
         """
         各Agentで情報収集
 
+        失敗・スキップしたAgentがあっても、他のAgentの収集結果で続行する。
+
         Returns:
             (全アイテムリスト, Agent結果辞書)
 
         Raises:
-            Exception: いずれかのAgentが失敗した場合
+            Exception: 全てのAgentが失敗・スキップした場合
         """
         all_items = []
         agent_results = {}
 
-        for agent in self.agents:
-            result = agent.execute_with_retry()
-            agent_results[agent.name] = {
-                'status': result['status'],
-                'attempts': result.get('attempts', 0),
-                'count': result.get('count', 0)
-            }
-
-            if result['status'] == 'failed':
-                # 1つでもAgentが失敗したら中断
-                error_msg = f"{agent.name} Agent が失敗しました: {result.get('error')}"
-                logger.error(error_msg)
-                raise Exception(error_msg)
+        for agent in self.active_agents:
+            result = self._execute_agent(agent)
+            agent_results[agent.name] = self._summarize_agent_result(result)
 
             # 成功したデータを追加
-            all_items.extend(result.get('data', []))
+            if result['status'] == 'success':
+                all_items.extend(result.get('data', []))
+
+        self._check_agent_results(agent_results)
 
         return all_items, agent_results
 
+    def _config_versions(self):
+        """
+        設定ファイル（settings.json / sources.json）のバージョン
+        """
+        config = get_config_service()
+        return config.version(SETTINGS_PATH), config.version(SOURCES_PATH)
+
+    def _refresh_config(self):
+        """
+        設定ファイルが編集されていれば、判定条件（ClaudeProcessor）と事前フィルタを作り直す
+
+        常駐プロセス（ワーカー・スケジューラー）でも次の実行から反映される。
+        それ以外の設定（HTTPのリトライ・サーキットブレーカー・近似重複・Agentのソース設定等）は起動時に読み込む。
+        """
+        versions = self._config_versions()
+        if versions == self.config_versions:
+            return
+
+        logger.info("設定ファイルの変更を反映します（判定条件・事前フィルタ）")
+        self.claude_processor.refresh_settings()
+        self.sources_config = get_config_service().sources()
+        self.pre_filter = PreFilter(self.sources_config)
+        self.config_versions = versions
+
+    def _execute_agent(self, agent, emit=None):
+        """
+        サーキットブレーカーの状態に応じてAgentを実行し、結果を記録
+
+        - スキップ中のソースは実行しない
+        - 待機時間を過ぎたソースはリトライなしで1回だけ試行する
+
+        Args:
+            agent: 情報収集Agent
+            emit: 指定した場合はストリーミングで実行し、アイテムを1件ずつ渡す
+
+        Returns:
+            実行結果の辞書（スキップした場合は status が "skipped"）
+        """
+        decision = self.circuit_breaker.before_call(agent.name)
+
+        if decision == SKIP:
+            reason = self.circuit_breaker.skip_reason(agent.name)
+            logger.warning(f"{agent.name} Agent をスキップ: {reason}")
+            self._emit_event('agent_finished', agent=agent.name, status='skipped', count=0, error=reason)
+            return {
+                'status': 'skipped',
+                'error': reason,
+                'agent': agent.name,
+                'attempts': 0,
+                'count': 0
+            }
+
+        self._emit_event('agent_started', agent=agent.name)
+
+        max_retries = None
+        if decision == TRIAL:
+            logger.info(f"{agent.name} Agent を試行します（リトライなし）")
+            max_retries = 0
+
+        if emit is None:
+            result = agent.execute_with_retry(max_retries=max_retries)
+        else:
+            result = agent.execute_stream_with_retry(emit, max_retries=max_retries)
+
+        if result['status'] == 'failed':
+            logger.error(f"{agent.name} Agent が失敗しました: {result.get('error')}")
+            if self.circuit_breaker.record_failure(agent.name, result.get('error')):
+                logger.warning(f"{agent.name} Agent は失敗が続いているため、次回以降スキップします")
+        else:
+            self.circuit_breaker.record_success(agent.name)
+
+        self._emit_event(
+            'agent_finished',
+            agent=agent.name,
+            status=result['status'],
+            count=result.get('count', 0),
+            error=result.get('error')
+        )
+        return result
+
+    @staticmethod
+    def _summarize_agent_result(result):
+        """
+        実行ログに記録するAgent結果を作成
+
+        Args:
+            result: Agentの実行結果
+
+        Returns:
+            Agent結果の辞書
+        """
+        summary = {
+            'status': result['status'],
+            'attempts': result.get('attempts', 0),
+            'count': result.get('count', 0)
+        }
+        if result['status'] == 'success':
+            # 未保存だったアイテム数・重要度highの件数（適応的ポーリングの指標）
+            summary['new'] = 0
+            summary['high'] = 0
+        else:
+            summary['error'] = result.get('error')
+        return summary
+
+    def _count_by_agent(self, items):
+        """
+        アイテム数をAgent名ごとに集計
+
+        Args:
+            items: アイテムのイテラブル
+
+        Returns:
+            {Agent名: 件数}
+        """
+        source_to_agent = {agent.source: agent.name for agent in self.agents}
+        counts = {}
+        for item in items:
+            name = source_to_agent.get(item.get('source'))
+            if name:
+                counts[name] = counts.get(name, 0) + 1
+        return counts
+
+    @staticmethod
+    def _add_source_counts(agent_results, field, counts):
+        """
+        Agent名ごとの件数をAgent結果に加算
+
+        Args:
+            agent_results: Agent結果辞書
+            field: 加算する項目（new/high）
+            counts: {Agent名: 件数}
+        """
+        for name, count in counts.items():
+            if name in agent_results:
+                agent_results[name][field] = agent_results[name].get(field, 0) + count
+
+    def _check_agent_results(self, agent_results):
+        """
+        収集を続行できるかチェック
+
+        Args:
+            agent_results: Agent結果辞書
+
+        Raises:
+            Exception: 全てのAgentが失敗・スキップした場合
+        """
+        if not any(
+            agent_results.get(agent.name, {}).get('status') == 'success'
+            for agent in self.active_agents
+        ):
+            errors = ', '.join(
+                f"{agent.name}: {agent_results.get(agent.name, {}).get('error')}"
+                for agent in self.active_agents
+            )
+            raise Exception(f"全てのAgentが失敗またはスキップされました（{errors}）")
+
     def _remove_duplicates(self, items):
         """
-        URL単位で重複を排除
+        正規化URL単位で重複を排除
 
         Args:
             items: アイテムリスト
 
         Returns:
-            重複排除後のアイテムリスト
+            重複排除後のアイテムリスト（各アイテムに canonical_key を付与）
         """
-        seen_urls = set()
+        seen_keys = set()
         unique_items = []
 
         for item in items:
-            url = item.get('url')
-            if url and url not in seen_urls:
-                seen_urls.add(url)
+            key = canonical_key(item.get('url'))
+            if key and key not in seen_keys:
+                seen_keys.add(key)
+                item['canonical_key'] = key
                 unique_items.append(item)
 
         return unique_items
 
+    def _remove_known_items(self, items):
+        """
+        保存済み（正規化URLが一致する）アイテムを除外し、再判定しないようにする
+
+        Args:
+            items: canonical_key 付きのアイテムリスト
+
+        Returns:
+            未保存のアイテムリスト
+        """
+        keys = [item['canonical_key'] for item in items]
+        known_keys = set()
+
+        # SQLiteは1接続を共有するため、ストリーミング実行時は並行アクセスを直列化する
+        with self.db_lock:
+            session = self.db_manager.get_session()
+            try:
+                for i in range(0, len(keys), 500):
+                    rows = session.query(Item.canonical_key).filter(
+                        Item.canonical_key.in_(keys[i:i + 500])
+                    ).all()
+                    known_keys.update(row[0] for row in rows)
+            finally:
+                session.close()
+
+            return [item for item in items if item['canonical_key'] not in known_keys]
+
+    def _is_known_url(self, url):
+        """
+        正規化URLが保存済みかチェック
+
+        Args:
+            url: URL
+
+        Returns:
+            保存済みの場合True
+        """
+        key = canonical_key(url)
+        if not key:
+            return False
+
+        # SQLiteは1接続を共有するため、ストリーミング実行時は並行アクセスを直列化する
+        with self.db_lock:
+            session = self.db_manager.get_session()
+            try:
+                return session.query(Item.id).filter_by(canonical_key=key).first() is not None
+            finally:
+                session.close()
+
     def _save_to_database(self, items, execution_id):
         """
         アイテムをデータベースに保存
@@ -213,57 +748,207 @@ class NatsuAgentExecutor:
         Returns:
             保存した件数
         """
-        session = self.db_manager.get_session()
-        saved_count = 0
+        # SQLiteは1接続を共有するため、ストリーミング実行時は並行アクセスを直列化する
+        with self.db_lock:
+            session = self.db_manager.get_session()
+            saved_count = 0
+            seen_keys = set()
 
-        try:
-            for item in items:
-                # published_at を datetime オブジェクトに変換（文字列の場合）
-                published_at = item.get('published_at')
-                if isinstance(published_at, str):
-                    try:
-                        # ISO 8601 文字列を datetime に変換
-                        published_at = datetime.fromisoformat(published_at)
-                    except ValueError:
-                        # 変換できない場合は現在時刻で代替
-                        published_at = datetime.now(pytz.timezone('Asia/Tokyo'))
-                item['published_at'] = published_at
-
-                # URLで既存チェック
-                existing = session.query(Item).filter_by(url=item['url']).first()
-                if existing:
-                    logger.debug(f"重複スキップ: {item['url']}")
-                    continue
-
-                # 新規アイテムを作成
-                new_item = Item(
-                    source=item.get('source'),
-                    source_detail=item.get('source_detail'),
-                    title=item.get('title'),
-                    content=item.get('content'),
-                    summary=item.get('summary'),
-                    url=item.get('url'),
-                    published_at=item.get('published_at'),
-                    relevance_score=item.get('relevance_score'),
-                    importance_score=item.get('importance_score'),
-                    importance_level=item.get('importance_level'),
-                    category=item.get('category'),
-                    claude_reason=item.get('claude_reason'),
-                    metrics=item.get('metrics'),
-                    execution_id=execution_id
-                )
-                session.add(new_item)
-                saved_count += 1
+            try:
+                for item in items:
+                    # published_at を datetime オブジェクトに変換（文字列の場合）
+                    published_at = item.get('published_at')
+                    if isinstance(published_at, str):
+                        try:
+                            # ISO 8601 文字列を datetime に変換
+                            published_at = datetime.fromisoformat(published_at)
+                        except ValueError:
+                            # 変換できない場合は現在時刻で代替
+                            published_at = datetime.now(pytz.timezone('Asia/Tokyo'))
+                    item['published_at'] = published_at
 
-            session.commit()
-            return saved_count
+                    # 正規化URLで既存チェック
+                    key = item.get('canonical_key') or canonical_key(item['url'])
+                    existing = session.query(Item.id).filter_by(canonical_key=key).first()
+                    if existing or key in seen_keys:
+                        logger.debug(f"重複スキップ: {item['url']}")
+                        continue
+                    seen_keys.add(key)
+
+                    # 新規アイテムを作成
+                    new_item = Item(
+                        source=item.get('source'),
+                        source_detail=item.get('source_detail'),
+                        title=item.get('title'),
+                        content=item.get('content'),
+                        summary=item.get('summary'),
+                        url=item.get('url'),
+                        canonical_key=key,
+                        published_at=item.get('published_at'),
+                        relevance_score=item.get('relevance_score'),
+                        importance_score=item.get('importance_score'),
+                        importance_level=item.get('importance_level'),
+                        category=item.get('category'),
+                        claude_reason=item.get('claude_reason'),
+                        judge_tier=item.get('judge_tier'),
+                        metrics=item.get('metrics'),
+                        execution_id=execution_id,
+                        cluster_id=item.get('cluster_id'),
+                        simhash=item.get('simhash')
+                    )
+                    session.add(new_item)
+                    saved_count += 1
+
+                    # 保存済みアイテムの近似重複: 単独だった保存済みアイテムにもクラスタIDを付ける
+                    anchor_url = item.get('cluster_anchor_url')
+                    if anchor_url and item.get('cluster_id'):
+                        session.query(Item).filter(
+                            Item.url == anchor_url,
+                            Item.cluster_id.is_(None)
+                        ).update({'cluster_id': item['cluster_id']}, synchronize_session=False)
+
+                # 一覧・件数のキャッシュを無効化する
+                if saved_count:
+                    bump_generation(session, ITEMS)
+
+                session.commit()
+
+            except Exception as e:
+                session.rollback()
+                logger.error(f"データベース保存エラー: {e}")
+                raise
+            finally:
+                session.close()
+
+        self._emit_event('saved', count=saved_count)
+        return saved_count
 
+    def _save_judgments(self, all_judged_items, passed_items, execution_id):
+        """
+        判定結果の履歴を保存（フィルタで除外されたものも含む）
+
+        Args:
+            all_judged_items: 判定結果をマージした全アイテム
+            passed_items: フィルタを通過したアイテム
+            execution_id: 実行ID
+        """
+        passed_urls = {item.get('url') for item in passed_items}
+        # SQLiteは1接続を共有するため、ストリーミング実行時は並行アクセスを直列化する
+        with self.db_lock:
+            session = self.db_manager.get_session()
+
+            try:
+                for item in all_judged_items:
+                    session.add(Judgment(
+                        execution_id=execution_id,
+                        url=item.get('url'),
+                        source=item.get('source'),
+                        title=item.get('title'),
+                        content=item.get('content'),
+                        relevance_score=item.get('relevance_score'),
+                        importance_score=item.get('importance_score'),
+                        importance_level=item.get('importance_level'),
+                        category=item.get('category'),
+                        judge_tier=item.get('judge_tier'),
+                        passed=item.get('url') in passed_urls
+                    ))
+                session.commit()
+            except Exception as e:
+                # 履歴の保存に失敗しても収集結果の保存は続行する
+                session.rollback()
+                logger.warning(f"判定履歴の保存に失敗しました: {e}")
+            finally:
+                session.close()
+
+    def _emit_event(self, event_type, **data):
+        """
+        実行中の進捗イベントを記録
+
+        記録に失敗しても実行は続行する（画面の進捗表示が遅れるだけ）。
+
+        Args:
+            event_type: イベントの種類
+            **data: イベントの内容
+        """
+        if self.current_execution_id is None:
+            return
+        try:
+            self.events.record(self.current_execution_id, event_type, data)
         except Exception as e:
-            session.rollback()
-            logger.error(f"データベース保存エラー: {e}")
-            raise
-        finally:
-            session.close()
+            logger.warning(f"進捗イベント（{event_type}）の記録に失敗しました: {e}")
+
+    def _prune_events(self):
+        """
+        保持期間を過ぎた進捗イベントを削除
+        """
+        try:
+            self.events.prune(self.event_retention_hours)
+        except Exception as e:
+            logger.warning(f"進捗イベントの削除に失敗しました: {e}")
+
+    def _save_checkpoint(self, execution_id, stage, payload):
+        """
+        段階の出力をチェックポイントとして保存（同じ段階の既存チェックポイントは置き換える）
+
+        保存に失敗しても実行は続行する（再開できなくなるだけ）。
+
+        Args:
+            execution_id: 実行ID
+            stage: 段階（collected/judged）
+            payload: 段階の出力
+        """
+        # datetime等を含んでもJSONカラムに保存できるよう文字列化する
+        payload = json.loads(json.dumps(payload, ensure_ascii=False, default=str))
+
+        with self.db_lock:
+            session = self.db_manager.get_session()
+            try:
+                session.query(ExecutionCheckpoint).filter_by(
+                    execution_id=execution_id, stage=stage
+                ).delete()
+                session.add(ExecutionCheckpoint(execution_id=execution_id, stage=stage, payload=payload))
+                session.commit()
+            except Exception as e:
+                session.rollback()
+                logger.warning(f"チェックポイント（{stage}）の保存に失敗しました: {e}")
+            finally:
+                session.close()
+
+    def _load_checkpoints(self, execution_id):
+        """
+        実行のチェックポイントを読み込む
+
+        Args:
+            execution_id: 実行ID
+
+        Returns:
+            {段階: 出力} の辞書
+        """
+        with self.db_lock:
+            session = self.db_manager.get_session()
+            try:
+                rows = session.query(ExecutionCheckpoint).filter_by(execution_id=execution_id).all()
+                return {row.stage: row.payload for row in rows}
+            finally:
+                session.close()
+
+    def _clear_checkpoints(self, execution_id):
+        """
+        実行のチェックポイントを削除
+
+        Args:
+            execution_id: 実行ID
+        """
+        with self.db_lock:
+            session = self.db_manager.get_session()
+            try:
+                session.query(ExecutionCheckpoint).filter_by(execution_id=execution_id).delete()
+                session.commit()
+            except Exception as e:
+                session.rollback()
+                logger.warning(f"チェックポイントの削除に失敗しました: {e}")
+            finally:
+                session.close()
 
     def _create_execution_record(self, execution_id, started_at):
         """
@@ -284,6 +969,7 @@ class NatsuAgentExecutor:
                 status='running'
             )
             session.add(execution)
+            bump_generation(session, EXECUTIONS)
             session.commit()
             return execution
         finally:
@@ -309,6 +995,8 @@ class NatsuAgentExecutor:
                 for key, value in kwargs.items():
                     setattr(exec_record, key, value)
 
+                # 実行ログのキャッシュを無効化する
+                bump_generation(session, EXECUTIONS)
                 session.commit()
         finally:
             session.close()
@@ -318,14 +1006,41 @@ def main():
     """
     メイン関数
     """
+    parser = argparse.ArgumentParser(description='諸橋沙夏情報収集Agent')
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='収集・判定・保存を並行して進めるストリーミングモードで実行'
+    )
+    parser.add_argument(
+        '--sources',
+        help='収集するソースをカンマ区切りで指定（例: twitter,yahoo。省略時は全ソース）'
+    )
+    parser.add_argument(
+        '--resume',
+        metavar='EXECUTION_ID',
+        help='失敗した実行を完了済みの段階から再開'
+    )
+    args = parser.parse_args()
+
     try:
         executor = NatsuAgentExecutor()
-        result = executor.execute()
+        if args.resume:
+            result = executor.resume(args.resume)
+        else:
+            result = executor.execute(
+                streaming=True if args.stream else None,
+                sources=args.sources.split(',') if args.sources else None
+            )
 
         # 結果を表示
         print("\n" + "=" * 60)
-        if result['status'] == 'success':
-            print("[OK] 実行成功")
+        if result['status'] in ('success', 'partial'):
+            if result['status'] == 'success':
+                print("[OK] 実行成功")
+            else:
+                print("[WARN] 一部のソースを除いて実行成功")
+                print(f"失敗・スキップしたソース: {', '.join(result['degraded_sources'])}")
             print(f"実行ID: {result['execution_id']}")
             print(f"収集: {result.get('total_collected', 0)} 件")
             print(f"保存: {result.get('total_saved', 0)} 件")
@@ -334,7 +1049,7 @@ def main():
             print(f"エラー: {result.get('error', 'Unknown error')}")
         print("=" * 60)
 
-        return 0 if result['status'] == 'success' else 1
+        return 0 if result['status'] in ('success', 'partial') else 1
 
     except KeyboardInterrupt:
         print("\n\n中断されました")
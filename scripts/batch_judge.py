@@ -0,0 +1,260 @@
+"""
+Message Batches一括判定スクリプト
+バックフィル（収集済みデータの取り込み）やプロンプト変更後の再判定を
+Anthropic Message Batches API経由でまとめて実行する
+
+使用例:
+    # DB内のアイテムを再判定（直近30日分）
+    python scripts/batch_judge.py --rejudge --days 30
+
+    # 再判定で基準を満たさなくなったアイテムを削除せず、以前の判定のまま残す
+    python scripts/batch_judge.py --rejudge --keep-rejected
+
+    # JSON / JSONL ファイルの収集データを判定して取り込み
+    python scripts/batch_judge.py --input backfill.jsonl
+
+    # ローカルのスタブサーバーに向けて実行（オフライン確認用）
+    ANTHROPIC_BASE_URL=http://127.0.0.1:8765 python scripts/batch_judge.py --rejudge
+"""
+import sys
+import os
+import json
+import argparse
+from datetime import datetime, timedelta
+
+# プロジェクトルートをパスに追加
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytz
+
+from src.database.db_manager import get_db_manager
+from src.database.models import Item, Judgment
+from src.database.generations import bump_generation, ITEMS
+from src.processors.batch_processor import ClaudeBatchProcessor
+from src.utils.prompt_manager import PromptManager
+from src.utils.url_canonicalizer import canonical_key
+
+# 判定結果としてDBに反映する項目
+JUDGMENT_FIELDS = (
+    'relevance_score',
+    'importance_score',
+    'importance_level',
+    'category',
+    'summary',
+    'claude_reason',
+    'judge_tier',
+)
+
+
+def load_items_from_file(path):
+    """
+    JSON配列またはJSONLファイルから収集データを読み込む
+
+    Args:
+        path: ファイルパス
+
+    Returns:
+        アイテムのリスト
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read().strip()
+
+    if text.startswith('['):
+        return json.loads(text)
+
+    return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+
+def load_items_from_database(db_manager, days=None):
+    """
+    再判定対象のアイテムをDBから読み込む
+
+    Args:
+        db_manager: データベースマネージャー
+        days: 直近何日分を対象にするか（Noneの場合は全件）
+
+    Returns:
+        アイテムのリスト（収集時と同じ形式）
+    """
+    session = db_manager.get_session()
+    try:
+        query = session.query(Item)
+        if days:
+            cutoff = datetime.now(pytz.timezone('Asia/Tokyo')) - timedelta(days=days)
+            query = query.filter(Item.published_at >= cutoff)
+
+        return [
+            {
+                'source': item.source,
+                'source_detail': item.source_detail,
+                'title': item.title,
+                'content': item.content,
+                'url': item.url,
+                'published_at': item.published_at.isoformat() if item.published_at else None,
+                'metrics': item.metrics,
+            }
+            for item in query.all()
+        ]
+    finally:
+        session.close()
+
+
+def merge_results_into_database(db_manager, execution_id, insert_new, keep_rejected=False):
+    """
+    バッチ結果をDBに反映するコールバックを生成
+
+    itemsテーブルには通常の実行と同じくフィルタを通過したアイテムだけを置く。
+    登録済みのアイテムがフィルタを通過しなくなった場合は削除する
+    （判定結果は judgments に passed=False として残る）。
+
+    Args:
+        db_manager: データベースマネージャー
+        execution_id: 新規アイテムに付与する実行ID
+        insert_new: フィルタを通過した未登録アイテムを追加するか
+        keep_rejected: フィルタを通過しなくなったアイテムを削除せず、以前の判定結果のまま残すか
+
+    Returns:
+        ClaudeBatchProcessor.judge_items_in_batches に渡すコールバック
+    """
+    stats = {'updated': 0, 'inserted': 0, 'removed': 0, 'kept': 0}
+    inserted_keys = set()
+
+    def on_results(judged_items, passed_items):
+        passed_urls = {item['url'] for item in passed_items}
+        session = db_manager.get_session()
+        try:
+            for item in judged_items:
+                # 判定履歴（ローカル分類器の学習データ）
+                session.add(Judgment(
+                    execution_id=execution_id,
+                    url=item.get('url'),
+                    source=item.get('source'),
+                    title=item.get('title'),
+                    content=item.get('content'),
+                    relevance_score=item.get('relevance_score'),
+                    importance_score=item.get('importance_score'),
+                    importance_level=item.get('importance_level'),
+                    category=item.get('category'),
+                    judge_tier=item.get('judge_tier'),
+                    passed=item['url'] in passed_urls
+                ))
+
+                key = canonical_key(item['url'])
+                existing = (
+                    session.query(Item).filter_by(canonical_key=key).first()
+                    or session.query(Item).filter_by(url=item['url']).first()
+                )
+                if existing:
+                    if item['url'] in passed_urls:
+                        # 既存アイテムは判定結果のみ更新
+                        for field in JUDGMENT_FIELDS:
+                            setattr(existing, field, item.get(field))
+                        stats['updated'] += 1
+                    elif keep_rejected:
+                        stats['kept'] += 1
+                    else:
+                        session.delete(existing)
+                        stats['removed'] += 1
+                    continue
+
+                if not insert_new or item['url'] not in passed_urls or key in inserted_keys:
+                    continue
+                inserted_keys.add(key)
+
+                published_at = item.get('published_at')
+                if isinstance(published_at, str):
+                    try:
+                        published_at = datetime.fromisoformat(published_at)
+                    except ValueError:
+                        published_at = datetime.now(pytz.timezone('Asia/Tokyo'))
+
+                session.add(Item(
+                    source=item.get('source'),
+                    source_detail=item.get('source_detail'),
+                    title=item.get('title'),
+                    content=item.get('content'),
+                    url=item.get('url'),
+                    canonical_key=key,
+                    published_at=published_at,
+                    metrics=item.get('metrics'),
+                    execution_id=execution_id,
+                    **{field: item.get(field) for field in JUDGMENT_FIELDS}
+                ))
+                stats['inserted'] += 1
+
+            # 件数等のキャッシュを無効化する
+            bump_generation(session, ITEMS)
+
+            session.commit()
+            print(
+                f"DB反映: 更新 {stats['updated']} 件 / 追加 {stats['inserted']} 件 / "
+                f"削除 {stats['removed']} 件 / 据え置き {stats['kept']} 件（累計）"
+            )
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    return on_results
+
+
+def main():
+    """
+    Message Batchesで一括判定を実行
+    """
+    parser = argparse.ArgumentParser(description='Message Batchesによる一括判定')
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument('--input', help='判定する収集データ（JSON配列またはJSONL）')
+    group.add_argument('--rejudge', action='store_true', help='DB内の既存アイテムを再判定する')
+    parser.add_argument('--days', type=int, help='再判定の対象期間（日数）')
+    parser.add_argument(
+        '--keep-rejected', action='store_true',
+        help='基準を満たさなくなった既存アイテムを削除せず、以前の判定結果のまま残す'
+    )
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("諸橋沙夏情報収集Agent - Message Batches一括判定")
+    print("=" * 60)
+
+    try:
+        db_manager = get_db_manager()
+        processor = ClaudeBatchProcessor(PromptManager())
+
+        if args.input:
+            items = load_items_from_file(args.input)
+        else:
+            items = load_items_from_database(db_manager, args.days)
+
+        print(f"\n判定対象: {len(items)} 件")
+        print(f"API: {processor.base_url}")
+
+        execution_id = datetime.now(pytz.timezone('Asia/Tokyo')).strftime('batch_%Y%m%d_%H%M%S')
+        on_results = merge_results_into_database(
+            db_manager, execution_id, insert_new=bool(args.input), keep_rejected=args.keep_rejected
+        )
+
+        summary = processor.judge_items_in_batches(items, on_results)
+
+        print("\n" + "=" * 60)
+        print("[OK] 一括判定が完了しました")
+        print(
+            f"バッチ: {summary['batches']} / リクエスト: {summary['requests']} "
+            f"(失敗 {summary['errored']} / 通常の呼び出しで判定 {summary['fallback']})"
+        )
+        print(f"判定: {summary['judged']} 件 / 基準通過: {summary['passed']} 件")
+        print("=" * 60)
+
+        return 0 if summary['errored'] == 0 else 1
+
+    except Exception as e:
+        print(f"\n[ERROR] エラーが発生しました: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == '__main__':
+    exit_code = main()
+    sys.exit(exit_code)
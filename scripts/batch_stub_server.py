@@ -0,0 +1,253 @@
+"""
+Message Batches APIスタブサーバー
+Anthropic Message Batches APIの代わりにローカルで応答し、
+一括判定をオフラインで確認できるようにする
+
+判定はキーワードに基づく決定的なダミー結果を返す。
+通常のMessages API（POST /v1/messages）にも同じ判定で応答するため、
+バッチで失敗したリクエストを通常の呼び出しで判定し直す処理も確認できる。
+
+使用例:
+    python scripts/batch_stub_server.py --port 8765 --polls 2
+    python scripts/batch_stub_server.py --errored chunk-000001   # 指定したリクエストを失敗として返す
+    ANTHROPIC_BASE_URL=http://127.0.0.1:8765 CLAUDE_API_KEY=dummy \\
+        python scripts/batch_judge.py --rejudge
+"""
+import sys
+import json
+import argparse
+import threading
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 判定対象アイテムを抽出するためのプロンプト上の区切り
+ITEMS_START = '【収集した情報】'
+ITEMS_END = '各情報について'
+
+SUBJECT_NAME = '諸橋沙夏'
+HIGH_KEYWORDS = ['出演決定', '発売', 'リリース', 'ライブ', '公演', '主演']
+MEDIUM_KEYWORDS = ['イベント', 'インタビュー', '配信', '更新', '公開']
+
+
+def judge_item(item):
+    """
+    アイテム1件のダミー判定結果を生成
+
+    Args:
+        item: 収集データ
+
+    Returns:
+        判定結果の辞書
+    """
+    text = f"{item.get('title') or ''} {item.get('content') or ''}"
+    relevance = 90 if SUBJECT_NAME in text else 10
+
+    if any(k in text for k in HIGH_KEYWORDS):
+        importance, level, category = 85, 'high', 'メディア出演（TV/ラジオ/雑誌）'
+    elif any(k in text for k in MEDIUM_KEYWORDS):
+        importance, level, category = 60, 'medium', 'イベント'
+    else:
+        importance, level, category = 30, 'low', 'SNS投稿'
+
+    return {
+        'url': item.get('url'),
+        'relevance_score': relevance,
+        'importance_score': importance,
+        'importance_level': level,
+        'category': category,
+        'summary': (item.get('title') or item.get('content') or '')[:50],
+        'claude_reason': 'スタブサーバーによるダミー判定'
+    }
+
+
+def build_message(params):
+    """
+    Messages APIのリクエストに対するダミー判定のメッセージを生成
+
+    Args:
+        params: リクエストのパラメータ（model, messages 等）
+
+    Returns:
+        メッセージの辞書
+
+    Raises:
+        KeyError, IndexError, ValueError: プロンプトから判定対象を取り出せない場合
+    """
+    prompt = params['messages'][0]['content']
+    start = prompt.index(ITEMS_START) + len(ITEMS_START)
+    end = prompt.index(ITEMS_END, start)
+    items = json.loads(prompt[start:end])
+
+    judgments = [judge_item(item) for item in items]
+    text = '```json\n' + json.dumps(judgments, ensure_ascii=False) + '\n```'
+
+    return {
+        'id': f'msg_{uuid.uuid4().hex[:24]}',
+        'type': 'message',
+        'role': 'assistant',
+        'model': params.get('model'),
+        'content': [{'type': 'text', 'text': text}],
+        'stop_reason': 'end_turn',
+        'stop_sequence': None,
+        'usage': {'input_tokens': len(prompt), 'output_tokens': len(text)}
+    }
+
+
+def build_result(batch_request, errored_custom_ids=()):
+    """
+    バッチ内の1リクエストに対する結果行を生成
+
+    Args:
+        batch_request: {"custom_id": ..., "params": {...}}
+        errored_custom_ids: 失敗として返す custom_id
+
+    Returns:
+        結果行の辞書
+    """
+    custom_id = batch_request.get('custom_id')
+    if custom_id in errored_custom_ids:
+        return {
+            'custom_id': custom_id,
+            'result': {'type': 'errored', 'error': {'type': 'api_error', 'message': 'スタブサーバーによる失敗'}}
+        }
+
+    try:
+        message = build_message(batch_request['params'])
+    except (KeyError, IndexError, ValueError) as e:
+        return {
+            'custom_id': custom_id,
+            'result': {'type': 'errored', 'error': {'type': 'invalid_request_error', 'message': str(e)}}
+        }
+
+    return {
+        'custom_id': custom_id,
+        'result': {'type': 'succeeded', 'message': message}
+    }
+
+
+class BatchStubHandler(BaseHTTPRequestHandler):
+    """
+    Message Batches APIのエンドポイントを模倣するハンドラー
+    """
+
+    # batch_id -> {"requests": [...], "polls": 残りポーリング回数}
+    batches = {}
+    lock = threading.Lock()
+    polls_until_ended = 1
+    errored_custom_ids = frozenset()
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        body = json.loads(self.rfile.read(length) or b'{}')
+
+        if self.path.rstrip('/') == '/v1/messages':
+            try:
+                return self._send_json(200, build_message(body))
+            except (KeyError, IndexError, ValueError) as e:
+                return self._send_json(400, {
+                    'type': 'error',
+                    'error': {'type': 'invalid_request_error', 'message': str(e)}
+                })
+
+        if self.path.rstrip('/') != '/v1/messages/batches':
+            return self._send_json(404, {'error': 'Not Found'})
+
+        batch_id = f'msgbatch_{uuid.uuid4().hex[:24]}'
+
+        with self.lock:
+            self.batches[batch_id] = {
+                'requests': body.get('requests', []),
+                'polls': self.polls_until_ended
+            }
+
+        self._send_json(200, self._batch_info(batch_id))
+
+    def do_GET(self):
+        parts = self.path.strip('/').split('/')
+        if len(parts) < 4 or parts[:3] != ['v1', 'messages', 'batches']:
+            return self._send_json(404, {'error': 'Not Found'})
+
+        batch_id = parts[3]
+        with self.lock:
+            batch = self.batches.get(batch_id)
+        if batch is None:
+            return self._send_json(404, {'error': 'Not Found'})
+
+        if len(parts) == 5 and parts[4] == 'results':
+            lines = [
+                json.dumps(build_result(r, self.errored_custom_ids), ensure_ascii=False)
+                for r in batch['requests']
+            ]
+            payload = ('\n'.join(lines) + '\n').encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/x-jsonl')
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+            return
+
+        with self.lock:
+            batch['polls'] = max(batch['polls'] - 1, 0)
+        self._send_json(200, self._batch_info(batch_id))
+
+    def _batch_info(self, batch_id):
+        batch = self.batches[batch_id]
+        ended = batch['polls'] == 0
+        count = len(batch['requests'])
+        errored = sum(1 for r in batch['requests'] if r.get('custom_id') in self.errored_custom_ids)
+        host = self.headers.get('Host', 'localhost')
+
+        return {
+            'id': batch_id,
+            'type': 'message_batch',
+            'processing_status': 'ended' if ended else 'in_progress',
+            'request_counts': {
+                'processing': 0 if ended else count,
+                'succeeded': count - errored if ended else 0,
+                'errored': errored if ended else 0,
+                'canceled': 0,
+                'expired': 0
+            },
+            'results_url': f'http://{host}/v1/messages/batches/{batch_id}/results' if ended else None
+        }
+
+    def _send_json(self, status, data):
+        payload = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        print(f"[BatchStub] {self.address_string()} {format % args}")
+
+
+def main():
+    """
+    スタブサーバーを起動
+    """
+    parser = argparse.ArgumentParser(description='Message Batches APIスタブサーバー')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--polls', type=int, default=1, help='完了扱いになるまでのポーリング回数')
+    parser.add_argument('--errored', default='', help='失敗として返すリクエストの custom_id（カンマ区切り）')
+    args = parser.parse_args()
+
+    BatchStubHandler.polls_until_ended = args.polls
+    BatchStubHandler.errored_custom_ids = frozenset(c for c in args.errored.split(',') if c)
+    server = ThreadingHTTPServer((args.host, args.port), BatchStubHandler)
+    print(f"Message Batchesスタブサーバー起動: http://{args.host}:{args.port}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n停止しました")
+    finally:
+        server.server_close()
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,151 @@
+"""
+一覧APIのJSON変換のベンチマークスクリプト
+GET /api/items の読み込み＋JSON変換を、以下の方法で per_page ごとに計測する
+
+- 従来: ORMオブジェクト + Item.to_dict + Flask標準のJSONプロバイダー
+- 行（json）: 必要なカラムだけを行として読み、標準の json モジュールで変換
+- 行（orjson）: 必要なカラムだけを行として読み、orjson で変換（インストールされている場合）
+
+一時ファイルのSQLite DBにテストデータを作成して計測するため、既存のDBには影響しない。
+
+使用例:
+    python scripts/benchmark_serialization.py
+    python scripts/benchmark_serialization.py --rows 5000 --repeat 20
+"""
+import sys
+import os
+import time
+import argparse
+import tempfile
+import statistics
+from datetime import datetime, timedelta
+
+# プロジェクトルートをパスに追加
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytz
+
+PER_PAGE_SIZES = [20, 100, 1000]
+
+
+def create_test_items(session, rows):
+    """
+    日本語の本文を持つテストデータを作成
+    """
+    from src.database.models import Item
+
+    jst = pytz.timezone('Asia/Tokyo')
+    now = datetime.now(jst)
+    content = '諸橋沙夏が春の新ドラマで主演を務めることが決定した。共演者も豪華な顔ぶれとなっている。' * 20
+    session.bulk_insert_mappings(Item, [
+        {
+            'source': 'yahoo_news',
+            'source_detail': 'エンタメ',
+            'title': f'諸橋沙夏 主演ドラマ決定 その{i}',
+            'content': content,
+            'summary': '春の新ドラマで主演を務めることが決定',
+            'url': f'https://example.com/articles/{i}',
+            'published_at': now - timedelta(minutes=i),
+            'relevance_score': 90,
+            'importance_score': 100 - i % 100,
+            'importance_level': 'high',
+            'category': 'メディア出演（TV/ラジオ/雑誌）',
+            'claude_reason': '本人の主演作品の発表のため重要度が高い',
+            'judge_tier': 'primary',
+            'metrics': {'likes': i, 'retweets': i // 2, 'views': i * 10},
+            'collected_at': now,
+            'execution_id': 'exec_benchmark',
+        }
+        for i in range(rows)
+    ])
+    session.commit()
+
+
+def measure(func, repeat):
+    """
+    関数を繰り返し実行し、実行時間の中央値（ミリ秒）と結果を返す
+    """
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), result
+
+
+def main():
+    """
+    ベンチマークを実行
+    """
+    parser = argparse.ArgumentParser(description='一覧APIのJSON変換のベンチマーク')
+    parser.add_argument('--rows', type=int, default=2000, help='テストデータの件数')
+    parser.add_argument('--repeat', type=int, default=10, help='計測の繰り返し回数')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("諸橋沙夏情報収集Agent - 一覧APIのJSON変換ベンチマーク")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # 既存のDBを使わないよう、DBマネージャーの読み込み前に接続先を一時ファイルにする
+        os.environ['DB_TYPE'] = 'sqlite'
+        os.environ['DB_PATH'] = os.path.join(tmp_dir, 'benchmark.db')
+
+        from flask import Flask
+        from flask.json.provider import DefaultJSONProvider
+        from src.database.db_manager import get_db_manager
+        from src.database.queries import ITEM_DICT_FIELDS, build_item_query, order_items, project_items, row_to_dict
+        from src.utils import json_serializer
+
+        db_manager = get_db_manager()
+        db_manager.create_tables()
+        session = db_manager.get_session()
+
+        try:
+            create_test_items(session, args.rows)
+            flask_default = DefaultJSONProvider(Flask(__name__))
+
+            def legacy(per_page):
+                items = order_items(build_item_query(session, period='all')).limit(per_page).all()
+                body = flask_default.dumps({'items': [item.to_dict() for item in items]})
+                session.expunge_all()
+                return body.encode('utf-8')
+
+            def rows(per_page):
+                query = project_items(order_items(build_item_query(session, period='all')), ITEM_DICT_FIELDS)
+                items = query.limit(per_page).all()
+                return json_serializer.dumps_bytes({'items': [row_to_dict(row, ITEM_DICT_FIELDS) for row in items]})
+
+            methods = [('従来（ORM + Flask標準）', legacy, None), ('行 + json', rows, False)]
+            if json_serializer.ORJSON_AVAILABLE:
+                methods.append(('行 + orjson', rows, True))
+            else:
+                print("\n[INFO] orjson がインストールされていないため、orjson の計測は省略します")
+
+            print(f"\nテストデータ: {args.rows} 件 / 繰り返し: {args.repeat} 回（中央値）\n")
+            print(f"{'per_page':>8}{'time(ms)':>10}{'size(KB)':>10}{'speedup':>9}  方法")
+
+            orjson_available = json_serializer.ORJSON_AVAILABLE
+            for per_page in PER_PAGE_SIZES:
+                baseline = None
+                for label, func, use_orjson in methods:
+                    if use_orjson is not None:
+                        json_serializer.ORJSON_AVAILABLE = use_orjson
+                    elapsed, body = measure(lambda: func(per_page), args.repeat)
+                    json_serializer.ORJSON_AVAILABLE = orjson_available
+
+                    baseline = baseline or elapsed
+                    print(f"{per_page:>8}{elapsed:>10.2f}{len(body) / 1024:>10.1f}{baseline / elapsed:>8.1f}x  {label}")
+                print()
+        finally:
+            session.close()
+            db_manager.close()
+
+    print("=" * 60)
+    return 0
+
+
+if __name__ == '__main__':
+    exit_code = main()
+    sys.exit(exit_code)
@@ -0,0 +1,185 @@
+"""
+一覧クエリの実行計画チェックスクリプト
+GET /api/items の主なフィルタの組み合わせについて EXPLAIN を実行し、
+インデックスを使って並べ替え（Sort / TEMP B-TREE）なしで読めているか確認する
+キーワード検索は全文検索インデックス（src/database/search.py）が使われているかも確認する
+
+使用例:
+    python scripts/check_query_plans.py
+    python scripts/check_query_plans.py --analyze   # 統計情報を更新してから確認
+    python scripts/check_query_plans.py --verbose   # 実行計画を全て表示
+"""
+import sys
+import os
+import json
+import argparse
+from datetime import datetime
+
+import pytz
+from sqlalchemy import text
+
+# プロジェクトルートをパスに追加
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.database.db_manager import get_db_manager
+from src.database.models import Item
+from src.database.queries import build_item_query, order_items, apply_cursor, encode_cursor
+from src.database.search import SQLITE_FTS_TABLE
+
+# ダッシュボードで使われる主なフィルタの組み合わせ
+FILTER_COMBINATIONS = [
+    {'period': period, 'importance': importance, 'category': category, 'keyword': ''}
+    for period in ['24h', '7d', '30d', 'all']
+    for importance in ['all', 'high', 'medium_up']
+    for category in ['all', '__category__']
+] + [
+    # キーワード検索（トライグラムで検索できる3文字以上の語）
+    {'period': period, 'importance': 'all', 'category': 'all', 'keyword': '諸橋沙夏'}
+    for period in ['7d', 'all']
+]
+
+
+def explain(engine, query, keyword=''):
+    """
+    クエリの実行計画を取得
+
+    Args:
+        engine: SQLAlchemyエンジン
+        query: SQLAlchemyのクエリ
+        keyword: クエリのキーワード（SQLiteでは指定した場合に全文検索インデックスが使われているか確認する）
+
+    Returns:
+        (実行計画の行リスト, 問題点のリスト)
+    """
+    # PostgreSQLの部分インデックスは条件の値が分かる場合のみ使われるため、値を埋め込んで確認する
+    # （psycopg2もパラメータを埋め込んで送信する）
+    sql = str(query.statement.compile(engine, compile_kwargs={'literal_binds': True}))
+
+    with engine.connect() as conn:
+        if engine.dialect.name == 'postgresql':
+            plan = conn.execute(text(f'EXPLAIN (FORMAT JSON) {sql}')).scalar()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            # PostgreSQLは一致件数が多い語では並び順のインデックスを読みながら絞り込む計画も選ぶため、
+            # 全文検索インデックスの有無は確認せず、全件の読み込み（Seq Scan）がないことだけ確認する
+            return _postgresql_plan_lines(plan[0]['Plan'])
+
+        rows = conn.execute(text(f'EXPLAIN QUERY PLAN {sql}')).fetchall()
+        lines = [row[-1] for row in rows]
+        problems = []
+        for line in lines:
+            # キーワード検索は一致したアイテムだけを並べ替えるため、並べ替えは問題にしない
+            if 'TEMP B-TREE' in line and not keyword:
+                problems.append(f'並べ替えが発生しています: {line}')
+            elif line.startswith('SCAN items') and 'INDEX' not in line:
+                problems.append(f'インデックスを使わずに全件を読んでいます: {line}')
+        if keyword and not any(SQLITE_FTS_TABLE in line for line in lines):
+            problems.append(f'全文検索インデックス {SQLITE_FTS_TABLE} が使われていません')
+        return lines, problems
+
+
+def _postgresql_plan_lines(node, depth=0):
+    """
+    PostgreSQLの実行計画（JSON）を行リストと問題点のリストに変換
+    """
+    label = node['Node Type']
+    if node.get('Index Name'):
+        label += f" using {node['Index Name']}"
+    lines = ['  ' * depth + label]
+    problems = []
+
+    if node['Node Type'] in ('Sort', 'Incremental Sort'):
+        problems.append(f"並べ替えが発生しています: {node.get('Sort Key')}")
+    elif node['Node Type'] == 'Seq Scan' and node.get('Relation Name') == 'items':
+        problems.append('インデックスを使わずに全件を読んでいます: Seq Scan on items')
+
+    for child in node.get('Plans', []):
+        child_lines, child_problems = _postgresql_plan_lines(child, depth + 1)
+        lines.extend(child_lines)
+        problems.extend(child_problems)
+    return lines, problems
+
+
+def main():
+    """
+    実行計画をチェック
+    """
+    parser = argparse.ArgumentParser(description='一覧クエリの実行計画チェック')
+    parser.add_argument('--analyze', action='store_true', help='統計情報を更新してから確認する')
+    parser.add_argument('--per-page', type=int, default=20, help='1ページあたり件数')
+    parser.add_argument('--verbose', action='store_true', help='実行計画を全て表示する')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("諸橋沙夏情報収集Agent - 一覧クエリの実行計画チェック")
+    print("=" * 60)
+
+    try:
+        db_manager = get_db_manager()
+        engine = db_manager.engine
+
+        if args.analyze:
+            with engine.begin() as conn:
+                conn.execute(text('ANALYZE'))
+            print("\n統計情報を更新しました（ANALYZE）")
+
+        session = db_manager.get_session()
+        try:
+            # カテゴリは実データの値を使う（なければ任意の値）
+            row = session.query(Item.category).filter(Item.category.isnot(None)).first()
+            sample_category = row[0] if row else 'メディア出演（TV/ラジオ/雑誌）'
+
+            # 2ページ目以降（カーソル指定）の確認に使う位置
+            sample_item = order_items(session.query(Item)).first() or Item(
+                id=1, importance_score=50, published_at=datetime.now(pytz.timezone('Asia/Tokyo'))
+            )
+            cursor = encode_cursor(sample_item)
+
+            print(f"\nDB Type: {db_manager.db_type} / アイテム数: {session.query(Item).count()} 件\n")
+
+            failed = 0
+            for filters in FILTER_COMBINATIONS:
+                if filters['category'] == '__category__':
+                    filters = dict(filters, category=sample_category)
+
+                for page_label, page_cursor in (('1ページ目', None), ('カーソル指定', cursor)):
+                    query = order_items(apply_cursor(build_item_query(session, **filters), page_cursor))
+                    lines, problems = explain(engine, query.limit(args.per_page + 1), filters['keyword'])
+
+                    label = (
+                        f"period={filters['period']:<4} importance={filters['importance']:<9} "
+                        f"category={'指定' if filters['category'] != 'all' else 'all':<4} "
+                        f"keyword={'指定' if filters['keyword'] else 'なし':<4} {page_label}"
+                    )
+                    status = 'NG' if problems else 'OK'
+                    print(f"[{status}] {label}")
+                    if problems or args.verbose:
+                        for line in lines:
+                            print(f"       {line}")
+                    for problem in problems:
+                        print(f"       -> {problem}")
+                    failed += bool(problems)
+        finally:
+            session.close()
+
+        print("\n" + "=" * 60)
+        if failed:
+            print(f"[NG] {failed} 件のクエリでインデックスが使われていません")
+            print("python scripts/init_database.py でインデックスを作成し、--analyze で統計情報を更新してください")
+            print("=" * 60)
+            return 1
+
+        print("[OK] 全てのクエリがインデックスを使い、並べ替えなしで読めています")
+        print("=" * 60)
+        return 0
+
+    except Exception as e:
+        print(f"\n[ERROR] エラーが発生しました: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == '__main__':
+    exit_code = main()
+    sys.exit(exit_code)
@@ -0,0 +1,87 @@
+"""
+アイテムの一括出力スクリプト
+フィルタ条件に一致するアイテムをNDJSONまたはCSVでファイルに書き出す
+（GET /api/items/export と同じ出力。件数に関係なくメモリ使用量は一定）
+
+使用例:
+    python scripts/export_items.py --output items.ndjson
+    python scripts/export_items.py --format csv --period 30d --importance high --output high.csv
+    python scripts/export_items.py --fields id,title,url,published_at --output urls.ndjson
+"""
+import sys
+import os
+import argparse
+
+# プロジェクトルートをパスに追加
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.database.db_manager import get_db_manager
+from src.database.export import EXPORT_FORMATS, EXPORT_BATCH_SIZE, iter_item_rows, format_rows, buffer_chunks
+from src.database.queries import parse_fields
+
+
+def main():
+    """
+    アイテムを書き出す
+    """
+    parser = argparse.ArgumentParser(description='アイテムの一括出力（NDJSON / CSV）')
+    parser.add_argument('--output', required=True, help='出力ファイルのパス')
+    parser.add_argument('--format', choices=list(EXPORT_FORMATS), default=None,
+                        help='出力形式（省略時は出力ファイルの拡張子から判定し、それ以外は ndjson）')
+    parser.add_argument('--period', default='all', help='期間（24h, 7d, 30d, all）')
+    parser.add_argument('--importance', default='all', help='重要度（all, high, medium_up）')
+    parser.add_argument('--category', default='all', help='カテゴリ（all, またはカテゴリ名）')
+    parser.add_argument('--keyword', default='', help='キーワード')
+    parser.add_argument('--fields', default=None, help='出力する項目（カンマ区切り。省略時は全項目）')
+    parser.add_argument('--batch-size', type=int, default=EXPORT_BATCH_SIZE, help='1回に読み込む行数')
+    args = parser.parse_args()
+
+    export_format = args.format or ('csv' if args.output.lower().endswith('.csv') else 'ndjson')
+
+    print("=" * 60)
+    print("諸橋沙夏情報収集Agent - アイテムの一括出力")
+    print("=" * 60)
+
+    try:
+        fields = parse_fields(args.fields)
+        filters = {
+            'period': args.period,
+            'importance': args.importance,
+            'category': args.category,
+            'keyword': args.keyword
+        }
+
+        db_manager = get_db_manager()
+        session = db_manager.get_session()
+
+        count = 0
+
+        def counted(rows):
+            nonlocal count
+            for row in rows:
+                count += 1
+                yield row
+
+        try:
+            rows = counted(iter_item_rows(session, filters, fields, batch_size=args.batch_size))
+            # newline='' はCSVの改行（\r\n）をそのまま書き込むため
+            with open(args.output, 'w', encoding='utf-8', newline='') as f:
+                for chunk in buffer_chunks(format_rows(rows, export_format, fields)):
+                    f.write(chunk)
+        finally:
+            session.close()
+
+        print(f"\n[OK] {count} 件を書き出しました（{export_format}）: {args.output}")
+        print("=" * 60)
+        return 0
+
+    except Exception as e:
+        print(f"\n[ERROR] エラーが発生しました: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == '__main__':
+    exit_code = main()
+    sys.exit(exit_code)
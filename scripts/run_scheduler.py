@@ -0,0 +1,77 @@
+"""
+スケジューラー常駐スクリプト
+config/settings.json の schedule に従って情報収集を定期実行する
+
+使用例:
+    python scripts/run_scheduler.py
+    python scripts/run_scheduler.py --run-now   # 起動直後に全ソースを1回実行
+"""
+import sys
+import os
+import signal
+import argparse
+
+# プロジェクトルートをパスに追加
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from main import NatsuAgentExecutor
+from src.pipeline.scheduler import ExecutionScheduler
+from src.utils.config_service import get_config_service
+
+
+def main():
+    """
+    スケジューラーを起動
+    """
+    parser = argparse.ArgumentParser(description='情報収集の定期実行')
+    parser.add_argument('--settings', default='config/settings.json', help='設定ファイルのパス')
+    parser.add_argument('--run-now', action='store_true', help='起動直後に全ソースを1回実行')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("諸橋沙夏情報収集Agent - スケジューラー")
+    print("=" * 60)
+
+    try:
+        settings = get_config_service().get_json(args.settings)
+
+        if not settings.get('schedule', {}).get('enabled', False):
+            print("\n[ERROR] schedule.enabled が false です（config/settings.json で有効にしてください）")
+            return 1
+
+        # 実行間で使い回すExecutor（初期化は起動時の1回のみ）
+        executor = NatsuAgentExecutor()
+        scheduler = ExecutionScheduler(executor, settings)
+
+        jobs = scheduler.add_jobs()
+        if not jobs:
+            print("\n[ERROR] 実行スケジュールが設定されていません（schedule.time / schedule.sources）")
+            return 1
+
+        print("\n登録したスケジュール:")
+        for job in jobs:
+            print(f"  - {job}")
+
+        if args.run_now:
+            scheduler.run_execution()
+
+        # SIGTERMでも実行中の収集を待ってから停止する
+        signal.signal(signal.SIGTERM, lambda signum, frame: scheduler.shutdown())
+
+        print("\nスケジューラーを開始しました（Ctrl+C で停止）")
+        scheduler.start()
+        return 0
+
+    except (KeyboardInterrupt, SystemExit):
+        print("\nスケジューラーを停止しました")
+        return 0
+    except Exception as e:
+        print(f"\n[ERROR] エラーが発生しました: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == '__main__':
+    exit_code = main()
+    sys.exit(exit_code)
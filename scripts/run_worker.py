@@ -0,0 +1,67 @@
+"""
+ジョブワーカー常駐スクリプト
+Web API（POST /api/execute 等）で登録された実行をジョブキューから取り出して実行する
+
+使用例:
+    python scripts/run_worker.py
+    python scripts/run_worker.py --once   # 待機中のジョブを1件だけ実行して終了
+"""
+import sys
+import os
+import signal
+import argparse
+
+# プロジェクトルートをパスに追加
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from main import NatsuAgentExecutor
+from src.pipeline.worker import JobWorker
+from src.utils.config_service import get_config_service
+
+
+def main():
+    """
+    ワーカーを起動
+    """
+    parser = argparse.ArgumentParser(description='実行ジョブのワーカー')
+    parser.add_argument('--settings', default='config/settings.json', help='設定ファイルのパス')
+    parser.add_argument('--worker-id', help='ワーカーID（省略時は ホスト名:プロセスID）')
+    parser.add_argument('--once', action='store_true', help='待機中のジョブを1件だけ実行して終了')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("諸橋沙夏情報収集Agent - ジョブワーカー")
+    print("=" * 60)
+
+    try:
+        settings = get_config_service().get_json(args.settings)
+
+        # ジョブ間で使い回すExecutor（初期化は起動時の1回のみ）
+        executor = NatsuAgentExecutor()
+        worker = JobWorker.from_settings(executor, settings, worker_id=args.worker_id)
+
+        if args.once:
+            if not worker.run_once():
+                print("\n待機中のジョブはありません")
+            return 0
+
+        # SIGTERMでも実行中のジョブを完了してから停止する
+        signal.signal(signal.SIGTERM, lambda signum, frame: worker.stop())
+
+        print("\nジョブを待機しています（Ctrl+C で停止）")
+        worker.run_forever()
+        return 0
+
+    except KeyboardInterrupt:
+        print("\nワーカーを停止しました")
+        return 0
+    except Exception as e:
+        print(f"\n[ERROR] エラーが発生しました: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == '__main__':
+    exit_code = main()
+    sys.exit(exit_code)
@@ -0,0 +1,121 @@
+"""
+ローカル分類器の学習スクリプト
+判定履歴（judgmentsテーブル）から分類器を学習し、Claude判定との一致率を評価して
+バージョン付きで保存する
+
+使用例:
+    python scripts/train_local_classifier.py
+    python scripts/train_local_classifier.py --no-promote   # 評価のみ（LATESTを更新しない）
+"""
+import sys
+import os
+import json
+import argparse
+
+# プロジェクトルートをパスに追加
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import or_
+
+from src.database.db_manager import get_db_manager
+from src.database.models import Judgment
+from src.processors.local_classifier import LocalClassifier, train_test_split
+from src.utils.config_service import get_config_service
+
+
+def load_samples(db_manager):
+    """
+    学習用サンプルを読み込む（URLごとに最新のClaude判定のみ）
+
+    Args:
+        db_manager: データベースマネージャー
+
+    Returns:
+        サンプルのリスト
+    """
+    session = db_manager.get_session()
+    try:
+        # ローカル分類器自身の判定は学習に使わない
+        judgments = session.query(Judgment).filter(
+            or_(Judgment.judge_tier.is_(None), Judgment.judge_tier != 'local')
+        ).order_by(Judgment.id).all()
+
+        samples = {}
+        for j in judgments:
+            samples[j.url] = {
+                'url': j.url,
+                'source': j.source,
+                'title': j.title,
+                'content': j.content,
+                'relevance_score': j.relevance_score,
+                'importance_score': j.importance_score,
+                'importance_level': j.importance_level,
+                'category': j.category,
+            }
+        return list(samples.values())
+    finally:
+        session.close()
+
+
+def main():
+    """
+    ローカル分類器を学習・評価・保存
+    """
+    parser = argparse.ArgumentParser(description='ローカル分類器の学習')
+    parser.add_argument('--settings', default='config/settings.json', help='設定ファイルのパス')
+    parser.add_argument('--no-promote', action='store_true', help='LATEST を更新しない')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("諸橋沙夏情報収集Agent - ローカル分類器の学習")
+    print("=" * 60)
+
+    try:
+        settings = get_config_service().get_json(args.settings)
+
+        classifier_settings = settings.get('local_classifier', {})
+        model_dir = classifier_settings.get('model_dir', 'models/local_classifier')
+        confidence = classifier_settings.get('confidence', 0.95)
+        min_samples = classifier_settings.get('min_training_samples', 200)
+
+        # [1/3] 学習データの読み込み
+        print("\n[1/3] 判定履歴を読み込み中...")
+        samples = load_samples(get_db_manager())
+        print(f"サンプル数: {len(samples)} 件")
+
+        if len(samples) < min_samples:
+            print(f"\n[ERROR] 学習には {min_samples} 件以上の判定履歴が必要です")
+            return 1
+
+        # [2/3] 学習
+        print("\n[2/3] 学習中...")
+        train_samples, test_samples = train_test_split(samples)
+        version = LocalClassifier.next_version(model_dir)
+        classifier = LocalClassifier.train(train_samples, settings, version)
+
+        # [3/3] 評価・保存
+        print("\n[3/3] Claude判定との一致率を評価中...")
+        report = classifier.evaluate(test_samples, confidence)
+        report['train_samples'] = len(train_samples)
+        version_dir = classifier.save(model_dir, report, promote=not args.no_promote)
+
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+
+        print("\n" + "=" * 60)
+        print(f"[OK] モデルを保存しました: {version_dir}")
+        if args.no_promote:
+            print("LATEST は更新していません")
+        print("=" * 60)
+
+        return 0
+
+    except Exception as e:
+        print(f"\n[ERROR] エラーが発生しました: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == '__main__':
+    exit_code = main()
+    sys.exit(exit_code)
@@ -4,8 +4,9 @@ Agent基底クラス
 """
 import time
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Iterator, Callable
 from src.utils.prompt_manager import PromptManager
+from src.utils.http_client import HttpClient
 
 
 class BaseAgent(ABC):
@@ -13,11 +14,14 @@ class BaseAgent(ABC):
     情報収集Agentの基底クラス
     """
 
+    # 収集したアイテムの source 値（各Agentで定義）
+    source = None
+
     def __init__(
         self,
         name: str,
         prompt_manager: PromptManager,
-        max_retries: int = 2,
+        max_retries: int = 1,
         retry_interval: int = 5
     ):
         """
@@ -26,7 +30,7 @@ class BaseAgent(ABC):
         Args:
             name: Agent名
             prompt_manager: プロンプトマネージャー
-            max_retries: 最大リトライ回数
+            max_retries: 最大リトライ回数（収集全体のやり直し。一時的なエラーは self.http がリクエスト単位でリトライする）
             retry_interval: リトライ間隔（秒）
         """
         self.name = name
@@ -34,6 +38,12 @@ class BaseAgent(ABC):
         self.max_retries = max_retries
         self.retry_interval = retry_interval
 
+        # HTTPクライアント（リクエスト単位のリトライ。実行側で設定・リトライ予算を差し替える）
+        self.http = HttpClient(name=name)
+
+        # 保存済みURLの判定（実行側から設定。保存済みの記事は詳細取得を省略する）
+        self.known_url_checker = None
+
         # プロンプトを読み込み
         try:
             self.prompt = self.prompt_manager.load_prompt(name)
@@ -41,10 +51,13 @@ class BaseAgent(ABC):
             self.prompt = None
             print(f"警告: {name} のプロンプトファイルが見つかりません")
 
-    def execute_with_retry(self) -> Dict[str, Any]:
+    def execute_with_retry(self, max_retries: int = None) -> Dict[str, Any]:
         """
         リトライロジック付きで収集を実行
 
+        Args:
+            max_retries: 最大リトライ回数（省略時はAgentの設定値）
+
         Returns:
             実行結果の辞書
             {
@@ -55,9 +68,12 @@ class BaseAgent(ABC):
                 "attempts": 試行回数
             }
         """
-        for attempt in range(self.max_retries + 1):
+        if max_retries is None:
+            max_retries = self.max_retries
+
+        for attempt in range(max_retries + 1):
             try:
-                print(f"[{self.name}] 収集開始 (試行 {attempt + 1}/{self.max_retries + 1})")
+                print(f"[{self.name}] 収集開始 (試行 {attempt + 1}/{max_retries + 1})")
 
                 # 実際の収集処理を実行
                 result = self.collect()
@@ -74,10 +90,10 @@ class BaseAgent(ABC):
 
             except Exception as e:
                 error_msg = str(e)
-                print(f"[{self.name}] エラー発生 (試行 {attempt + 1}/{self.max_retries + 1}): {error_msg}")
+                print(f"[{self.name}] エラー発生 (試行 {attempt + 1}/{max_retries + 1}): {error_msg}")
 
                 # 最後の試行でもない場合はリトライ
-                if attempt < self.max_retries:
+                if attempt < max_retries:
                     print(f"[{self.name}] {self.retry_interval}秒後にリトライします...")
                     time.sleep(self.retry_interval)
                     continue
@@ -91,6 +107,80 @@ class BaseAgent(ABC):
                         "attempts": attempt + 1
                     }
 
+    def execute_stream_with_retry(
+        self,
+        emit: Callable[[Dict[str, Any]], None],
+        max_retries: int = None
+    ) -> Dict[str, Any]:
+        """
+        リトライロジック付きで収集を実行し、収集したアイテムを1件ずつ emit に渡す
+
+        リトライ時は同じアイテムが再度渡されることがある（重複は受け取り側で除去する）。
+
+        Args:
+            emit: アイテムを受け取るコールバック
+            max_retries: 最大リトライ回数（省略時はAgentの設定値）
+
+        Returns:
+            実行結果の辞書（execute_with_retry と同じ形式。"data" は含まない）
+        """
+        if max_retries is None:
+            max_retries = self.max_retries
+
+        for attempt in range(max_retries + 1):
+            count = 0
+            try:
+                print(f"[{self.name}] 収集開始 (試行 {attempt + 1}/{max_retries + 1})")
+
+                for item in self.collect_stream():
+                    emit(item)
+                    count += 1
+
+                print(f"[{self.name}] 収集成功: {count} 件")
+
+                return {
+                    "status": "success",
+                    "agent": self.name,
+                    "attempts": attempt + 1,
+                    "count": count
+                }
+
+            except Exception as e:
+                error_msg = str(e)
+                print(f"[{self.name}] エラー発生 (試行 {attempt + 1}/{max_retries + 1}): {error_msg}")
+
+                if attempt < max_retries:
+                    print(f"[{self.name}] {self.retry_interval}秒後にリトライします...")
+                    time.sleep(self.retry_interval)
+                    continue
+                else:
+                    print(f"[{self.name}] 全ての試行が失敗しました")
+                    return {
+                        "status": "failed",
+                        "error": error_msg,
+                        "agent": self.name,
+                        "attempts": attempt + 1,
+                        "count": count
+                    }
+
+    def is_known_url(self, url: str) -> bool:
+        """
+        URLが保存済みかチェック
+
+        Args:
+            url: URL
+
+        Returns:
+            保存済みの場合True（判定手段が設定されていない場合はFalse）
+        """
+        if self.known_url_checker is None:
+            return False
+        try:
+            return self.known_url_checker(url)
+        except Exception as e:
+            print(f"[{self.name}] 保存済みチェックに失敗しました: {e}")
+            return False
+
     @abstractmethod
     def collect(self) -> List[Dict[str, Any]]:
         """
@@ -116,5 +206,16 @@ class BaseAgent(ABC):
         """
         pass
 
+    def collect_stream(self) -> Iterator[Dict[str, Any]]:
+        """
+        収集したデータを1件ずつ返す（ストリーミング実行用）
+
+        デフォルトは collect() の結果を順に返す。取得できたものから返せるAgentはオーバーライドする。
+
+        Yields:
+            収集したデータ（collect() と同じ形式）
+        """
+        yield from self.collect()
+
     def __repr__(self):
         return f"<{self.__class__.__name__}(name={self.name})>"
@@ -4,7 +4,7 @@ BeautifulSoupを使用してモデルプレスから記事を収集する
 """
 import requests
 from bs4 import BeautifulSoup
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
 from datetime import datetime, timezone
 import pytz
 from urllib.parse import quote
@@ -19,6 +19,9 @@ class ModelpressAgent(BaseAgent):
     モデルプレスから諸橋沙夏さんに関する記事を収集するAgent
     """
 
+    # 収集したアイテムの source 値
+    source = 'modelpress'
+
     def __init__(self, prompt_manager, config: Dict[str, Any]):
         """
         初期化
@@ -44,14 +47,20 @@ class ModelpressAgent(BaseAgent):
 
         Returns:
             収集した記事のリスト
+
+        Raises:
+            Exception: 検索ページの取得に失敗した場合（記事詳細の取得失敗はその記事のみスキップ）
         """
-        try:
-            articles = self._search_news()
-            return articles
-        except Exception as e:
-            print(f"[ModelpressAgent] 記事収集でエラー: {e}")
-            # 本番ではダミーデータは返さず、空リストで上位に任せる
-            return []
+        return self._search_news()
+
+    def collect_stream(self) -> Iterator[Dict[str, Any]]:
+        """
+        モデルプレスから記事を1件ずつ収集（詳細を取得した記事から順に返す）
+
+        Yields:
+            収集した記事
+        """
+        yield from self._iter_news()
 
     def _search_news(self) -> List[Dict[str, Any]]:
         """
@@ -60,17 +69,22 @@ class ModelpressAgent(BaseAgent):
         Returns:
             記事のリスト
         """
+        return list(self._iter_news())
+
+    def _iter_news(self) -> Iterator[Dict[str, Any]]:
+        """
+        モデルプレスで検索し、記事を1件ずつ返す
+
+        Yields:
+            記事
+        """
         # 検索URLを構築
         # 例: https://mdpr.jp/search?type=article&keyword=諸橋沙夏
         search_url = f"{self.base_url}?type=article&keyword={quote(self.search_keyword)}"
 
         try:
             # リクエスト送信
-            response = requests.get(
-                search_url,
-                headers=self.headers,
-                timeout=15
-            )
+            response = self.http.get(search_url, headers=self.headers)
             response.raise_for_status()
 
             # HTMLをパース
@@ -79,15 +93,19 @@ class ModelpressAgent(BaseAgent):
             # 検索結果ページから記事の候補を抽出
             candidates = self._parse_articles(soup)
             if not candidates:
-                return []
+                return
 
             # 各記事ページから詳細を取得して整形
-            articles: List[Dict[str, Any]] = []
             for cand in candidates:
                 url = cand.get("url")
                 if not url:
                     continue
 
+                # 保存済みの記事は詳細を取得しない
+                if self.is_known_url(url):
+                    print(f"[ModelpressAgent] 保存済みのためスキップ: {url}")
+                    continue
+
                 # アクセスし過ぎ防止（サイト負荷軽減）
                 time.sleep(1)
 
@@ -106,18 +124,14 @@ class ModelpressAgent(BaseAgent):
 
                 thumbnail_url = cand.get("thumbnail_url") or detail.get("thumbnail_url")
 
-                articles.append(
-                    self._format_article(
-                        title=title or None,
-                        summary=content,
-                        url=url,
-                        published_at=published_at,
-                        thumbnail_url=thumbnail_url,
-                    )
+                yield self._format_article(
+                    title=title or None,
+                    summary=content,
+                    url=url,
+                    published_at=published_at,
+                    thumbnail_url=thumbnail_url,
                 )
 
-            return articles
-
         except requests.RequestException as e:
             raise Exception(f"モデルプレスへのリクエストに失敗しました: {e}")
 
@@ -205,7 +219,7 @@ class ModelpressAgent(BaseAgent):
         Returns:
             dict: {"title": str|None, "published_at": str|None, "content": str|None}
         """
-        response = requests.get(url, headers=self.headers, timeout=15)
+        response = self.http.get(url, headers=self.headers)
         response.raise_for_status()
         soup = BeautifulSoup(response.content, "html.parser")
 
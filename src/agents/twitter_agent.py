@@ -4,10 +4,11 @@ snscrapeを使用してツイートを収集する
 """
 import json
 import subprocess
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
 from datetime import datetime, timezone
 import pytz
 
+from src.utils.url_canonicalizer import canonical_key
 from .base_agent import BaseAgent
 
 
@@ -16,6 +17,9 @@ class TwitterAgent(BaseAgent):
     X（旧Twitter）から諸橋沙夏さんに関する情報を収集するAgent
     """
 
+    # 収集したアイテムの source 値
+    source = 'twitter'
+
     def __init__(self, prompt_manager, config: Dict[str, Any]):
         """
         初期化
@@ -52,6 +56,29 @@ class TwitterAgent(BaseAgent):
 
         return unique_tweets
 
+    def collect_stream(self) -> Iterator[Dict[str, Any]]:
+        """
+        Xからツイートをハッシュタグごとに収集（検索が終わったハッシュタグから順に返す）
+
+        Yields:
+            収集したツイート（URL単位で重複除去済み）
+        """
+        seen_keys = set()
+
+        for hashtag in self.hashtags:
+            try:
+                tweets = self._search_by_hashtag(hashtag)
+            except Exception as e:
+                print(f"[TwitterAgent] ハッシュタグ '{hashtag}' の検索でエラー: {e}")
+                # 1つのハッシュタグで失敗しても続行
+                continue
+
+            for tweet in tweets:
+                key = canonical_key(tweet.get('url'))
+                if key and key not in seen_keys:
+                    seen_keys.add(key)
+                    yield tweet
+
     def _search_by_hashtag(self, hashtag: str, max_results: int = 20) -> List[Dict[str, Any]]:
         """
         ハッシュタグでツイートを検索
@@ -178,7 +205,7 @@ class TwitterAgent(BaseAgent):
 
     def _remove_duplicates(self, tweets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
-        URL単位で重複を除去
+        正規化URL単位で重複を除去（twitter.com / x.com の揺れ等を吸収）
 
         Args:
             tweets: ツイートのリスト
@@ -186,13 +213,13 @@ class TwitterAgent(BaseAgent):
         Returns:
             重複除去後のツイートリスト
         """
-        seen_urls = set()
+        seen_keys = set()
         unique_tweets = []
 
         for tweet in tweets:
-            url = tweet.get('url', '')
-            if url and url not in seen_urls:
-                seen_urls.add(url)
+            key = canonical_key(tweet.get('url', ''))
+            if key and key not in seen_keys:
+                seen_keys.add(key)
                 unique_tweets.append(tweet)
 
         return unique_tweets
@@ -4,7 +4,7 @@ BeautifulSoupを使用してYahoo!ニュースから記事を収集する
 """
 import requests
 from bs4 import BeautifulSoup
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
 from datetime import datetime, timezone
 import pytz
 from urllib.parse import urljoin, quote
@@ -18,6 +18,9 @@ class YahooAgent(BaseAgent):
     Yahoo!ニュースから諸橋沙夏さんに関する記事を収集するAgent
     """
 
+    # 収集したアイテムの source 値
+    source = 'yahoo_news'
+
     def __init__(self, prompt_manager, config: Dict[str, Any]):
         """
         初期化
@@ -42,14 +45,20 @@ class YahooAgent(BaseAgent):
 
         Returns:
             収集した記事のリスト
+
+        Raises:
+            Exception: 検索ページの取得に失敗した場合（記事詳細の取得失敗はその記事のみスキップ）
         """
-        try:
-            articles = self._search_news()
-            return articles
-        except Exception as e:
-            print(f"[YahooAgent] 記事収集でエラー: {e}")
-            # 本番ではダミーデータは返さず、空リストで上位に任せる
-            return []
+        return self._search_news()
+
+    def collect_stream(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yahoo!ニュースから記事を1件ずつ収集（詳細を取得した記事から順に返す）
+
+        Yields:
+            収集した記事
+        """
+        yield from self._iter_news()
 
     def _search_news(self) -> List[Dict[str, Any]]:
         """
@@ -58,16 +67,21 @@ class YahooAgent(BaseAgent):
         Returns:
             記事のリスト
         """
+        return list(self._iter_news())
+
+    def _iter_news(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yahoo!ニュースで検索し、記事を1件ずつ返す
+
+        Yields:
+            記事
+        """
         # 検索URLを構築（キーワード検索）
         search_url = f"{self.base_url}?p={quote(self.search_keyword)}"
 
         try:
             # リクエスト送信
-            response = requests.get(
-                search_url,
-                headers=self.headers,
-                timeout=15
-            )
+            response = self.http.get(search_url, headers=self.headers)
             response.raise_for_status()
 
             # HTMLをパース
@@ -76,15 +90,19 @@ class YahooAgent(BaseAgent):
             # 検索結果ページから記事候補を抽出
             candidates = self._parse_articles(soup)
             if not candidates:
-                return []
+                return
 
             # 各記事ページから詳細を取得して整形
-            articles: List[Dict[str, Any]] = []
             for cand in candidates:
                 url = cand.get("url")
                 if not url:
                     continue
 
+                # 保存済みの記事は詳細を取得しない
+                if self.is_known_url(url):
+                    print(f"[YahooAgent] 保存済みのためスキップ: {url}")
+                    continue
+
                 # アクセスし過ぎ防止（サイト負荷軽減）
                 time.sleep(1)
 
@@ -99,18 +117,14 @@ class YahooAgent(BaseAgent):
                 content = detail.get("content") or cand.get("summary") or ""
                 source = cand.get("source") or detail.get("source") or ""
 
-                articles.append(
-                    self._format_article(
-                        title=title or None,
-                        summary=content,
-                        url=url,
-                        source=source or None,
-                        published_at=published_at,
-                    )
+                yield self._format_article(
+                    title=title or None,
+                    summary=content,
+                    url=url,
+                    source=source or None,
+                    published_at=published_at,
                 )
 
-            return articles
-
         except requests.RequestException as e:
             raise Exception(f"Yahoo!ニュースへのリクエストに失敗しました: {e}")
 
@@ -178,7 +192,7 @@ class YahooAgent(BaseAgent):
         Returns:
             dict: {\"title\", \"published_at\", \"content\", \"source\"}
         """
-        response = requests.get(url, headers=self.headers, timeout=15)
+        response = self.http.get(url, headers=self.headers)
         response.raise_for_status()
         soup = BeautifulSoup(response.content, "html.parser")
 
@@ -10,6 +10,8 @@ from sqlalchemy.pool import StaticPool
 from dotenv import load_dotenv
 
 from .models import Base
+from .migrations import run_migrations
+from .search import drop_search_index
 
 # Load environment variables
 load_dotenv()
@@ -92,10 +94,15 @@ class DatabaseManager:
         Base.metadata.create_all(bind=self.engine)
         print(f"テーブルを作成しました（DB Type: {self.db_type}）")
 
+        # 既存テーブルへの追加カラム等を反映
+        for description in run_migrations(self.engine):
+            print(f"マイグレーション: {description}")
+
     def drop_tables(self):
         """
         全テーブルを削除（注意: 本番環境では使用しないこと）
         """
+        drop_search_index(self.engine)
         Base.metadata.drop_all(bind=self.engine)
         print(f"テーブルを削除しました（DB Type: {self.db_type}）")
 
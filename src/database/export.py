@@ -0,0 +1,119 @@
+"""
+Bulk export of items for the Natsu Agent database.
+
+Exports stream every item matching the dashboard filters as NDJSON or CSV.
+Rows are read in batches with yield_per (a server-side cursor on
+PostgreSQL) and formatted one line at a time, so memory stays flat no
+matter how many rows match. Used by GET /api/items/export and
+scripts/export_items.py.
+"""
+import csv
+import io
+from datetime import datetime
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from src.database.queries import ITEM_DICT_FIELDS, build_item_query, order_items, project_items, row_to_dict
+from src.utils.json_serializer import dumps
+
+# 出力形式と Content-Type
+EXPORT_FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv',
+}
+
+# 1回に読み込む行数
+EXPORT_BATCH_SIZE = 500
+
+# 項目の指定がない場合に出力する項目（Item.to_dict と同じ）
+DEFAULT_EXPORT_FIELDS = ITEM_DICT_FIELDS
+
+
+def iter_item_rows(session, filters: Dict[str, str], fields: Optional[Tuple[str, ...]] = None,
+                   batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[Dict[str, Any]]:
+    """
+    フィルタ条件に一致するアイテムを一覧の並び順で1件ずつ返す
+
+    Args:
+        session: DBセッション（出力が終わるまで閉じないこと）
+        filters: build_item_query の引数（period, importance, category, keyword）
+        fields: 出力する項目（Noneの場合は DEFAULT_EXPORT_FIELDS）
+        batch_size: 1回に読み込む行数
+
+    Returns:
+        アイテムの辞書のイテレータ
+    """
+    fields = fields or DEFAULT_EXPORT_FIELDS
+    query = project_items(order_items(build_item_query(session, **filters)), fields)
+    # yield_per は PostgreSQL ではサーバーサイドカーソルで読み、結果全体をメモリに載せない
+    for row in query.yield_per(batch_size):
+        yield row_to_dict(row, fields)
+
+
+def format_rows(rows: Iterator[Dict[str, Any]], export_format: str,
+                fields: Optional[Tuple[str, ...]] = None) -> Iterator[str]:
+    """
+    アイテムの辞書を出力形式の行に変換
+
+    Args:
+        rows: iter_item_rows の結果
+        export_format: 出力形式（ndjson, csv）
+        fields: 出力する項目（CSVのヘッダー。Noneの場合は DEFAULT_EXPORT_FIELDS）
+
+    Returns:
+        出力する文字列のイテレータ（1件ごと。CSVは先頭にヘッダー行）
+    """
+    if export_format == 'ndjson':
+        for row in rows:
+            yield dumps(row) + '\n'
+        return
+
+    fields = fields or DEFAULT_EXPORT_FIELDS
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def flush():
+        line = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return line
+
+    writer.writerow(fields)
+    yield flush()
+    for row in rows:
+        writer.writerow([_csv_value(row[field]) for field in fields])
+        yield flush()
+
+
+def _csv_value(value):
+    """
+    CSVのセルの値（日時はISO 8601、metrics 等の構造を持つ値はJSON文字列）
+    """
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (dict, list)):
+        return dumps(value)
+    return value
+
+
+def buffer_chunks(lines: Iterator[str], chunk_size: int = 64 * 1024) -> Iterator[str]:
+    """
+    行をまとめて一定の大きさごとに返す（1行ずつ送信すると書き込み回数が増えるため）
+
+    Args:
+        lines: format_rows の結果
+        chunk_size: まとめる文字数の目安
+
+    Returns:
+        まとめた文字列のイテレータ
+    """
+    chunk = []
+    size = 0
+    for line in lines:
+        chunk.append(line)
+        size += len(line)
+        if size >= chunk_size:
+            yield ''.join(chunk)
+            chunk = []
+            size = 0
+    if chunk:
+        yield ''.join(chunk)
@@ -0,0 +1,51 @@
+"""
+Data generation counters for the Natsu Agent database.
+
+Writers bump a named generation inside the same transaction that changes
+the data, and readers key their caches on the current value. Because the
+counter lives in the database, caches in the web process are invalidated
+by writes from worker processes and scripts as well.
+"""
+from datetime import datetime
+
+import pytz
+
+from src.database.models import DataGeneration
+
+# アイテム（items）の世代
+ITEMS = 'items'
+
+# 実行記録（executions）の世代
+EXECUTIONS = 'executions'
+
+
+def bump_generation(session, name: str):
+    """
+    世代番号を進める（コミットは呼び出し側のトランザクションで行う）
+
+    Args:
+        session: DBセッション
+        name: 対象
+    """
+    now = datetime.now(pytz.timezone('Asia/Tokyo'))
+    updated = session.query(DataGeneration).filter_by(name=name).update(
+        {DataGeneration.generation: DataGeneration.generation + 1, DataGeneration.updated_at: now},
+        synchronize_session=False
+    )
+    if not updated:
+        session.add(DataGeneration(name=name, generation=1, updated_at=now))
+
+
+def get_generation(session, name: str) -> int:
+    """
+    現在の世代番号を取得
+
+    Args:
+        session: DBセッション
+        name: 対象
+
+    Returns:
+        世代番号（まだ書き込まれていない場合は0）
+    """
+    row = session.query(DataGeneration.generation).filter_by(name=name).first()
+    return row[0] if row else 0
@@ -0,0 +1,210 @@
+"""
+Schema migrations for the Natsu Agent database.
+
+Base.metadata.create_all() only creates missing tables, so columns and
+indexes added to existing tables are applied here. Every migration is
+idempotent and safe to run on each init_database.py invocation.
+"""
+from sqlalchemy import inspect, text
+
+from src.utils.url_canonicalizer import canonical_key
+from src.database.search import create_search_index
+
+# (テーブル名, カラム名, カラム定義DDL)
+ADDED_COLUMNS = [
+    ('items', 'judge_tier', 'VARCHAR(20)'),
+    ('items', 'cluster_id', 'VARCHAR(40)'),
+    ('items', 'canonical_key', 'VARCHAR(64)'),
+    ('items', 'simhash', 'VARCHAR(16)'),
+]
+
+# 一覧の並び順（src/database/queries.py の order_items。スコアがNULLの行は -1 として並べる）
+ITEM_RANK_COLUMNS = 'coalesce(importance_score, -1) DESC, published_at DESC, id DESC'
+
+# (インデックス名, テーブル名, カラム定義, ユニークか)
+ADDED_INDEXES = [
+    ('idx_cluster', 'items', 'cluster_id', False),
+    ('uq_items_canonical_key', 'items', 'canonical_key', True),
+    ('idx_items_score_rank', 'items', ITEM_RANK_COLUMNS, False),
+    ('idx_items_level_score_rank', 'items', f'importance_level, {ITEM_RANK_COLUMNS}', False),
+    ('idx_items_category_score_rank', 'items', f'category, {ITEM_RANK_COLUMNS}', False),
+]
+
+# 並び順の変更で使われなくなったインデックス: (インデックス名, テーブル名)
+# （importance_score をそのまま並べていた頃のもの。NULLの行がカーソルで読めなかった）
+DROPPED_INDEXES = [
+    ('idx_items_rank', 'items'),
+    ('idx_items_level_rank', 'items'),
+    ('idx_items_category_rank', 'items'),
+    ('idx_items_rank_high', 'items'),
+    ('idx_items_rank_medium_up', 'items'),
+]
+
+# PostgreSQLのみ作成する部分インデックス: (インデックス名, テーブル名, カラム定義, 条件)
+# 重要度フィルタ（high / medium_up）付きの一覧を並べ替えなしで読む
+# （SQLiteはバインド変数の条件では部分インデックスを使わないため作成しない）
+POSTGRESQL_PARTIAL_INDEXES = [
+    ('idx_items_score_rank_high', 'items', ITEM_RANK_COLUMNS, "importance_level = 'high'"),
+    ('idx_items_score_rank_medium_up', 'items', ITEM_RANK_COLUMNS, "importance_level IN ('high', 'medium')"),
+]
+
+
+def run_migrations(engine):
+    """
+    既存のDBに対してマイグレーションを適用
+
+    Args:
+        engine: SQLAlchemyエンジン
+
+    Returns:
+        適用したマイグレーションの説明リスト
+    """
+    applied = []
+    applied.extend(_add_missing_columns(engine))
+    applied.extend(_backfill_canonical_keys(engine))
+    applied.extend(_drop_obsolete_indexes(engine))
+    applied.extend(_add_missing_indexes(engine))
+    if 'items' in inspect(engine).get_table_names():
+        applied.extend(create_search_index(engine))
+    return applied
+
+
+def _add_missing_columns(engine):
+    """
+    モデルに追加されたカラムを既存テーブルに追加
+    """
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    applied = []
+
+    with engine.begin() as conn:
+        for table, column, ddl in ADDED_COLUMNS:
+            if table not in existing_tables:
+                continue
+            columns = {c['name'] for c in inspector.get_columns(table)}
+            if column in columns:
+                continue
+            conn.execute(text(f'ALTER TABLE {table} ADD COLUMN {column} {ddl}'))
+            applied.append(f'{table}.{column} を追加')
+
+    return applied
+
+
+def _backfill_canonical_keys(engine):
+    """
+    既存アイテムの canonical_key を現在の正規化ルールで設定
+
+    未設定の行に加え、正規化ルールの変更（トラッキング用パラメータの見直し等）でキーが変わった行も更新する。
+    正規化すると同じURLになる既存の重複行は、最も古い行にのみキーを設定する
+    （ユニークインデックスを作成できるように他の行はNULLのまま残す）。
+    """
+    if 'items' not in inspect(engine).get_table_names():
+        return []
+
+    with engine.begin() as conn:
+        rows = conn.execute(
+            text('SELECT id, url, canonical_key FROM items ORDER BY id')
+        ).fetchall()
+
+        taken = set()
+        changes = {}
+        duplicates = 0
+        for item_id, url, current in rows:
+            key = canonical_key(url) or None
+            if key in taken:
+                key = None
+            if key:
+                taken.add(key)
+            else:
+                duplicates += 1
+            if key != current:
+                changes[item_id] = key
+
+        # 入れ替わるキーがユニークインデックスに違反しないよう、先に変更する行のキーを外す
+        for item_id in changes:
+            conn.execute(text('UPDATE items SET canonical_key = NULL WHERE id = :id'), {'id': item_id})
+        updated = 0
+        for item_id, key in changes.items():
+            if key is None:
+                continue
+            conn.execute(
+                text('UPDATE items SET canonical_key = :key WHERE id = :id'),
+                {'key': key, 'id': item_id}
+            )
+            updated += 1
+
+    applied = []
+    if updated:
+        applied.append(f'items.canonical_key を {updated} 件に設定')
+    if duplicates and changes:
+        applied.append(f'正規化URLが重複する既存アイテム {duplicates} 件はキー未設定のまま残しました')
+    return applied
+
+
+def _drop_obsolete_indexes(engine):
+    """
+    使われなくなったインデックスを削除
+    """
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    applied = []
+
+    with engine.begin() as conn:
+        for name, table in DROPPED_INDEXES:
+            if table not in existing_tables:
+                continue
+            if name not in _index_names(conn, inspector, table):
+                continue
+            conn.execute(text(f'DROP INDEX {name}'))
+            applied.append(f'インデックス {name} を削除')
+
+    return applied
+
+
+def _index_names(conn, inspector, table):
+    """
+    テーブルのインデックス名の集合
+    （SQLiteのリフレクションは式インデックスを返さないため sqlite_master から取得する）
+    """
+    if conn.dialect.name == 'sqlite':
+        rows = conn.execute(
+            text("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = :table"),
+            {'table': table}
+        )
+        return {row[0] for row in rows}
+    return {index['name'] for index in inspector.get_indexes(table)}
+
+
+def _add_missing_indexes(engine):
+    """
+    モデルに追加されたインデックスを既存テーブルに作成
+    """
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    applied = []
+
+    with engine.begin() as conn:
+        for name, table, columns, unique in ADDED_INDEXES:
+            if table not in existing_tables:
+                continue
+            if name in _index_names(conn, inspector, table):
+                continue
+            create = 'CREATE UNIQUE INDEX' if unique else 'CREATE INDEX'
+            conn.execute(text(f'{create} {name} ON {table} ({columns})'))
+            applied.append(f'インデックス {name} を作成')
+
+        if engine.dialect.name == 'postgresql':
+            for name, table, columns, where in POSTGRESQL_PARTIAL_INDEXES:
+                if table not in existing_tables:
+                    continue
+                if name in _index_names(conn, inspector, table):
+                    continue
+                conn.execute(text(f'CREATE INDEX {name} ON {table} ({columns}) WHERE {where}'))
+                applied.append(f'インデックス {name} を作成')
+
+        # 新しいインデックスを使う実行計画を選べるよう統計情報を更新
+        if applied:
+            conn.execute(text('ANALYZE'))
+            applied.append('統計情報を更新（ANALYZE）')
+
+    return applied
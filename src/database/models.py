@@ -4,13 +4,17 @@ SQLAlchemy models for the Natsu Agent database.
 from datetime import datetime
 from sqlalchemy import (
     Column, Integer, String, Text, TIMESTAMP,
-    DECIMAL, JSON, UniqueConstraint, Index
+    DECIMAL, JSON, Boolean, UniqueConstraint, Index
 )
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, literal_column
 
 Base = declarative_base()
 
+# 一覧の並び順で importance_score が NULL の行（判定前の既存データ等）に使うスコア（最後に並ぶ）
+# インデックスの式と一致させるため、バインド変数ではなくリテラルにする
+UNSCORED_RANK = literal_column('-1')
+
 
 class Item(Base):
     """
@@ -24,16 +28,20 @@ class Item(Base):
     title = Column(Text)  # タイトル
     content = Column(Text)  # 本文
     summary = Column(String(100))  # Claude生成要約（50文字）
-    url = Column(Text, nullable=False, unique=True)  # 情報URL（重複チェック用）
+    url = Column(Text, nullable=False, unique=True)  # 情報URL
+    canonical_key = Column(String(64))  # 正規化URLのハッシュ（重複チェック用）
     published_at = Column(TIMESTAMP(timezone=True), nullable=False)  # 公開日時
     relevance_score = Column(Integer)  # 関連性スコア（0-100）
     importance_score = Column(Integer)  # 重要度スコア（0-100）
     importance_level = Column(String(20))  # 重要度レベル（high/medium/low）
     category = Column(String(100))  # カテゴリ
     claude_reason = Column(Text)  # 判定理由
+    judge_tier = Column(String(20))  # 判定したティア（fast/strong）
     metrics = Column(JSON)  # メトリクス（いいね数等）
     collected_at = Column(TIMESTAMP(timezone=True), server_default=func.now())  # 収集日時
     execution_id = Column(String(50))  # 実行ID
+    cluster_id = Column(String(40))  # 近似重複クラスタID（単独のアイテムはNULL）
+    simhash = Column(String(16))  # SimHash（16進数。後から収集した近似重複の照合用）
 
     # インデックス
     __table_args__ = (
@@ -41,6 +49,16 @@ class Item(Base):
         Index('idx_importance', 'importance_score'),
         Index('idx_category', 'category'),
         Index('idx_execution', 'execution_id'),
+        Index('idx_cluster', 'cluster_id'),
+        Index('uq_items_canonical_key', 'canonical_key', unique=True),
+        # 一覧の並び順（重要度スコア降順 -> 公開日時降順 -> ID降順）のまま読めるインデックス
+        # （PostgreSQLでは重要度別の部分インデックスも作成する: migrations.POSTGRESQL_PARTIAL_INDEXES）
+        Index('idx_items_score_rank',
+              func.coalesce(importance_score, UNSCORED_RANK).desc(), published_at.desc(), id.desc()),
+        Index('idx_items_level_score_rank', 'importance_level',
+              func.coalesce(importance_score, UNSCORED_RANK).desc(), published_at.desc(), id.desc()),
+        Index('idx_items_category_score_rank', 'category',
+              func.coalesce(importance_score, UNSCORED_RANK).desc(), published_at.desc(), id.desc()),
     )
 
     def __repr__(self):
@@ -62,9 +80,12 @@ class Item(Base):
             'importance_level': self.importance_level,
             'category': self.category,
             'claude_reason': self.claude_reason,
+            'judge_tier': self.judge_tier,
             'metrics': self.metrics,
             'collected_at': self.collected_at.isoformat() if self.collected_at else None,
             'execution_id': self.execution_id,
+            'cluster_id': self.cluster_id,
+            'simhash': self.simhash,
         }
 
 
@@ -77,7 +98,7 @@ class Execution(Base):
     id = Column(String(50), primary_key=True)  # 実行ID（exec_YYYYMMDD_HHMMSS）
     started_at = Column(TIMESTAMP(timezone=True), nullable=False)  # 開始日時
     completed_at = Column(TIMESTAMP(timezone=True))  # 完了日時
-    status = Column(String(20), nullable=False)  # ステータス（running/success/failed）
+    status = Column(String(20), nullable=False)  # ステータス（running/success/partial/failed）
     total_collected = Column(Integer, default=0)  # 収集総数
     total_saved = Column(Integer, default=0)  # 保存総数
     error_message = Column(Text)  # エラーメッセージ
@@ -107,3 +128,182 @@ class Execution(Base):
             'claude_processed': self.claude_processed,
             'claude_duration_sec': float(self.claude_duration_sec) if self.claude_duration_sec else None,
         }
+
+
+class Judgment(Base):
+    """
+    Judgmentsテーブル: 判定結果の履歴を格納（フィルタで除外されたものも含む）
+    ローカル分類器の学習データとして使用する
+    """
+    __tablename__ = 'judgments'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    execution_id = Column(String(50))  # 実行ID
+    url = Column(Text, nullable=False)  # 情報URL
+    source = Column(String(50))  # ソース
+    title = Column(Text)  # タイトル
+    content = Column(Text)  # 本文
+    relevance_score = Column(Integer)  # 関連性スコア（0-100）
+    importance_score = Column(Integer)  # 重要度スコア（0-100）
+    importance_level = Column(String(20))  # 重要度レベル（high/medium/low）
+    category = Column(String(100))  # カテゴリ
+    judge_tier = Column(String(20))  # 判定したティア（local/fast/strong）
+    passed = Column(Boolean, nullable=False, default=False)  # フィルタを通過したか
+    judged_at = Column(TIMESTAMP(timezone=True), server_default=func.now())  # 判定日時
+
+    # インデックス
+    __table_args__ = (
+        Index('idx_judgments_execution', 'execution_id'),
+        Index('idx_judgments_judged_at', 'judged_at'),
+    )
+
+    def __repr__(self):
+        return f"<Judgment(id={self.id}, url={self.url}, passed={self.passed})>"
+
+
+class ExecutionCheckpoint(Base):
+    """
+    Execution Checkpointsテーブル: 実行途中の各段階の出力を格納
+    判定・保存に失敗した実行を、完了済みの段階から再開するために使用する
+    """
+    __tablename__ = 'execution_checkpoints'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    execution_id = Column(String(50), nullable=False)  # 実行ID
+    stage = Column(String(20), nullable=False)  # 段階（collected/judged）
+    payload = Column(JSON, nullable=False)  # 段階の出力（アイテムリスト・集計結果）
+    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())  # 作成日時
+
+    # 制約
+    __table_args__ = (
+        UniqueConstraint('execution_id', 'stage', name='uq_checkpoint_execution_stage'),
+    )
+
+    def __repr__(self):
+        return f"<ExecutionCheckpoint(execution_id={self.execution_id}, stage={self.stage})>"
+
+
+class SourceHealth(Base):
+    """
+    Source Healthテーブル: 情報ソースごとのサーキットブレーカーの状態を格納
+    実行をまたいで連続失敗を記録し、失敗が続くソースを一定時間スキップする
+    """
+    __tablename__ = 'source_health'
+
+    source = Column(String(50), primary_key=True)  # ソース（Agent名）
+    state = Column(String(20), nullable=False, default='closed')  # 状態（closed/open/half_open）
+    consecutive_failures = Column(Integer, nullable=False, default=0)  # 連続失敗回数
+    opened_at = Column(TIMESTAMP(timezone=True))  # スキップを開始した日時
+    last_failure_at = Column(TIMESTAMP(timezone=True))  # 最終失敗日時
+    last_success_at = Column(TIMESTAMP(timezone=True))  # 最終成功日時
+    last_error = Column(Text)  # 最後のエラーメッセージ
+
+    def __repr__(self):
+        return f"<SourceHealth(source={self.source}, state={self.state}, failures={self.consecutive_failures})>"
+
+    def to_dict(self):
+        """モデルを辞書形式に変換"""
+        return {
+            'source': self.source,
+            'state': self.state,
+            'consecutive_failures': self.consecutive_failures,
+            'opened_at': self.opened_at.isoformat() if self.opened_at else None,
+            'last_failure_at': self.last_failure_at.isoformat() if self.last_failure_at else None,
+            'last_success_at': self.last_success_at.isoformat() if self.last_success_at else None,
+            'last_error': self.last_error,
+        }
+
+
+class ExecutionJob(Base):
+    """
+    Execution Jobsテーブル: Web APIから依頼された実行のジョブキュー
+    ワーカープロセス（scripts/run_worker.py）が取り出して実行する
+    """
+    __tablename__ = 'execution_jobs'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    kind = Column(String(20), nullable=False)  # 種類（execute/resume）
+    execution_id = Column(String(50), nullable=False)  # 実行ID
+    params = Column(JSON)  # 実行パラメータ（stream等）
+    status = Column(String(20), nullable=False, default='queued')  # ステータス（queued/running/done/failed）
+    active_slot = Column(String(20))  # 待機中・実行中のみ値を持つ（同時に1件だけにするためのユニーク列）
+    worker_id = Column(String(100))  # 実行したワーカー
+    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())  # 登録日時
+    claimed_at = Column(TIMESTAMP(timezone=True))  # 実行開始日時
+    heartbeat_at = Column(TIMESTAMP(timezone=True))  # ワーカーの最終応答日時
+    finished_at = Column(TIMESTAMP(timezone=True))  # 終了日時
+    error_message = Column(Text)  # エラーメッセージ
+
+    # インデックス・制約
+    __table_args__ = (
+        UniqueConstraint('active_slot', name='uq_execution_jobs_active_slot'),
+        Index('idx_execution_jobs_status', 'status', 'id'),
+    )
+
+    def __repr__(self):
+        return f"<ExecutionJob(id={self.id}, kind={self.kind}, execution_id={self.execution_id}, status={self.status})>"
+
+    def to_dict(self):
+        """モデルを辞書形式に変換"""
+        return {
+            'id': self.id,
+            'kind': self.kind,
+            'execution_id': self.execution_id,
+            'params': self.params or {},
+            'status': self.status,
+            'worker_id': self.worker_id,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'claimed_at': self.claimed_at.isoformat() if self.claimed_at else None,
+            'heartbeat_at': self.heartbeat_at.isoformat() if self.heartbeat_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None,
+            'error_message': self.error_message,
+        }
+
+
+class ExecutionEvent(Base):
+    """
+    Execution Eventsテーブル: 実行の進捗イベントを格納
+    Webプロセスが監視し、GET /api/events（Server-Sent Events）でクライアントに配信する
+    """
+    __tablename__ = 'execution_events'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)  # イベントID（SSEの id）
+    execution_id = Column(String(50), nullable=False)  # 実行ID
+    event_type = Column(String(30), nullable=False)  # 種類（agent_finished/saved/execution_finished 等）
+    data = Column(JSON)  # イベントの内容
+    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())  # 記録日時
+
+    # インデックス
+    __table_args__ = (
+        Index('idx_execution_events_created_at', 'created_at'),
+        # 削除後もIDを再利用しない（クライアントの Last-Event-ID と食い違わないようにする）
+        {'sqlite_autoincrement': True},
+    )
+
+    def __repr__(self):
+        return f"<ExecutionEvent(id={self.id}, execution_id={self.execution_id}, event_type={self.event_type})>"
+
+    def to_dict(self):
+        """モデルを辞書形式に変換"""
+        return {
+            'id': self.id,
+            'execution_id': self.execution_id,
+            'event_type': self.event_type,
+            'data': self.data or {},
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+        }
+
+
+class DataGeneration(Base):
+    """
+    Data Generationsテーブル: データの世代番号を格納
+    アイテム等を書き込むたびに世代番号を進め、件数等のキャッシュを無効化する（プロセス間で共有する）
+    """
+    __tablename__ = 'data_generations'
+
+    name = Column(String(50), primary_key=True)  # 対象（items 等）
+    generation = Column(Integer, nullable=False, default=0)  # 世代番号
+    updated_at = Column(TIMESTAMP(timezone=True))  # 更新日時
+
+    def __repr__(self):
+        return f"<DataGeneration(name={self.name}, generation={self.generation})>"
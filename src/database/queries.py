@@ -0,0 +1,322 @@
+"""
+Shared item queries for the Natsu Agent database.
+
+The dashboard filters (period / importance / category / keyword) and the
+list ordering are built here (keyword search itself lives in search.py) so that every reader of the items table
+applies them the same way. Pages are fetched with keyset (cursor)
+pagination on (importance_score, published_at, id), which costs the same
+at any depth and does not shift when new items are inserted. Items without
+an importance_score (rows saved before judging was recorded) rank as -1,
+so they sort last on every backend and stay reachable through the cursor.
+
+List responses can be limited to a set of fields; only those columns are
+read, and the article body is replaced by a snippet cut on the database
+side, so long articles are not transferred for the list view.
+
+Total counts are the expensive part of a list request, so they are only
+computed on demand and cached per filter combination until the items
+generation changes (see generations.py).
+"""
+import base64
+import json
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import pytz
+from sqlalchemy import and_, desc, func, or_
+
+from src.database.models import Item, UNSCORED_RANK
+from src.database.search import apply_keyword_filter
+
+# 1ページあたり件数の上限
+MAX_PER_PAGE = 100
+
+# 期間フィルタの値と遡る期間
+PERIODS = {
+    '24h': timedelta(hours=24),
+    '7d': timedelta(days=7),
+    '30d': timedelta(days=30),
+}
+
+# 本文の抜粋（content_snippet）の文字数
+SNIPPET_LENGTH = 120
+
+# fields で指定できる項目（Item.to_dict の項目と本文の抜粋）
+ITEM_FIELDS = (
+    'id', 'source', 'source_detail', 'title', 'content', 'content_snippet', 'summary', 'url',
+    'published_at', 'relevance_score', 'importance_score', 'importance_level', 'category',
+    'claude_reason', 'judge_tier', 'metrics', 'collected_at', 'execution_id', 'cluster_id',
+)
+
+# Item.to_dict と同じ項目（fields の指定がない場合）
+ITEM_DICT_FIELDS = tuple(field for field in ITEM_FIELDS if field != 'content_snippet')
+
+# 次ページのカーソルの作成に必要な項目（指定がなくても読み込む）
+CURSOR_FIELDS = ('id', 'published_at', 'importance_score')
+
+
+def build_item_query(session, period: str = '7d', importance: str = 'all',
+                     category: str = 'all', keyword: str = ''):
+    """
+    フィルタ条件を適用したアイテムのクエリを作成（並び順は含まない）
+
+    Args:
+        session: DBセッション
+        period: 期間（24h, 7d, 30d, all）
+        importance: 重要度（all, high, medium_up）
+        category: カテゴリ（all, またはカテゴリ名）
+        keyword: キーワード
+
+    Returns:
+        SQLAlchemyのクエリ
+    """
+    query = session.query(Item)
+
+    # 期間フィルタ
+    if period in PERIODS:
+        cutoff = datetime.now(pytz.timezone('Asia/Tokyo')) - PERIODS[period]
+        query = query.filter(Item.published_at >= cutoff)
+
+    # 重要度フィルタ
+    if importance == 'high':
+        query = query.filter(Item.importance_level == 'high')
+    elif importance == 'medium_up':
+        query = query.filter(Item.importance_level.in_(['high', 'medium']))
+
+    # カテゴリフィルタ
+    if category != 'all':
+        query = query.filter(Item.category == category)
+
+    # キーワード検索（全文検索インデックスを使う。search.py を参照）
+    if keyword:
+        query = apply_keyword_filter(query, session, keyword)
+
+    return query
+
+
+def rank_score():
+    """
+    並び順に使う重要度スコアの式（NULLは -1。models の一覧用インデックスと同じ式）
+    """
+    return func.coalesce(Item.importance_score, UNSCORED_RANK)
+
+
+def order_items(query):
+    """
+    一覧の並び順を適用: 重要度スコア降順 -> 公開日時降順 -> ID降順（同順位の並びを固定する）
+    """
+    return query.order_by(
+        desc(rank_score()),
+        desc(Item.published_at),
+        desc(Item.id)
+    )
+
+
+def parse_fields(value: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """
+    fields パラメータ（カンマ区切り）を項目のタプルにする
+
+    Args:
+        value: fields パラメータの値
+
+    Returns:
+        ITEM_FIELDS の順に並べた項目のタプル（指定がない場合はNone = 全項目）
+
+    Raises:
+        ValueError: 存在しない項目が指定された場合
+    """
+    if not value:
+        return None
+
+    requested = {field.strip() for field in value.split(',') if field.strip()}
+    unknown = requested - set(ITEM_FIELDS)
+    if unknown:
+        raise ValueError(f"fields に指定できない項目です: {', '.join(sorted(unknown))}")
+    return tuple(field for field in ITEM_FIELDS if field in requested)
+
+
+def project_items(query, fields: Tuple[str, ...]):
+    """
+    指定した項目のカラムだけを読むクエリにする（本文等の大きなカラムを読まずに済む）
+
+    Args:
+        query: アイテムのクエリ
+        fields: parse_fields で作成した項目
+
+    Returns:
+        SQLAlchemyのクエリ（結果は項目名を属性に持つ行）
+    """
+    needed = set(fields) | set(CURSOR_FIELDS)
+    return query.with_entities(*[
+        _field_column(field).label(field) for field in ITEM_FIELDS if field in needed
+    ])
+
+
+def row_to_dict(row, fields: Tuple[str, ...]) -> Dict[str, Any]:
+    """
+    project_items の結果の行を辞書に変換
+
+    日時は datetime のまま返す（JSONへの変換時に Item.to_dict と同じ ISO 8601 形式になる。
+    src/utils/json_serializer.py を参照）。
+
+    Args:
+        row: 結果の行
+        fields: parse_fields で作成した項目
+
+    Returns:
+        指定した項目だけの辞書
+    """
+    mapping = row._mapping
+    return {field: mapping[field] for field in fields}
+
+
+def _field_column(field: str):
+    """
+    項目に対応するカラム（本文の抜粋はDB側で切り出し、本文全体を転送しない）
+    """
+    if field == 'content_snippet':
+        return func.substr(Item.content, 1, SNIPPET_LENGTH)
+    return getattr(Item, field)
+
+
+def encode_cursor(item: Item) -> str:
+    """
+    アイテムの並び順の位置を、次ページを取得するためのカーソル文字列にする
+
+    Args:
+        item: ページの最後のアイテム（project_items の結果の行でもよい）
+
+    Returns:
+        カーソル（URLセーフなBase64）
+    """
+    score = item.importance_score if item.importance_score is not None else -1
+    position = [score, item.published_at.isoformat(), item.id]
+    raw = json.dumps(position, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """
+    カーソル文字列を並び順の位置に戻す
+
+    Args:
+        cursor: encode_cursor で作成したカーソル
+
+    Returns:
+        {"importance_score", "published_at", "id"}
+
+    Raises:
+        ValueError: カーソルが不正な場合
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        score, published_at, item_id = json.loads(base64.urlsafe_b64decode(padded))
+        return {
+            'importance_score': -1 if score is None else int(score),
+            'published_at': datetime.fromisoformat(published_at),
+            'id': int(item_id),
+        }
+    except Exception:
+        raise ValueError(f"不正なカーソルです: {cursor}")
+
+
+def apply_cursor(query, cursor: Optional[str]):
+    """
+    カーソルの位置より後（order_items の並び順で）のアイテムに絞り込む
+
+    importance_score が NULL の行は order_items と同じく -1 として扱う。
+
+    Args:
+        query: build_item_query で作成したクエリ
+        cursor: 前ページの next_cursor（Noneの場合は先頭から）
+
+    Returns:
+        SQLAlchemyのクエリ
+
+    Raises:
+        ValueError: カーソルが不正な場合
+    """
+    if not cursor:
+        return query
+
+    position = decode_cursor(cursor)
+    score = position['importance_score']
+    published_at = position['published_at']
+
+    # (score, published_at, id) < (カーソルの位置) を降順の並びで表す
+    # 先頭の rank_score() <= score はインデックスの範囲検索に使われ、並び順を保ったまま読める
+    # （ORだけで書くとSQLiteが条件ごとに別々に検索し、並べ替えが必要になる）
+    return query.filter(
+        rank_score() <= score,
+        or_(
+            rank_score() < score,
+            Item.published_at < published_at,
+            and_(Item.published_at == published_at, Item.id < position['id'])
+        )
+    )
+
+
+class ItemCountCache:
+    """
+    フィルタ条件ごとの総件数のキャッシュ（アイテムの世代が変わるまで有効、LRUで件数を制限）
+
+    期間フィルタの件数は書き込みがなくても時間の経過で変わるため、ttl_sec で期限を設ける。
+    """
+
+    def __init__(self, max_entries: int = 256, ttl_sec: float = 300):
+        """
+        初期化
+
+        Args:
+            max_entries: 保持するフィルタ条件の数の上限
+            ttl_sec: キャッシュの有効期間（秒）
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl_sec
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, filters: Tuple, generation: int) -> Optional[int]:
+        """
+        キャッシュ済みの総件数を取得
+
+        Args:
+            filters: フィルタ条件（period, importance, category, keyword）
+            generation: 現在のアイテムの世代
+
+        Returns:
+            総件数（キャッシュがない・世代が古い場合はNone）
+        """
+        with self._lock:
+            entry = self._entries.get(filters)
+            if entry is None or entry[0] != generation or time.monotonic() - entry[2] > self.ttl:
+                return None
+            self._entries.move_to_end(filters)
+            return entry[1]
+
+    def get_or_compute(self, filters: Tuple, generation: int, compute: Callable[[], int]) -> int:
+        """
+        総件数を取得（キャッシュがなければ計算して保存）
+
+        Args:
+            filters: フィルタ条件（period, importance, category, keyword）
+            generation: 現在のアイテムの世代
+            compute: 総件数を計算する関数
+
+        Returns:
+            総件数
+        """
+        total = self.get(filters, generation)
+        if total is not None:
+            return total
+
+        total = compute()
+        with self._lock:
+            self._entries[filters] = (generation, total, time.monotonic())
+            self._entries.move_to_end(filters)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return total
@@ -0,0 +1,242 @@
+"""
+Keyword search over items for the Natsu Agent database.
+
+The keyword filter of the dashboard used OR-ed LIKE '%kw%' conditions on
+title / content / summary, which always read the whole table. Searches
+now go through a full-text index that works for Japanese (no word
+boundaries) by indexing character trigrams:
+
+- SQLite: an FTS5 virtual table (items_fts, tokenize='trigram') that
+  uses items as its external content and is kept in sync by triggers,
+  so every writer (_save_to_database, batch_judge.py, ...) updates it in
+  the same transaction. Ranking uses bm25.
+- PostgreSQL: a pg_trgm GIN index on the concatenated text columns,
+  which serves ILIKE '%kw%'. Ranking uses word_similarity.
+
+Trigrams need at least 3 characters, so shorter terms (common in
+Japanese, e.g. two-kanji words) fall back to LIKE for that term. When
+the index has not been created yet the filter falls back to LIKE too.
+
+The keyword is split on whitespace and an item must contain every term
+(the old filter matched the whole keyword, spaces included, as one
+substring). Every item the old filter found still matches; items with
+the terms apart or in another order now match as well.
+"""
+import weakref
+
+from sqlalchemy import column, desc, func, literal, or_, select, table, text
+
+from src.database.models import Item
+
+# トライグラムで検索できる最小の文字数（これより短い語はLIKEで検索する）
+MIN_TRIGRAM_LENGTH = 3
+
+# SQLite: items を外部コンテンツとするFTS5テーブルと、items への書き込みを反映するトリガー
+SQLITE_FTS_TABLE = 'items_fts'
+SQLITE_FTS_DDL = [
+    f"CREATE VIRTUAL TABLE {SQLITE_FTS_TABLE} USING fts5("
+    "title, content, summary, content='items', content_rowid='id', tokenize='trigram')",
+    f"CREATE TRIGGER {SQLITE_FTS_TABLE}_ai AFTER INSERT ON items BEGIN "
+    f"INSERT INTO {SQLITE_FTS_TABLE}(rowid, title, content, summary) "
+    "VALUES (new.id, new.title, new.content, new.summary); END",
+    f"CREATE TRIGGER {SQLITE_FTS_TABLE}_ad AFTER DELETE ON items BEGIN "
+    f"INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, title, content, summary) "
+    "VALUES ('delete', old.id, old.title, old.content, old.summary); END",
+    f"CREATE TRIGGER {SQLITE_FTS_TABLE}_au AFTER UPDATE OF title, content, summary ON items BEGIN "
+    f"INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, title, content, summary) "
+    "VALUES ('delete', old.id, old.title, old.content, old.summary); "
+    f"INSERT INTO {SQLITE_FTS_TABLE}(rowid, title, content, summary) "
+    "VALUES (new.id, new.title, new.content, new.summary); END",
+    # 既存のアイテムを索引に登録
+    f"INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}) VALUES ('rebuild')",
+]
+
+# PostgreSQL: 検索対象のカラムを連結した式のトライグラムインデックス
+# （クエリ側の search_document() と同じ式にすること）
+POSTGRESQL_SEARCH_INDEX = 'idx_items_search_trgm'
+POSTGRESQL_SEARCH_DOCUMENT = (
+    "(coalesce(title, '') || ' ' || coalesce(content, '') || ' ' || coalesce(summary, ''))"
+)
+POSTGRESQL_SEARCH_DDL = [
+    'CREATE EXTENSION IF NOT EXISTS pg_trgm',
+    f'CREATE INDEX IF NOT EXISTS {POSTGRESQL_SEARCH_INDEX} ON items '
+    f'USING gin ({POSTGRESQL_SEARCH_DOCUMENT} gin_trgm_ops)',
+]
+
+_items_fts = table(SQLITE_FTS_TABLE, column('rowid'), column('rank'))
+
+# 検索インデックスが作成済みのエンジン（作成済みと確認できたものだけ覚える）
+# URLではなくエンジン自体をキーにする（インメモリDBは同じURLでもエンジンごとに別のDBになるため）
+_index_ready = weakref.WeakKeyDictionary()
+
+
+def create_search_index(engine):
+    """
+    検索インデックスを作成（作成済みの場合は何もしない）
+
+    Args:
+        engine: SQLAlchemyエンジン
+
+    Returns:
+        適用した内容の説明リスト
+    """
+    if search_index_ready(engine):
+        return []
+
+    ddl = POSTGRESQL_SEARCH_DDL if engine.dialect.name == 'postgresql' else SQLITE_FTS_DDL
+    try:
+        with engine.begin() as conn:
+            for statement in ddl:
+                conn.execute(text(statement))
+    except Exception as e:
+        # トライグラムに未対応のSQLite（3.34未満）や pg_trgm を作成する権限がない場合はLIKE検索のまま使う
+        return [f'検索インデックスを作成できませんでした（キーワード検索はLIKEで行います）: {e}']
+
+    return ['キーワード検索用のインデックスを作成']
+
+
+def drop_search_index(engine):
+    """
+    検索インデックスを削除（SQLiteのFTS5テーブルは items を削除しても残るため）
+
+    Args:
+        engine: SQLAlchemyエンジン
+    """
+    _index_ready.pop(engine, None)
+    with engine.begin() as conn:
+        if engine.dialect.name == 'postgresql':
+            conn.execute(text(f'DROP INDEX IF EXISTS {POSTGRESQL_SEARCH_INDEX}'))
+        else:
+            conn.execute(text(f'DROP TABLE IF EXISTS {SQLITE_FTS_TABLE}'))
+
+
+def search_index_ready(engine) -> bool:
+    """
+    検索インデックスが作成済みか
+
+    Args:
+        engine: SQLAlchemyエンジン
+
+    Returns:
+        作成済みの場合True
+    """
+    if _index_ready.get(engine):
+        return True
+
+    with engine.connect() as conn:
+        if engine.dialect.name == 'postgresql':
+            ready = conn.execute(
+                text('SELECT 1 FROM pg_indexes WHERE indexname = :name'),
+                {'name': POSTGRESQL_SEARCH_INDEX}
+            ).first() is not None
+        else:
+            ready = conn.execute(
+                text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+                {'name': SQLITE_FTS_TABLE}
+            ).first() is not None
+
+    if ready:
+        _index_ready[engine] = True
+    return ready
+
+
+def split_terms(keyword: str):
+    """
+    キーワードを空白で区切った検索語のリストにする（全ての語を含むアイテムを検索する）
+    """
+    return [term for term in keyword.split() if term]
+
+
+def apply_keyword_filter(query, session, keyword: str):
+    """
+    キーワードを含むアイテムに絞り込む
+
+    Args:
+        query: アイテムのクエリ
+        session: DBセッション
+        keyword: キーワード（空白区切りで複数指定した場合は全てを含むもの）
+
+    Returns:
+        SQLAlchemyのクエリ
+    """
+    terms = split_terms(keyword)
+    if not terms:
+        return query
+
+    engine = session.get_bind()
+    if engine.dialect.name == 'postgresql':
+        # ILIKE はトライグラムインデックスで検索される（短い語は索引で絞り込めない）
+        document = search_document()
+        return query.filter(*[document.ilike(_like_pattern(term), escape='\\') for term in terms])
+
+    indexed = search_index_ready(engine)
+    long_terms = [term for term in terms if indexed and len(term) >= MIN_TRIGRAM_LENGTH]
+    short_terms = [term for term in terms if term not in long_terms]
+
+    if long_terms:
+        query = query.filter(Item.id.in_(
+            select(_items_fts.c.rowid).where(_fts_match(long_terms))
+        ))
+    for term in short_terms:
+        pattern = _like_pattern(term)
+        query = query.filter(or_(
+            Item.title.like(pattern, escape='\\'),
+            Item.content.like(pattern, escape='\\'),
+            Item.summary.like(pattern, escape='\\')
+        ))
+    return query
+
+
+def order_by_relevance(query, session, keyword: str):
+    """
+    キーワードとの関連度の高い順に並べる（同順位は一覧の並び順）
+
+    Args:
+        query: apply_keyword_filter で絞り込んだクエリ
+        session: DBセッション
+        keyword: キーワード
+
+    Returns:
+        SQLAlchemyのクエリ（関連度を計算できない場合は並び順を追加しない）
+    """
+    terms = split_terms(keyword)
+    engine = session.get_bind()
+    if not terms or not search_index_ready(engine):
+        return query
+
+    if engine.dialect.name == 'postgresql':
+        return query.order_by(desc(func.word_similarity(literal(' '.join(terms)), search_document())))
+
+    long_terms = [term for term in terms if len(term) >= MIN_TRIGRAM_LENGTH]
+    if not long_terms:
+        return query
+
+    # bm25 のスコア（rank）は小さいほど関連度が高い
+    ranked = select(_items_fts.c.rowid, _items_fts.c.rank).where(_fts_match(long_terms)).subquery()
+    return query.join(ranked, ranked.c.rowid == Item.id).order_by(ranked.c.rank)
+
+
+def search_document():
+    """
+    PostgreSQL: 検索対象のカラムを連結した式（POSTGRESQL_SEARCH_DOCUMENT と同じ式）
+    """
+    return (
+        func.coalesce(Item.title, '') + ' ' + func.coalesce(Item.content, '') + ' '
+        + func.coalesce(Item.summary, '')
+    )
+
+
+def _fts_match(terms):
+    """
+    SQLite: 全ての語を含む行に一致するFTS5の条件（各語はフレーズとして扱い、演算子として解釈させない）
+    """
+    match = ' '.join('"' + term.replace('"', '""') + '"' for term in terms)
+    return text(f'{SQLITE_FTS_TABLE} MATCH :fts_match').bindparams(fts_match=match)
+
+
+def _like_pattern(term: str) -> str:
+    """
+    語を部分一致のLIKEパターンにする（% と _ はそのまま検索する）
+    """
+    escaped = term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return f'%{escaped}%'
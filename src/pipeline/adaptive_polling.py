@@ -0,0 +1,159 @@
+"""
+適応的ポーリング
+過去の実行ログ（Execution.agent_results の new / high）からソースごとの新着頻度を推定し、
+ソース別の実行間隔を設定の範囲内で伸縮させる
+
+- 新着が多いソースほど間隔を短く、新着がないソースは上限まで長くする
+- 直近に重要度highのアイテムが見つかったソースは、一定時間だけ短い間隔で実行する
+"""
+from datetime import datetime, timedelta
+from typing import Dict, Any, List
+import pytz
+
+from src.database.models import Execution
+
+
+class AdaptivePollingPolicy:
+    """
+    ソース別の実行間隔を決定するポリシー
+    """
+
+    def __init__(
+        self,
+        db_manager,
+        min_interval_minutes: float = 15,
+        max_interval_minutes: float = 240,
+        target_new_items: float = 1.0,
+        history_runs: int = 10,
+        burst_interval_minutes: float = 10,
+        burst_duration_minutes: float = 120
+    ):
+        """
+        初期化
+
+        Args:
+            db_manager: データベースマネージャー
+            min_interval_minutes: 実行間隔の下限（分）
+            max_interval_minutes: 実行間隔の上限（分）
+            target_new_items: 1回の実行で見つけたい新着件数（新着頻度 × 間隔 がこの値になるよう調整）
+            history_runs: 新着頻度の推定に使う直近の実行数
+            burst_interval_minutes: 重要度highのアイテムが見つかった後の実行間隔（分）
+            burst_duration_minutes: 短い間隔を続ける時間（分）
+        """
+        self.db_manager = db_manager
+        self.min_interval = min_interval_minutes
+        self.max_interval = max_interval_minutes
+        self.target_new_items = target_new_items
+        self.history_runs = history_runs
+        self.burst_interval = burst_interval_minutes
+        self.burst_duration = timedelta(minutes=burst_duration_minutes)
+
+    @classmethod
+    def from_settings(cls, db_manager, settings: Dict[str, Any]) -> 'AdaptivePollingPolicy':
+        """
+        設定（config/settings.json の schedule.adaptive）から生成
+        """
+        config = settings.get('schedule', {}).get('adaptive', {})
+        burst = config.get('burst', {})
+        return cls(
+            db_manager,
+            min_interval_minutes=config.get('min_interval_minutes', 15),
+            max_interval_minutes=config.get('max_interval_minutes', 240),
+            target_new_items=config.get('target_new_items_per_run', 1.0),
+            history_runs=config.get('history_runs', 10),
+            burst_interval_minutes=burst.get('interval_minutes', 10),
+            burst_duration_minutes=burst.get('duration_minutes', 120)
+        )
+
+    def next_interval(self, source: str, base_interval: float) -> Dict[str, Any]:
+        """
+        ソースの次の実行間隔を決定
+
+        Args:
+            source: ソース（Agent名）
+            base_interval: 設定上の実行間隔（分）。履歴が足りない場合に使用する
+
+        Returns:
+            {"interval_minutes": 間隔（分）, "reason": 決定理由}
+        """
+        history = self._load_history(source)
+        jst = pytz.timezone('Asia/Tokyo')
+        now = datetime.now(jst)
+
+        # 直近に重要度highのアイテムが見つかった場合は短い間隔で実行する
+        for started_at, result in history:
+            if now - started_at > self.burst_duration:
+                break
+            if result.get('high', 0) > 0:
+                return {
+                    'interval_minutes': self.burst_interval,
+                    'reason': f"重要度highのアイテムを検出（{started_at.strftime('%H:%M')}）"
+                }
+
+        if len(history) < 2:
+            return {
+                'interval_minutes': self._clamp(base_interval),
+                'reason': '履歴が不足しているため設定値を使用'
+            }
+
+        # 最も古い実行より後に見つかった新着数 / 経過時間 から新着頻度を推定
+        newest = history[0][0]
+        oldest = history[-1][0]
+        span_minutes = (newest - oldest).total_seconds() / 60
+        new_items = sum(result.get('new', 0) for _, result in history[:-1])
+
+        if span_minutes <= 0:
+            return {
+                'interval_minutes': self._clamp(base_interval),
+                'reason': '履歴が不足しているため設定値を使用'
+            }
+
+        if new_items == 0:
+            return {
+                'interval_minutes': self.max_interval,
+                'reason': f"直近 {len(history)} 回の実行で新着なし"
+            }
+
+        rate_per_hour = new_items / span_minutes * 60
+        interval = self.target_new_items / (new_items / span_minutes)
+        return {
+            'interval_minutes': self._clamp(interval),
+            'reason': f"新着 {rate_per_hour:.2f} 件/時"
+        }
+
+    def _load_history(self, source: str) -> List[tuple]:
+        """
+        ソースが成功した直近の実行結果を新しい順に取得
+
+        Returns:
+            [(開始日時, Agent結果), ...]
+        """
+        jst = pytz.timezone('Asia/Tokyo')
+
+        session = self.db_manager.get_session()
+        try:
+            # ソース別実行と全ソース実行が混在するため、多めに読み込んで絞り込む
+            executions = session.query(Execution).filter(
+                Execution.status.in_(['success', 'partial'])
+            ).order_by(Execution.started_at.desc()).limit(self.history_runs * 10).all()
+
+            history = []
+            for execution in executions:
+                result = (execution.agent_results or {}).get(source)
+                if not result or result.get('status') != 'success' or 'new' not in result:
+                    continue
+                started_at = execution.started_at
+                if started_at.tzinfo is None:
+                    started_at = jst.localize(started_at)
+                history.append((started_at, result))
+                if len(history) >= self.history_runs:
+                    break
+            return history
+        finally:
+            session.close()
+
+    def _clamp(self, interval: float) -> float:
+        """
+        実行間隔を下限・上限の範囲に収める
+        """
+        return round(min(max(interval, self.min_interval), self.max_interval), 1)
@@ -0,0 +1,245 @@
+"""
+実行の進捗イベント
+実行中の各段階（Agentの収集・Claude判定・保存・完了）を execution_events テーブルに記録し、
+Webプロセスでは1つのスレッドがテーブルを監視して、接続中の全クライアント（GET /api/events）に配信する
+
+実行はワーカー等の別プロセスで行われるため、プロセス間の受け渡しにはDBを使う。
+クライアント数に関係なく、DBを確認するのはWebプロセスごとに1スレッドだけになる。
+"""
+import time
+import queue
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional
+import pytz
+
+from src.database.models import ExecutionEvent
+
+# 配信が追いつかないクライアントに溜める件数の上限（超えた分は再接続時に Last-Event-ID から再送する）
+SUBSCRIBER_QUEUE_SIZE = 1000
+
+# PostgreSQLで毎回読み直す、配信済みの最大IDより前のIDの幅
+# （IDは挿入時に採番されるため、先に採番されたトランザクションが後からコミットされると
+#   「最大IDより後」だけを読むカーソルでは読み飛ばしてしまう。SQLiteは書き込みが直列化されるため不要）
+POSTGRESQL_REREAD_WINDOW = 100
+
+
+def new_event(execution_id: str, event_type: str, data: Optional[Dict[str, Any]] = None) -> ExecutionEvent:
+    """
+    イベントのレコードを作成（セッションへの追加は呼び出し側で行う）
+
+    Args:
+        execution_id: 実行ID
+        event_type: イベントの種類
+        data: イベントの内容
+
+    Returns:
+        ExecutionEventオブジェクト
+    """
+    return ExecutionEvent(
+        execution_id=execution_id,
+        event_type=event_type,
+        data=data or {},
+        created_at=datetime.now(pytz.timezone('Asia/Tokyo'))
+    )
+
+
+class EventRecorder:
+    """
+    進捗イベントをDBに記録する
+    """
+
+    def __init__(self, db_manager, lock=None):
+        """
+        初期化
+
+        Args:
+            db_manager: データベースマネージャー
+            lock: DBアクセスを直列化するロック（省略時は専用のロックを使用）
+        """
+        self.db_manager = db_manager
+        self.lock = lock or threading.RLock()
+
+    def record(self, execution_id: str, event_type: str, data: Optional[Dict[str, Any]] = None):
+        """
+        イベントを記録
+
+        Args:
+            execution_id: 実行ID
+            event_type: イベントの種類
+            data: イベントの内容
+        """
+        with self.lock:
+            session = self.db_manager.get_session()
+            try:
+                session.add(new_event(execution_id, event_type, data))
+                session.commit()
+            finally:
+                session.close()
+
+    def prune(self, retention_hours: float) -> int:
+        """
+        古いイベントを削除
+
+        Args:
+            retention_hours: この時間（時間）より前のイベントを削除する
+
+        Returns:
+            削除した件数
+        """
+        cutoff = datetime.now(pytz.timezone('Asia/Tokyo')) - timedelta(hours=retention_hours)
+        with self.lock:
+            session = self.db_manager.get_session()
+            try:
+                deleted = session.query(ExecutionEvent).filter(
+                    ExecutionEvent.created_at < cutoff
+                ).delete(synchronize_session=False)
+                session.commit()
+                return deleted
+            finally:
+                session.close()
+
+
+class EventBroadcaster:
+    """
+    記録されたイベントを接続中のクライアントに配信する
+
+    クライアントが接続している間だけ監視スレッドを動かし、新しいイベントを各クライアントのキューに入れる。
+    DBの確認中はロックを持たないため、接続・切断を待たせない。
+    """
+
+    def __init__(self, db_manager, poll_interval_sec: float = 0.5, reread_window: Optional[int] = None):
+        """
+        初期化
+
+        Args:
+            db_manager: データベースマネージャー
+            poll_interval_sec: 新しいイベントを確認する間隔（秒）
+            reread_window: 配信済みの最大IDより前に読み直すIDの幅
+                （省略時は PostgreSQL では POSTGRESQL_REREAD_WINDOW、それ以外は0）
+        """
+        self.db_manager = db_manager
+        self.poll_interval = poll_interval_sec
+        if reread_window is None:
+            reread_window = POSTGRESQL_REREAD_WINDOW if db_manager.db_type == 'postgresql' else 0
+        self.reread_window = reread_window
+        self.lock = threading.Lock()
+        self.subscribers = []
+        self.last_id = 0
+        # 読み直す範囲（last_id - reread_window より後）で配信済みのID
+        self.delivered = set()
+        self.thread = None
+
+    def subscribe(self, last_event_id: Optional[int] = None):
+        """
+        配信を開始
+
+        Args:
+            last_event_id: クライアントが最後に受信したイベントID（再接続時）。
+                指定した場合はそれ以降のイベントを再送する
+
+        Returns:
+            (再送するイベントのリスト, 以降のイベントが入るキュー)
+        """
+        subscriber = queue.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+
+        with self.lock:
+            if not self.subscribers:
+                # 監視を止めていた間のイベントは配信済みとみなす（再送はクライアントの last_event_id で行う）
+                self._reset_cursor()
+            until_id = self.last_id
+
+            self.subscribers.append(subscriber)
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, daemon=True)
+                self.thread.start()
+
+        replay = []
+        if last_event_id is not None and last_event_id < until_id:
+            replay = self._fetch(after_id=last_event_id, until_id=until_id)
+
+        return replay, subscriber
+
+    def unsubscribe(self, subscriber: queue.Queue):
+        """
+        配信を終了
+
+        Args:
+            subscriber: subscribe で受け取ったキュー
+        """
+        with self.lock:
+            if subscriber in self.subscribers:
+                self.subscribers.remove(subscriber)
+
+    def _run(self):
+        """
+        クライアントがいる間、新しいイベントを確認して配信する
+        """
+        while True:
+            time.sleep(self.poll_interval)
+            with self.lock:
+                if not self.subscribers:
+                    self.thread = None
+                    return
+                after_id = max(self.last_id - self.reread_window, 0)
+
+            try:
+                events = self._fetch(after_id=after_id)
+            except Exception as e:
+                print(f"[EventBroadcaster] イベントの取得に失敗しました: {e}")
+                continue
+
+            with self.lock:
+                self._deliver(events)
+
+    def _deliver(self, events: List[Dict[str, Any]]):
+        """
+        未配信のイベントを全クライアントのキューに入れる（ロックを持って呼び出す）
+        """
+        for event in events:
+            # 読み直した範囲の配信済みのもの、接続前のもの（読み直す範囲より前）は配信しない
+            if event['id'] in self.delivered or event['id'] <= self.last_id - self.reread_window:
+                continue
+            for subscriber in self.subscribers:
+                try:
+                    subscriber.put_nowait(event)
+                except queue.Full:
+                    pass
+            self.last_id = max(self.last_id, event['id'])
+            if self.reread_window:
+                self.delivered.add(event['id'])
+
+        floor = self.last_id - self.reread_window
+        self.delivered = {event_id for event_id in self.delivered if event_id > floor}
+
+    def _reset_cursor(self):
+        """
+        現在の最大IDを配信済みにする（読み直す範囲にある既存のイベントも配信済みとして記録する）
+        """
+        self.last_id = self._max_id()
+        self.delivered = set()
+        if self.reread_window:
+            self.delivered = {
+                event['id'] for event in self._fetch(after_id=self.last_id - self.reread_window)
+            }
+
+    def _max_id(self) -> int:
+        session = self.db_manager.get_session()
+        try:
+            row = session.query(ExecutionEvent.id).order_by(ExecutionEvent.id.desc()).first()
+            return row[0] if row else 0
+        finally:
+            session.close()
+
+    def _fetch(self, after_id: int, until_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        指定したIDより後のイベントを古い順に取得
+        """
+        session = self.db_manager.get_session()
+        try:
+            query = session.query(ExecutionEvent).filter(ExecutionEvent.id > after_id)
+            if until_id is not None:
+                query = query.filter(ExecutionEvent.id <= until_id)
+            return [event.to_dict() for event in query.order_by(ExecutionEvent.id).limit(SUBSCRIBER_QUEUE_SIZE)]
+        finally:
+            session.close()
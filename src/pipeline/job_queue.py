@@ -0,0 +1,368 @@
+"""
+実行ジョブキュー
+Web APIから依頼された実行をDBの execution_jobs テーブルに登録し、ワーカープロセスが取り出して実行する
+
+- 待機中・実行中のジョブは同時に1件だけ（active_slot のユニーク制約で保証するため、複数のWebプロセスから登録しても重複しない）
+  スケジューラーの定期実行も acquire で同じ枠を取ってから実行するため、Web APIからの実行と重複しない
+- 取り出しは PostgreSQL では SELECT ... FOR UPDATE SKIP LOCKED、
+  SQLite では status='queued' を条件にした UPDATE で行い、1つのジョブを複数のワーカーが実行しないようにする
+- 応答が途絶えたワーカーのジョブは失敗として解放し、実行は /api/executions/<id>/resume で再開できる
+- ワーカーが起動しておらず取り出されないまま残った待機中のジョブは、期限切れとして解放する
+  （枠を持ったままだと以降の実行を登録できなくなるため。ワーカーがいないWebプロセスからも解放する）
+- 登録・終了は進捗イベント（job_queued / job_finished）として同じトランザクションで記録する
+"""
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional
+import pytz
+
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+
+from src.database.models import Execution, ExecutionJob
+from src.database.generations import bump_generation, EXECUTIONS
+from src.pipeline.events import new_event
+
+# 待機中・実行中のジョブが持つ active_slot の値
+ACTIVE_SLOT = 'collection'
+
+
+class JobQueue:
+    """
+    DBに保存する実行ジョブのキュー
+    """
+
+    def __init__(self, db_manager, lock=None):
+        """
+        初期化
+
+        Args:
+            db_manager: データベースマネージャー
+            lock: DBアクセスを直列化するロック（省略時は専用のロックを使用）
+        """
+        self.db_manager = db_manager
+        self.lock = lock or threading.RLock()
+        self.jst = pytz.timezone('Asia/Tokyo')
+
+    def enqueue(self, kind: str, execution_id: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """
+        ジョブを登録
+
+        Args:
+            kind: 種類（execute/resume）
+            execution_id: 実行ID
+            params: 実行パラメータ
+
+        Returns:
+            登録したジョブの辞書（待機中・実行中のジョブがすでにある場合はNone）
+        """
+        return self._insert(kind, execution_id, params, status='queued')
+
+    def acquire(
+        self,
+        kind: str,
+        execution_id: str,
+        worker_id: str,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        ジョブを実行中の状態で登録し、そのまま取り出す（キューを経由せずに実行するスケジューラー用）
+
+        Args:
+            kind: 種類（execute/resume）
+            execution_id: 実行ID
+            worker_id: 実行するプロセスのID
+            params: 実行パラメータ
+
+        Returns:
+            登録したジョブの辞書（待機中・実行中のジョブがすでにある場合はNone）
+        """
+        now = self._now()
+        return self._insert(
+            kind, execution_id, params,
+            status='running', worker_id=worker_id, claimed_at=now, heartbeat_at=now
+        )
+
+    def _insert(self, kind: str, execution_id: str, params: Optional[Dict[str, Any]], **fields) -> Optional[Dict[str, Any]]:
+        """
+        active_slot を取ってジョブを登録（取れなかった場合はNone）
+        """
+        with self.lock:
+            session = self.db_manager.get_session()
+            try:
+                job = ExecutionJob(
+                    kind=kind,
+                    execution_id=execution_id,
+                    params=params or {},
+                    active_slot=ACTIVE_SLOT,
+                    created_at=self._now(),
+                    **fields
+                )
+                session.add(job)
+                session.add(new_event(execution_id, 'job_queued', {'kind': kind}))
+                session.commit()
+                return job.to_dict()
+            except IntegrityError:
+                session.rollback()
+                return None
+            finally:
+                session.close()
+
+    def claim(self, worker_id: str) -> Optional[Dict[str, Any]]:
+        """
+        待機中のジョブを1件取り出して実行中にする
+
+        Args:
+            worker_id: ワーカーID
+
+        Returns:
+            取り出したジョブの辞書（待機中のジョブがない場合はNone）
+        """
+        with self.lock:
+            session = self.db_manager.get_session()
+            try:
+                if self.db_manager.db_type == 'postgresql':
+                    return self._claim_skip_locked(session, worker_id)
+                return self._claim_conditional_update(session, worker_id)
+            finally:
+                session.close()
+
+    def heartbeat(self, job_id: int):
+        """
+        実行中であることを記録
+
+        Args:
+            job_id: ジョブID
+        """
+        with self.lock:
+            session = self.db_manager.get_session()
+            try:
+                session.execute(
+                    update(ExecutionJob)
+                    .where(ExecutionJob.id == job_id, ExecutionJob.status == 'running')
+                    .values(heartbeat_at=self._now())
+                )
+                session.commit()
+            finally:
+                session.close()
+
+    def finish(self, job_id: int, status: str, error_message: Optional[str] = None):
+        """
+        ジョブを終了状態にする（次のジョブを登録できるようになる）
+
+        Args:
+            job_id: ジョブID
+            status: 終了ステータス（done/failed）
+            error_message: エラーメッセージ
+        """
+        with self.lock:
+            session = self.db_manager.get_session()
+            try:
+                job = session.get(ExecutionJob, job_id)
+                job.status = status
+                job.active_slot = None
+                job.finished_at = self._now()
+                job.error_message = error_message
+                session.add(new_event(job.execution_id, 'job_finished', {
+                    'status': status,
+                    'error': error_message
+                }))
+                session.commit()
+            finally:
+                session.close()
+
+    def recover_stale(self, stale_minutes: float) -> List[str]:
+        """
+        応答が途絶えたワーカーのジョブを失敗として解放
+
+        ジョブの実行記録（executions）も実行中のまま残るため失敗にし、再開できるようにする。
+
+        Args:
+            stale_minutes: 最終応答からこの時間（分）が経過したジョブを解放する
+
+        Returns:
+            解放したジョブの実行IDリスト
+        """
+        cutoff = self._now() - timedelta(minutes=stale_minutes)
+        message = 'ワーカーの応答が途絶えたため中断しました'
+
+        with self.lock:
+            session = self.db_manager.get_session()
+            try:
+                jobs = session.query(ExecutionJob).filter(
+                    ExecutionJob.status == 'running',
+                    ExecutionJob.heartbeat_at < cutoff
+                ).all()
+
+                for job in jobs:
+                    job.status = 'failed'
+                    job.active_slot = None
+                    job.finished_at = self._now()
+                    job.error_message = f"{message}（{job.worker_id}）"
+                    session.add(new_event(job.execution_id, 'job_finished', {
+                        'status': 'failed',
+                        'error': job.error_message
+                    }))
+
+                    execution = session.query(Execution).filter_by(id=job.execution_id).first()
+                    if execution and execution.status == 'running':
+                        execution.status = 'failed'
+                        execution.completed_at = self._now()
+                        execution.error_message = message
+                        bump_generation(session, EXECUTIONS)
+
+                session.commit()
+                return [job.execution_id for job in jobs]
+            finally:
+                session.close()
+
+    def expire_queued(self, queued_minutes: float) -> List[str]:
+        """
+        ワーカーに取り出されないまま残った待機中のジョブを失敗として解放
+
+        待機中のジョブはまだ実行記録（executions）を作っていないため、ジョブのみを終了する。
+
+        Args:
+            queued_minutes: 登録からこの時間（分）が経過した待機中のジョブを解放する
+
+        Returns:
+            解放したジョブの実行IDリスト
+        """
+        cutoff = self._now() - timedelta(minutes=queued_minutes)
+        message = 'ワーカーが起動していないため実行されませんでした'
+
+        with self.lock:
+            session = self.db_manager.get_session()
+            try:
+                jobs = session.query(ExecutionJob).filter(
+                    ExecutionJob.status == 'queued',
+                    ExecutionJob.created_at < cutoff
+                ).all()
+
+                for job in jobs:
+                    job.status = 'failed'
+                    job.active_slot = None
+                    job.finished_at = self._now()
+                    job.error_message = message
+                    session.add(new_event(job.execution_id, 'job_finished', {
+                        'status': 'failed',
+                        'error': message
+                    }))
+
+                session.commit()
+                return [job.execution_id for job in jobs]
+            finally:
+                session.close()
+
+    def active_job(self) -> Optional[Dict[str, Any]]:
+        """
+        待機中・実行中のジョブを取得
+
+        Returns:
+            ジョブの辞書（なければNone）
+        """
+        with self.lock:
+            session = self.db_manager.get_session()
+            try:
+                job = session.query(ExecutionJob).filter(
+                    ExecutionJob.active_slot == ACTIVE_SLOT
+                ).first()
+                return job.to_dict() if job else None
+            finally:
+                session.close()
+
+    def waiting_since(self, waiting_sec: float) -> Optional[Dict[str, Any]]:
+        """
+        登録から一定時間が経過しても取り出されていない待機中のジョブを取得
+        （ワーカーは poll_interval_sec ごとに確認するため、長く残っている場合はワーカーが起動していない）
+
+        Args:
+            waiting_sec: 登録からの経過時間（秒）
+
+        Returns:
+            ジョブの辞書（なければNone）
+        """
+        cutoff = self._now() - timedelta(seconds=waiting_sec)
+
+        with self.lock:
+            session = self.db_manager.get_session()
+            try:
+                job = session.query(ExecutionJob).filter(
+                    ExecutionJob.status == 'queued',
+                    ExecutionJob.created_at < cutoff
+                ).first()
+                return job.to_dict() if job else None
+            finally:
+                session.close()
+
+    def running_execution(self, stale_minutes: float) -> Optional[Dict[str, Any]]:
+        """
+        実行中の実行記録を取得（ジョブキューを経由しない実行も含む）
+
+        Args:
+            stale_minutes: 開始からこの時間（分）より古い実行中の記録は中断されたものとみなす
+
+        Returns:
+            実行記録の辞書（なければNone）
+        """
+        since = self._now() - timedelta(minutes=stale_minutes)
+
+        with self.lock:
+            session = self.db_manager.get_session()
+            try:
+                execution = session.query(Execution).filter(
+                    Execution.status == 'running',
+                    Execution.started_at >= since
+                ).order_by(Execution.started_at.desc()).first()
+                return execution.to_dict() if execution else None
+            finally:
+                session.close()
+
+    def _claim_skip_locked(self, session, worker_id: str) -> Optional[Dict[str, Any]]:
+        """
+        PostgreSQL: 他のワーカーがロック中の行を読み飛ばして取り出す
+        """
+        job = session.query(ExecutionJob).filter(
+            ExecutionJob.status == 'queued'
+        ).order_by(ExecutionJob.id).with_for_update(skip_locked=True).first()
+
+        if job is None:
+            session.rollback()
+            return None
+
+        now = self._now()
+        job.status = 'running'
+        job.worker_id = worker_id
+        job.claimed_at = now
+        job.heartbeat_at = now
+        session.commit()
+        return job.to_dict()
+
+    def _claim_conditional_update(self, session, worker_id: str) -> Optional[Dict[str, Any]]:
+        """
+        SQLite: status='queued' を条件にUPDATEし、更新できたワーカーだけが取り出す
+        （SQLiteは書き込みがDB単位で直列化されるため、UPDATEは他のワーカーと競合しない）
+        """
+        job_id = session.query(ExecutionJob.id).filter(
+            ExecutionJob.status == 'queued'
+        ).order_by(ExecutionJob.id).limit(1).scalar()
+
+        if job_id is None:
+            session.rollback()
+            return None
+
+        now = self._now()
+        result = session.execute(
+            update(ExecutionJob)
+            .where(ExecutionJob.id == job_id, ExecutionJob.status == 'queued')
+            .values(status='running', worker_id=worker_id, claimed_at=now, heartbeat_at=now)
+        )
+        session.commit()
+
+        if result.rowcount != 1:
+            # 他のワーカーが先に取り出した
+            return None
+        return session.get(ExecutionJob, job_id).to_dict()
+
+    def _now(self) -> datetime:
+        return datetime.now(self.jst)
@@ -0,0 +1,191 @@
+"""
+実行スケジューラー
+config/settings.json の schedule に従って、常駐プロセス内で情報収集を定期実行する
+
+NatsuAgentExecutor を1つだけ生成して使い回すため、プロンプト・HTTP接続・DBエンジン・
+Anthropicクライアントの初期化は起動時の1回だけで済む。
+実行はジョブキュー（execution_jobs）の枠を取ってから行うため、Web APIから依頼された実行とは重複しない。
+"""
+import threading
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+import pytz
+
+from apscheduler.schedulers.blocking import BlockingScheduler
+from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
+
+from src.pipeline.adaptive_polling import AdaptivePollingPolicy
+from src.pipeline.worker import JobWorker
+
+
+class ExecutionScheduler:
+    """
+    情報収集の定期実行を管理するスケジューラー
+
+    - 全ソース: schedule.time / schedule.days で指定した時刻に実行
+    - ソース別: schedule.sources.<ソース>.interval_minutes ごとに、そのソースのみ実行
+      （schedule.adaptive.enabled の場合は新着頻度に応じて実行ごとに間隔を調整）
+    - 実行中に次の実行時刻が来た場合や、他のプロセスで実行中の場合は重複して実行せずスキップする
+    """
+
+    def __init__(self, executor, settings: Dict[str, Any]):
+        """
+        初期化
+
+        Args:
+            executor: NatsuAgentExecutor（全ての実行で使い回す）
+            settings: 設定辞書（config/settings.json）
+        """
+        self.executor = executor
+        self.schedule = settings.get('schedule', {})
+        self.timezone = pytz.timezone(self.schedule.get('timezone', 'Asia/Tokyo'))
+
+        # ジョブキューの枠を取り、ワーカーと同じ手順（応答の記録・終了の記録）で実行する
+        self.worker = JobWorker.from_settings(executor, settings)
+
+        self.run_lock = threading.Lock()
+        self.scheduler = BlockingScheduler(timezone=self.timezone)
+
+        # ソース別の設定上の実行間隔（分）
+        self.base_intervals = {
+            source: config['interval_minutes']
+            for source, config in self.schedule.get('sources', {}).items()
+            if config.get('interval_minutes')
+        }
+
+        # 適応的ポーリング（無効の場合は設定上の間隔で固定）
+        self.polling_policy = None
+        if self.schedule.get('adaptive', {}).get('enabled', False):
+            self.polling_policy = AdaptivePollingPolicy.from_settings(executor.db_manager, settings)
+
+    def add_jobs(self) -> List[str]:
+        """
+        設定に従ってジョブを登録
+
+        Returns:
+            登録したジョブの説明リスト
+        """
+        job_options = {
+            'max_instances': 1,
+            'coalesce': True,  # 停止中に溜まった実行は1回にまとめる
+            'misfire_grace_time': 300,
+        }
+        descriptions = []
+
+        time_str = self.schedule.get('time')
+        if time_str:
+            hour, minute = (int(value) for value in time_str.split(':'))
+            days = self.schedule.get('days') or ['mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun']
+            self.scheduler.add_job(
+                self.run_execution,
+                CronTrigger(day_of_week=','.join(days), hour=hour, minute=minute, timezone=self.timezone),
+                id='all_sources',
+                **job_options
+            )
+            descriptions.append(f"全ソース: {','.join(days)} {time_str}")
+
+        for source in self.base_intervals:
+            interval, reason = self._interval_for(source)
+            self.scheduler.add_job(
+                self.run_execution,
+                IntervalTrigger(minutes=interval, timezone=self.timezone),
+                kwargs={'sources': [source]},
+                id=f'source_{source}',
+                **job_options
+            )
+            descriptions.append(f"{source}: {interval}分ごと" + (f"（{reason}）" if reason else ""))
+
+        return descriptions
+
+    def start(self):
+        """
+        スケジューラーを開始（停止されるまで戻らない）
+        """
+        self.scheduler.start()
+
+    def shutdown(self):
+        """
+        スケジューラーを停止（実行中の収集は完了を待つ）
+        """
+        self.scheduler.shutdown(wait=True)
+
+    def run_execution(self, sources: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+        """
+        情報収集を1回実行（他の実行と重複する場合はスキップ）
+
+        Args:
+            sources: 収集するソースのリスト（Noneの場合は全ソース）
+
+        Returns:
+            実行結果の辞書（スキップした場合はNone）
+        """
+        label = ', '.join(sources) if sources else '全ソース'
+
+        if not self.run_lock.acquire(blocking=False):
+            print(f"[ExecutionScheduler] 実行中のためスキップ: {label}")
+            return None
+
+        try:
+            # ジョブキューを経由しない実行（コマンドラインからの実行等）
+            running = self.worker.queue.running_execution(self.worker.stale_running_minutes)
+            if running:
+                print(f"[ExecutionScheduler] 他の実行（{running['id']}）が実行中のためスキップ: {label}")
+                return None
+
+            execution_id = datetime.now(pytz.timezone('Asia/Tokyo')).strftime('exec_%Y%m%d_%H%M%S')
+            job = self.worker.queue.acquire('execute', execution_id, self.worker.worker_id, {'sources': sources})
+            if job is None:
+                active = self.worker.queue.active_job()
+                print(f"[ExecutionScheduler] 他の実行（{active['execution_id'] if active else '不明'}）が実行中のためスキップ: {label}")
+                return None
+
+            print(f"[ExecutionScheduler] 実行開始: {label}")
+            result = self.worker.run_job(job)
+            print(f"[ExecutionScheduler] 実行終了: {label} ({result['status']}: {result.get('message')})")
+
+            # 実行結果を反映してソース別の間隔を調整
+            if self.polling_policy:
+                for source in (sources or list(self.base_intervals)):
+                    self._reschedule(source)
+
+            return result
+
+        except Exception as e:
+            # 1回の失敗でスケジューラーを止めない
+            print(f"[ExecutionScheduler] 実行エラー: {label} ({e})")
+            return None
+
+        finally:
+            self.run_lock.release()
+
+    def _interval_for(self, source: str):
+        """
+        ソースの実行間隔を決定
+
+        Returns:
+            (間隔（分）, 決定理由。適応的ポーリングが無効の場合はNone)
+        """
+        base_interval = self.base_intervals[source]
+        if not self.polling_policy:
+            return base_interval, None
+        decision = self.polling_policy.next_interval(source, base_interval)
+        return decision['interval_minutes'], decision['reason']
+
+    def _reschedule(self, source: str):
+        """
+        ソース別ジョブの実行間隔を更新（次回の実行はこの時点から数える）
+
+        Args:
+            source: ソース（Agent名）
+        """
+        job_id = f'source_{source}'
+        if source not in self.base_intervals or self.scheduler.get_job(job_id) is None:
+            return
+
+        interval, reason = self._interval_for(source)
+        self.scheduler.reschedule_job(
+            job_id,
+            trigger=IntervalTrigger(minutes=interval, timezone=self.timezone)
+        )
+        print(f"[ExecutionScheduler] {source} の実行間隔: {interval}分（{reason}）")
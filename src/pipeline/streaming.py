@@ -0,0 +1,327 @@
+"""
+ストリーミング実行パイプライン
+収集・重複排除・Claude判定・保存を上限付きキューでつなぎ、各段階を並行して実行する
+
+    各Agent（1スレッドずつ） -> 重複排除・マイクロバッチ化 -> Claude判定 -> DB保存
+
+遅いAgentの収集完了を待たずに、先に集まったアイテムから判定・保存を始める。
+"""
+import time
+import queue
+import threading
+from typing import List, Dict, Any
+
+from src.utils.url_canonicalizer import canonical_key
+
+# 各段階の終了を後段に伝える番兵
+_DONE = object()
+
+
+class StreamingPipeline:
+    """
+    収集から保存までを並行して進めるパイプライン
+
+    判定は判定バッチ（件数または待ち時間で区切る）単位で行う。近似重複のクラスタは判定バッチ内でまとめ、
+    先のバッチで判定したアイテム・保存済みのアイテムの近似重複はそのクラスタに加える。
+    """
+
+    def __init__(self, executor):
+        """
+        初期化
+
+        Args:
+            executor: NatsuAgentExecutor（Agent・各プロセッサー・DB保存処理を利用する）
+        """
+        self.executor = executor
+
+        config = executor.claude_processor.settings.get('pipeline', {}).get('streaming', {})
+        self.queue_size = config.get('queue_size', 100)
+        self.judge_batch_size = config.get('judge_batch_size', 10)
+        self.judge_batch_timeout = config.get('judge_batch_timeout_sec', 5)
+
+    def run(self, execution_id: str) -> Dict[str, Any]:
+        """
+        パイプラインを実行
+
+        途中の段階でエラーが発生した場合も、実行中の段階を終了させてから例外を送出する
+        （それまでに判定を終えたアイテムは保存済みになる）。
+        失敗・スキップしたAgentがあっても、他のAgentの結果で続行する。
+        全Agentの収集が終わった時点で収集結果をチェックポイントとして保存するため、
+        判定・保存の失敗は NatsuAgentExecutor.resume で収集を省略して再開できる。
+
+        Args:
+            execution_id: 実行ID
+
+        Returns:
+            集計結果の辞書（NatsuAgentExecutor._run_staged と同じ形式）
+
+        Raises:
+            Exception: 全てのAgentが失敗・スキップした場合、または判定・保存でエラーが発生した場合
+        """
+        self._execution_id = execution_id
+        self._collected_queue = queue.Queue(maxsize=self.queue_size)
+        self._judge_queue = queue.Queue(maxsize=self.queue_size)
+        self._save_queue = queue.Queue(maxsize=self.queue_size)
+        self._lock = threading.Lock()
+        self._errors = []
+        self._aborted = threading.Event()
+
+        self._agent_results = {}
+        self._collected_items = []
+        self._new_counts = {}
+        self._high_counts = {}
+        self._pre_filter_stats = {'input': 0, 'dropped': 0, 'by_reason': {}, 'by_source': {}}
+        self._cluster_stats = {'clusters': 0, 'duplicates': 0, 'stored_matches': 0}
+        self._claude_processed = 0
+        self._claude_duration = 0.0
+        self._total_saved = 0
+
+        consumers = [
+            threading.Thread(target=self._batch_stage, name='pipeline-batch'),
+            threading.Thread(target=self._judge_stage, name='pipeline-judge'),
+            threading.Thread(target=self._save_stage, name='pipeline-save'),
+        ]
+        producers = [
+            threading.Thread(target=self._produce, args=(agent,), name=f'pipeline-{agent.name}')
+            for agent in self.executor.active_agents
+        ]
+
+        for thread in consumers + producers:
+            thread.start()
+
+        for thread in producers:
+            thread.join()
+        self._collected_queue.put(_DONE)
+
+        # 失敗・スキップしたAgentがあっても他のAgentの結果で続行する
+        try:
+            self.executor._check_agent_results(self._agent_results)
+        except Exception as e:
+            self._fail(str(e))
+
+        # 再開用に収集結果を保存する（再開時は保存済みのアイテムを除いて判定し直す）
+        if self._collected_items:
+            self.executor._save_checkpoint(execution_id, 'collected', {
+                'items': self._collected_items,
+                'agent_results': self._ordered_agent_results()
+            })
+
+        for thread in consumers:
+            thread.join()
+
+        agent_results = self._ordered_agent_results()
+
+        if self._errors:
+            raise Exception(self._errors[0])
+
+        self.executor._add_source_counts(agent_results, 'new', self._new_counts)
+        self.executor._add_source_counts(agent_results, 'high', self._high_counts)
+
+        agent_results['pre_filter'] = self._pre_filter_stats
+        agent_results['near_duplicate'] = self._cluster_stats
+
+        return {
+            'total_collected': len(self._collected_items),
+            'total_saved': self._total_saved,
+            'agent_results': agent_results,
+            'claude_processed': self._claude_processed,
+            'claude_duration': self._claude_duration
+        }
+
+    def _produce(self, agent):
+        """
+        Agentで収集したアイテムを1件ずつキューに入れる
+
+        リトライ前の試行やAgentが最終的に失敗した試行で渡したアイテムも判定・保存されるため、
+        収集件数・再開用の収集結果には全試行で渡したアイテムを含める
+        （試行間で重複するアイテムは正規化URLで1件にまとめる）。
+
+        Args:
+            agent: 情報収集Agent
+        """
+        emitted = {}
+
+        def emit(item):
+            key = canonical_key(item.get('url')) or item.get('url')
+            with self._lock:
+                if key not in emitted:
+                    emitted[key] = dict(item)
+                    self._collected_items.append(emitted[key])
+            # 後段でエラーが発生した場合は判定に回さない（収集結果は再開用に残す）
+            if not self._aborted.is_set():
+                self._collected_queue.put(item)
+
+        try:
+            result = self.executor._execute_agent(agent, emit)
+        except Exception as e:
+            result = {'status': 'failed', 'error': str(e), 'attempts': 0, 'count': 0}
+
+        with self._lock:
+            self._agent_results[agent.name] = self.executor._summarize_agent_result(result)
+
+    def _ordered_agent_results(self) -> Dict[str, Any]:
+        """
+        Agent結果を実行順（executor.active_agents の順）に並べる
+        """
+        return {
+            agent.name: self._agent_results[agent.name]
+            for agent in self.executor.active_agents
+            if agent.name in self._agent_results
+        }
+
+    def _batch_stage(self):
+        """
+        収集したアイテムを重複排除し、件数または待ち時間で区切って判定段階に渡す
+
+        エラーで中止した後も、Agentのスレッドがブロックしたままにならないよう番兵まで読み続ける。
+        """
+        seen_keys = set()
+        batch: List[Dict[str, Any]] = []
+        deadline = None
+
+        try:
+            while True:
+                timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+                try:
+                    item = self._collected_queue.get(timeout=timeout)
+                except queue.Empty:
+                    item = None
+
+                if item is _DONE:
+                    break
+                if self._aborted.is_set():
+                    batch = []
+                    deadline = None
+                    continue
+
+                try:
+                    if item is not None:
+                        key = canonical_key(item.get('url'))
+                        if key and key not in seen_keys:
+                            seen_keys.add(key)
+                            item['canonical_key'] = key
+                            batch.append(item)
+                            if deadline is None:
+                                deadline = time.monotonic() + self.judge_batch_timeout
+
+                    timed_out = deadline is not None and time.monotonic() >= deadline
+                    if batch and (len(batch) >= self.judge_batch_size or timed_out):
+                        self._flush_batch(batch)
+                        batch = []
+                        deadline = None
+                except Exception as e:
+                    self._fail(f"重複排除でエラーが発生しました: {e}")
+
+            if batch:
+                self._flush_batch(batch)
+        except Exception as e:
+            self._fail(f"重複排除でエラーが発生しました: {e}")
+        finally:
+            self._judge_queue.put(_DONE)
+
+    def _flush_batch(self, batch: List[Dict[str, Any]]):
+        """
+        保存済みアイテムと事前フィルタで除外したアイテムを除き、判定段階に渡す
+
+        Args:
+            batch: 重複排除済みのアイテムリスト
+        """
+        if self._aborted.is_set():
+            return
+
+        try:
+            items = self.executor._remove_known_items(batch)
+        except Exception as e:
+            self._fail(f"保存済みチェックでエラーが発生しました: {e}")
+            return
+
+        self._merge_counts(self._new_counts, self.executor._count_by_agent(items))
+
+        try:
+            items, stats = self.executor.pre_filter.apply(items)
+        except Exception as e:
+            self._fail(f"事前フィルタでエラーが発生しました: {e}")
+            return
+
+        self._pre_filter_stats['input'] += stats['input']
+        self._pre_filter_stats['dropped'] += stats['dropped']
+        for field in ('by_reason', 'by_source'):
+            for key, count in stats[field].items():
+                self._pre_filter_stats[field][key] = self._pre_filter_stats[field].get(key, 0) + count
+
+        if items:
+            self._judge_queue.put(items)
+
+    def _judge_stage(self):
+        """
+        判定バッチごとにClaude判定を行い、基準を満たしたアイテムを保存段階に渡す
+        """
+        try:
+            while True:
+                items = self._judge_queue.get()
+                if items is _DONE:
+                    break
+                if self._aborted.is_set():
+                    continue
+
+                try:
+                    judged_items, duration, cluster_stats = self.executor._judge_batch(items, self._execution_id)
+                except Exception as e:
+                    # 以降のバッチは読み捨て、前段がブロックしたままにならないようにする
+                    self._fail(f"Claude判定でエラーが発生しました: {e}")
+                    continue
+
+                self._claude_processed += len(judged_items)
+                self._merge_counts(self._high_counts, self.executor._count_by_agent(
+                    item for item in judged_items if item.get('importance_level') == 'high'
+                ))
+                self._claude_duration += duration
+                self._cluster_stats['clusters'] += cluster_stats['clusters']
+                self._cluster_stats['duplicates'] += cluster_stats['duplicates']
+                self._cluster_stats['stored_matches'] += cluster_stats['stored_matches']
+
+                print(f"[StreamingPipeline] 判定: {len(items)} 件 -> {len(judged_items)} 件が基準を満たしました")
+
+                if judged_items:
+                    self._save_queue.put(judged_items)
+        finally:
+            self._save_queue.put(_DONE)
+
+    def _save_stage(self):
+        """
+        判定済みのアイテムをまとめてDBに保存
+        """
+        while True:
+            items = self._save_queue.get()
+            if items is _DONE:
+                break
+            if self._aborted.is_set():
+                continue
+
+            try:
+                saved_count = self.executor._save_to_database(items, self._execution_id)
+            except Exception as e:
+                self._fail(f"データベース保存でエラーが発生しました: {e}")
+                continue
+
+            self._total_saved += saved_count
+            print(f"[StreamingPipeline] 保存: {saved_count} 件（累計 {self._total_saved} 件）")
+
+    @staticmethod
+    def _merge_counts(total: Dict[str, int], counts: Dict[str, int]):
+        """
+        Agent名ごとの件数を合算
+        """
+        for name, count in counts.items():
+            total[name] = total.get(name, 0) + count
+
+    def _fail(self, message: str):
+        """
+        エラーを記録し、以降の判定・保存を中止する（キューは番兵まで読み続ける）
+
+        Args:
+            message: エラーメッセージ
+        """
+        with self._lock:
+            self._errors.append(message)
+        self._aborted.set()
@@ -0,0 +1,166 @@
+"""
+ジョブワーカー
+ジョブキュー（execution_jobs）から実行を取り出し、Webプロセスとは別のプロセスで実行する
+
+NatsuAgentExecutor を1つだけ生成して使い回し、ジョブは1件ずつ順に実行する。
+複数のワーカーを起動しても、1つのジョブを実行するのは1つのワーカーだけになる。
+ジョブキューを経由しない実行（コマンドラインからの実行等）が実行中の場合は、ジョブを実行せず失敗にする。
+"""
+import os
+import socket
+import threading
+from typing import Dict, Any, Optional
+
+from src.pipeline.job_queue import JobQueue
+
+
+class JobWorker:
+    """
+    ジョブキューの実行ワーカー
+    """
+
+    def __init__(
+        self,
+        executor,
+        queue: JobQueue,
+        worker_id: Optional[str] = None,
+        poll_interval_sec: float = 2,
+        heartbeat_interval_sec: float = 30,
+        stale_job_minutes: float = 10,
+        stale_running_minutes: float = 120
+    ):
+        """
+        初期化
+
+        Args:
+            executor: NatsuAgentExecutor（全てのジョブで使い回す）
+            queue: ジョブキュー
+            worker_id: ワーカーID（省略時は ホスト名:プロセスID）
+            poll_interval_sec: 待機中のジョブがない場合の確認間隔（秒）
+            heartbeat_interval_sec: 実行中であることを記録する間隔（秒）
+            stale_job_minutes: 最終応答からこの時間（分）が経過した他のワーカーのジョブを中断されたとみなす
+            stale_running_minutes: 開始からこの時間（分）より古い実行中の記録は中断されたものとみなす
+        """
+        self.executor = executor
+        self.queue = queue
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.poll_interval = poll_interval_sec
+        self.heartbeat_interval = heartbeat_interval_sec
+        self.stale_job_minutes = stale_job_minutes
+        self.stale_running_minutes = stale_running_minutes
+        self.stop_event = threading.Event()
+
+    @classmethod
+    def from_settings(cls, executor, settings: Dict[str, Any], worker_id: Optional[str] = None) -> 'JobWorker':
+        """
+        設定（config/settings.json の worker / schedule.stale_running_minutes）から生成
+        """
+        config = settings.get('worker', {})
+        return cls(
+            executor,
+            JobQueue(executor.db_manager, lock=executor.db_lock),
+            worker_id=worker_id,
+            poll_interval_sec=config.get('poll_interval_sec', 2),
+            heartbeat_interval_sec=config.get('heartbeat_interval_sec', 30),
+            stale_job_minutes=config.get('stale_job_minutes', 10),
+            stale_running_minutes=settings.get('schedule', {}).get('stale_running_minutes', 120)
+        )
+
+    def run_forever(self):
+        """
+        停止されるまでジョブを実行し続ける
+        """
+        print(f"[JobWorker] ワーカーを開始しました: {self.worker_id}")
+        while not self.stop_event.is_set():
+            try:
+                processed = self.run_once()
+            except Exception as e:
+                # DBの一時的なエラー等でワーカーを止めない
+                print(f"[JobWorker] ジョブの取得に失敗しました: {e}")
+                processed = False
+
+            if not processed:
+                self.stop_event.wait(self.poll_interval)
+        print(f"[JobWorker] ワーカーを停止しました: {self.worker_id}")
+
+    def run_once(self) -> bool:
+        """
+        待機中のジョブを1件実行
+
+        Returns:
+            ジョブを実行した場合True
+        """
+        for execution_id in self.queue.recover_stale(self.stale_job_minutes):
+            print(f"[JobWorker] 応答のないワーカーのジョブを解放しました: {execution_id}")
+
+        job = self.queue.claim(self.worker_id)
+        if job is None:
+            return False
+
+        # ジョブキューを経由しない実行と重複させない（同じ秒に開始すると実行IDも衝突する）
+        running = self.queue.running_execution(self.stale_running_minutes)
+        if running and running['id'] != job['execution_id']:
+            message = f"他の実行（{running['id']}）が実行中のため実行できませんでした"
+            print(f"[JobWorker] {message}: {job['execution_id']}")
+            self.queue.finish(job['id'], 'failed', message)
+            return True
+
+        self.run_job(job)
+        return True
+
+    def run_job(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        ジョブを実行し、結果をキューに記録
+
+        Args:
+            job: ジョブの辞書
+
+        Returns:
+            実行結果の辞書
+        """
+        execution_id = job['execution_id']
+        print(f"[JobWorker] ジョブ開始: {job['kind']} {execution_id}")
+
+        heartbeat_stop = threading.Event()
+        heartbeat_thread = threading.Thread(
+            target=self._heartbeat, args=(job['id'], heartbeat_stop), daemon=True
+        )
+        heartbeat_thread.start()
+
+        try:
+            if job['kind'] == 'resume':
+                result = self.executor.resume(execution_id)
+            else:
+                result = self.executor.execute(
+                    streaming=job['params'].get('stream'),
+                    sources=job['params'].get('sources'),
+                    execution_id=execution_id
+                )
+        except Exception as e:
+            result = {'status': 'failed', 'error': str(e), 'message': '実行できませんでした'}
+        finally:
+            heartbeat_stop.set()
+            heartbeat_thread.join()
+
+        if result['status'] == 'failed':
+            self.queue.finish(job['id'], 'failed', result.get('error') or result.get('message'))
+        else:
+            self.queue.finish(job['id'], 'done')
+        print(f"[JobWorker] ジョブ終了: {execution_id} ({result['status']}: {result.get('message')})")
+        return result
+
+    def stop(self):
+        """
+        ワーカーを停止（実行中のジョブは完了を待つ）
+        """
+        self.stop_event.set()
+
+    def _heartbeat(self, job_id: int, stop_event: threading.Event):
+        """
+        ジョブの実行中、一定間隔で応答を記録
+        """
+        while not stop_event.wait(self.heartbeat_interval):
+            try:
+                self.queue.heartbeat(job_id)
+            except Exception as e:
+                print(f"[JobWorker] 応答の記録に失敗しました: {e}")
@@ -0,0 +1,317 @@
+"""
+Claude Message Batches判定処理クラス
+Anthropic Message Batches APIを使用して大量のアイテムを非同期で判定する
+（バックフィルやプロンプト変更後の再判定用）
+"""
+import os
+import json
+import time
+from typing import List, Dict, Any, Callable, Optional
+
+import requests
+
+from src.utils.prompt_manager import PromptManager
+from src.utils.config_service import SETTINGS_PATH
+from .claude_processor import ClaudeProcessor
+
+
+class ClaudeBatchProcessor(ClaudeProcessor):
+    """
+    Message Batches APIで一括判定するプロセッサー
+
+    判定プロンプト・レスポンスのパース・フィルタリングは ClaudeProcessor と共通。
+    バッチで失敗したリクエスト（errored / expired・パースできない結果）は、
+    claude.batch.fallback_to_direct が有効な場合に通常のAPI呼び出しで判定し直す。
+    ANTHROPIC_BASE_URL を設定するとローカルのスタブサーバーに向けられる
+    （scripts/batch_stub_server.py）。
+    """
+
+    API_VERSION = '2023-06-01'
+
+    def __init__(
+        self,
+        prompt_manager: PromptManager,
+        settings_path: str = SETTINGS_PATH,
+        base_url: Optional[str] = None
+    ):
+        """
+        初期化
+
+        Args:
+            prompt_manager: プロンプトマネージャー
+            settings_path: 設定ファイルのパス
+            base_url: APIのベースURL（省略時は ANTHROPIC_BASE_URL または公式エンドポイント）
+        """
+        super().__init__(prompt_manager, settings_path)
+
+        # バッチ設定
+        batch_settings = self.claude_settings.get('batch', {})
+        self.items_per_request = batch_settings.get('items_per_request', 10)
+        self.max_requests_per_batch = batch_settings.get('max_requests_per_batch', 1000)
+        self.poll_interval_sec = batch_settings.get('poll_interval_sec', 30)
+        self.timeout_sec = batch_settings.get('timeout_hours', 24) * 3600
+        self.fallback_to_direct = batch_settings.get('fallback_to_direct', True)
+
+        self.base_url = (
+            base_url or os.getenv('ANTHROPIC_BASE_URL', 'https://api.anthropic.com')
+        ).rstrip('/')
+
+        # HTTPセッション（接続を使い回す）
+        self.http = requests.Session()
+        self.http.headers.update({
+            'x-api-key': os.getenv('CLAUDE_API_KEY'),
+            'anthropic-version': self.API_VERSION,
+            'content-type': 'application/json'
+        })
+
+    def judge_items_in_batches(
+        self,
+        items: List[Dict[str, Any]],
+        on_results: Callable[[List[Dict[str, Any]], List[Dict[str, Any]]], None]
+    ) -> Dict[str, Any]:
+        """
+        アイテムをMessage Batchesで判定し、結果が届いたバッチから順にコールバックへ渡す
+
+        Args:
+            items: 判定対象のアイテムリスト
+            on_results: 判定結果を受け取るコールバック
+                on_results(判定結果をマージした全アイテム, フィルタを通過したアイテム)
+
+        Returns:
+            集計結果の辞書
+            {
+                "batches": 投入したバッチ数,
+                "requests": リクエスト数,
+                "judged": 判定できた件数,
+                "passed": フィルタを通過した件数,
+                "errored": 判定できなかったリクエスト数,
+                "fallback": バッチで失敗し、通常のAPI呼び出しで判定したリクエスト数,
+                "duration": 処理時間（秒）
+            }
+        """
+        summary = {
+            'batches': 0,
+            'requests': 0,
+            'judged': 0,
+            'passed': 0,
+            'errored': 0,
+            'fallback': 0,
+            'duration': 0.0
+        }
+
+        if not items:
+            print("[ClaudeBatchProcessor] 判定対象のアイテムがありません")
+            return summary
+
+        start_time = time.time()
+
+        # 1リクエストあたり items_per_request 件にまとめる
+        chunks: Dict[str, List[Dict[str, Any]]] = {}
+        for i in range(0, len(items), self.items_per_request):
+            custom_id = f"chunk-{i // self.items_per_request:06d}"
+            chunks[custom_id] = items[i:i + self.items_per_request]
+
+        custom_ids = list(chunks.keys())
+        summary['requests'] = len(custom_ids)
+
+        # バッチを投入
+        pending: List[str] = []
+        for i in range(0, len(custom_ids), self.max_requests_per_batch):
+            batch_ids = custom_ids[i:i + self.max_requests_per_batch]
+            batch = self._create_batch([
+                self._build_batch_request(custom_id, chunks[custom_id])
+                for custom_id in batch_ids
+            ])
+            pending.append(batch['id'])
+            print(f"[ClaudeBatchProcessor] バッチ投入: {batch['id']}（{len(batch_ids)} リクエスト）")
+
+        summary['batches'] = len(pending)
+
+        # 完了したバッチから結果を取り込む
+        while pending:
+            if time.time() - start_time > self.timeout_sec:
+                raise Exception(f"バッチ処理がタイムアウトしました: {', '.join(pending)}")
+
+            for batch_id in list(pending):
+                batch = self._get_batch(batch_id)
+                if batch.get('processing_status') != 'ended':
+                    continue
+
+                pending.remove(batch_id)
+                counts = batch.get('request_counts', {})
+                print(f"[ClaudeBatchProcessor] バッチ完了: {batch_id} {counts}")
+
+                judged, passed, errored, fallback = self._collect_batch_results(batch, chunks)
+                summary['judged'] += len(judged)
+                summary['passed'] += len(passed)
+                summary['errored'] += errored
+                summary['fallback'] += fallback
+
+                on_results(judged, passed)
+
+            if pending:
+                time.sleep(self.poll_interval_sec)
+
+        summary['duration'] = time.time() - start_time
+        print(
+            f"[ClaudeBatchProcessor] 判定完了: {len(items)} 件 -> "
+            f"{summary['passed']} 件（{summary['duration']:.2f}秒）"
+        )
+
+        return summary
+
+    def _build_batch_request(self, custom_id: str, items: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        バッチ内の1リクエストを構築
+
+        Args:
+            custom_id: リクエスト識別子
+            items: このリクエストで判定するアイテム
+
+        Returns:
+            Message Batches APIのリクエスト辞書
+        """
+        return {
+            'custom_id': custom_id,
+            'params': {
+                'model': self.model,
+                'max_tokens': self.max_tokens,
+                'system': self.judge_prompt,
+                'messages': [
+                    {
+                        'role': 'user',
+                        'content': self._build_user_prompt(items)
+                    }
+                ]
+            }
+        }
+
+    def _create_batch(self, batch_requests: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        バッチを作成
+
+        Args:
+            batch_requests: リクエストのリスト
+
+        Returns:
+            作成されたバッチ情報
+        """
+        try:
+            response = self.http.post(
+                f"{self.base_url}/v1/messages/batches",
+                json={'requests': batch_requests},
+                timeout=60
+            )
+            response.raise_for_status()
+            return response.json()
+        except requests.RequestException as e:
+            raise Exception(f"バッチの作成に失敗しました: {e}")
+
+    def _get_batch(self, batch_id: str) -> Dict[str, Any]:
+        """
+        バッチの状態を取得
+
+        Args:
+            batch_id: バッチID
+
+        Returns:
+            バッチ情報
+        """
+        try:
+            response = self.http.get(
+                f"{self.base_url}/v1/messages/batches/{batch_id}",
+                timeout=30
+            )
+            response.raise_for_status()
+            return response.json()
+        except requests.RequestException as e:
+            raise Exception(f"バッチの状態取得に失敗しました: {batch_id} ({e})")
+
+    def _collect_batch_results(
+        self,
+        batch: Dict[str, Any],
+        chunks: Dict[str, List[Dict[str, Any]]]
+    ):
+        """
+        完了したバッチの結果（JSONL）を読み込み、アイテムにマージする
+
+        Args:
+            batch: バッチ情報
+            chunks: custom_id -> アイテムリスト
+
+        Returns:
+            (判定結果をマージしたアイテム, フィルタ通過アイテム, 判定できなかったリクエスト数,
+             通常のAPI呼び出しで判定したリクエスト数)
+        """
+        results_url = batch.get('results_url') or f"{self.base_url}/v1/messages/batches/{batch['id']}/results"
+
+        try:
+            response = self.http.get(results_url, stream=True, timeout=60)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            raise Exception(f"バッチ結果の取得に失敗しました: {batch['id']} ({e})")
+
+        judged_items: List[Dict[str, Any]] = []
+        errored = 0
+        fallback = 0
+
+        for line in response.iter_lines(decode_unicode=True):
+            if not line:
+                continue
+
+            entry = json.loads(line)
+            custom_id = entry.get('custom_id')
+            result = entry.get('result', {})
+            chunk_items = chunks.get(custom_id)
+
+            if chunk_items is None:
+                print(f"[ClaudeBatchProcessor] 警告: 不明な custom_id です: {custom_id}")
+                continue
+
+            judgments = None
+            if result.get('type') != 'succeeded':
+                print(f"[ClaudeBatchProcessor] リクエスト失敗: {custom_id} ({result.get('type')}: {result.get('error')})")
+            else:
+                try:
+                    response_text = result['message']['content'][0]['text']
+                    judgments = self._parse_claude_response(response_text)
+                except Exception as e:
+                    print(f"[ClaudeBatchProcessor] 結果のパースに失敗: {custom_id} ({e})")
+
+            if judgments is None:
+                judgments = self._judge_directly(custom_id, chunk_items)
+                if judgments is None:
+                    errored += 1
+                    continue
+                fallback += 1
+
+            for judgment in judgments:
+                judgment['judge_tier'] = 'strong'
+            judged_items.extend(self._merge_judgments(chunk_items, judgments))
+
+        passed_items = self._filter_items(judged_items)
+
+        return judged_items, passed_items, errored, fallback
+
+    def _judge_directly(self, custom_id: str, items: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+        """
+        バッチで判定できなかったリクエストを通常のAPI呼び出しで判定
+
+        Args:
+            custom_id: リクエスト識別子
+            items: このリクエストで判定するアイテム
+
+        Returns:
+            判定結果のリスト（フォールバックが無効な場合・判定に失敗した場合はNone）
+        """
+        if not self.fallback_to_direct:
+            return None
+
+        try:
+            judgments = self._call_claude_api(items)
+        except Exception as e:
+            print(f"[ClaudeBatchProcessor] 通常のAPI呼び出しでも判定できませんでした: {custom_id} ({e})")
+            return None
+
+        print(f"[ClaudeBatchProcessor] 通常のAPI呼び出しで判定しました: {custom_id}（{len(items)} 件）")
+        return judgments
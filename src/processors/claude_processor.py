@@ -9,18 +9,24 @@ from typing import List, Dict, Any
 from anthropic import Anthropic
 from dotenv import load_dotenv
 
+from src.utils.keyword_matcher import KeywordMatcher
+from .local_classifier import LocalClassifier
 from src.utils.prompt_manager import PromptManager
+from src.utils.config_service import get_config_service, SETTINGS_PATH
 
 # 環境変数を読み込み
 load_dotenv()
 
+# 判定依頼に含める項目（canonical_key・cluster_id 等のパイプライン内部の項目はトークンの無駄になるため送らない）
+PROMPT_ITEM_FIELDS = ('title', 'content', 'source', 'url', 'published_at')
+
 
 class ClaudeProcessor:
     """
     Claude APIを使用して情報を判定するプロセッサー
     """
 
-    def __init__(self, prompt_manager: PromptManager, settings_path: str = 'config/settings.json'):
+    def __init__(self, prompt_manager: PromptManager, settings_path: str = SETTINGS_PATH):
         """
         初期化
 
@@ -39,14 +45,48 @@ class ClaudeProcessor:
         # Anthropic クライアントを初期化
         self.client = Anthropic(api_key=api_key)
 
-        # Judge Agentプロンプトを読み込み（設定埋め込み済み）
-        self.judge_prompt = self.prompt_manager.load_judge_prompt_with_settings(
-            settings_path
-        )
+        # Judge Agentプロンプトを読み込み（設定埋め込み済み。以降は judge_prompt で最新のものを取得する）
+        self.prompt_manager.load_judge_prompt_with_settings(settings_path)
+
+        # 設定から作る判定条件（設定ファイルが編集されると refresh_settings で作り直す）
+        self.settings_version = None
+        self.local_classifier = None
+        self._classifier_settings = None
+        self.refresh_settings()
+
+        # 直近の判定結果（フィルタ前、判定履歴の保存用）
+        self.last_judged_items: List[Dict[str, Any]] = []
+
+    def refresh_settings(self) -> bool:
+        """
+        設定ファイルが編集されていれば、設定から作った判定条件を作り直す
+
+        フィルタリング条件・キーワードマッチャー・モデル・ティア判定・境界のスコアを作り直す。
+        ローカル分類器は local_classifier の設定が変わった場合のみ読み込み直す。
+        不正な編集は ConfigService が無視するため、直前の正しい設定のまま判定を続ける。
+
+        Returns:
+            作り直した場合True
+        """
+        config = get_config_service()
+        version = config.version(self.settings_path)
+        if version == self.settings_version:
+            return False
+
+        if self.settings_version is not None:
+            print(f"[ClaudeProcessor] 設定ファイルの変更を反映します: {self.settings_path}")
+        self._apply_settings(config.get_json(self.settings_path))
+        self.settings_version = version
+        return True
+
+    def _apply_settings(self, settings: Dict[str, Any]):
+        """
+        設定から判定条件を作る
 
-        # 設定を読み込み
-        with open(settings_path, 'r', encoding='utf-8') as f:
-            self.settings = json.load(f)
+        Args:
+            settings: 設定（config/settings.json の内容）
+        """
+        self.settings = settings
 
         # フィルタリング条件
         self.filtering = self.settings.get('filtering', {})
@@ -54,6 +94,56 @@ class ClaudeProcessor:
         self.min_importance_score = self.filtering.get('min_importance_score', 0)
         self.excluded_keywords = self.filtering.get('excluded_keywords', [])
 
+        # 除外・重要度キーワードのマッチャー（設定が変わるまで使い回す）
+        self.keyword_matcher = KeywordMatcher.from_settings(self.settings)
+
+        # Claude API設定
+        self.claude_settings = self.settings.get('claude', {})
+        self.model = self.claude_settings.get('model', 'claude-sonnet-4-20250514')
+        self.max_tokens = self.claude_settings.get('max_tokens', 4096)
+
+        # ティア判定設定（高速モデルで一次判定し、境界付近のみ上位モデルへ）
+        tiered = self.claude_settings.get('tiered', {})
+        self.tiered_enabled = tiered.get('enabled', False)
+        self.fast_model = tiered.get('fast_model', 'claude-3-5-haiku-20241022')
+        self.uncertainty_band = tiered.get('uncertainty_band', 10)
+
+        # ローカル分類器（確信度の高いアイテムはClaudeに送らない）
+        classifier_settings = self.settings.get('local_classifier', {})
+        self.local_confidence = classifier_settings.get('confidence', 0.95)
+        if classifier_settings != self._classifier_settings:
+            self._classifier_settings = classifier_settings
+            self.local_classifier = None
+            if classifier_settings.get('enabled', False):
+                self.local_classifier = LocalClassifier.load_latest(
+                    classifier_settings.get('model_dir', 'models/local_classifier')
+                )
+                if self.local_classifier:
+                    print(f"[ClaudeProcessor] ローカル分類器 {self.local_classifier.version} を使用します")
+
+        # 境界となるスコア（この前後 uncertainty_band 以内は判定が揺れやすい）
+        criteria = self.settings.get('judgment_criteria', {})
+        self.relevance_thresholds = sorted({
+            criteria.get('relevance_threshold', self.min_relevance_score),
+            self.min_relevance_score
+        })
+        importance_thresholds = {
+            level.get('score_range', [0])[0]
+            for level in criteria.get('importance_levels', {}).values()
+        }
+        importance_thresholds.add(self.min_importance_score)
+        self.importance_thresholds = sorted(t for t in importance_thresholds if t > 0)
+
+    @property
+    def judge_prompt(self) -> str:
+        """
+        Judge Agentプロンプト（設定埋め込み済み）
+
+        プロンプト・設定ファイルを編集すると、常駐プロセス（ワーカー等）でも再起動せずに次の判定から反映される
+        （設定から作る判定条件は refresh_settings で作り直す）。
+        """
+        return self.prompt_manager.load_judge_prompt_with_settings(self.settings_path)
+
     def judge_items(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         収集した情報を一括で判定
@@ -69,16 +159,33 @@ class ClaudeProcessor:
             print("[ClaudeProcessor] 判定対象のアイテムがありません")
             return []
 
+        # 常駐プロセス（ワーカー等）でも、編集された設定を次の判定から反映する
+        self.refresh_settings()
+
         print(f"[ClaudeProcessor] {len(items)} 件のアイテムを判定中...")
 
         start_time = time.time()
 
         try:
+            # ローカル分類器で確信度の高いものを先に判定
+            judgments = []
+            claude_items = items
+            if self.local_classifier:
+                judgments, claude_items = self.local_classifier.split(items, self.local_confidence)
+                print(f"[ClaudeProcessor] ローカル分類器で {len(judgments)} 件を判定、{len(claude_items)} 件をClaudeへ")
+
             # Claude APIで判定
-            judgments = self._call_claude_api(items)
+            if claude_items and self.tiered_enabled:
+                judgments.extend(self._judge_tiered(claude_items))
+            elif claude_items:
+                claude_judgments = self._call_claude_api(claude_items)
+                for judgment in claude_judgments:
+                    judgment['judge_tier'] = 'strong'
+                judgments.extend(claude_judgments)
 
             # 判定結果をアイテムにマージ
             judged_items = self._merge_judgments(items, judgments)
+            self.last_judged_items = judged_items
 
             # フィルタリング
             filtered_items = self._filter_items(judged_items)
@@ -93,34 +200,97 @@ class ClaudeProcessor:
             print(f"[ClaudeProcessor] 判定中にエラー: {e}")
             raise
 
-    def _call_claude_api(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _judge_tiered(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
-        Claude APIを呼び出して判定を取得
+        高速モデルで全件を一次判定し、境界付近のアイテムのみ上位モデルで再判定
 
         Args:
             items: 収集した情報のリスト
 
         Returns:
-            判定結果のリスト
+            判定結果のリスト（各判定に judge_tier を付与）
         """
-        # アイテムをJSON形式で整形
-        items_json = json.dumps(items, ensure_ascii=False, indent=2)
+        try:
+            fast_judgments = self._call_claude_api(items, model=self.fast_model)
+        except Exception as e:
+            # 一次判定に失敗した場合は全件を上位モデルで判定
+            print(f"[ClaudeProcessor] 高速モデルでの判定に失敗したため上位モデルで判定します: {e}")
+            fast_judgments = []
+
+        fast_by_url = {j.get('url'): j for j in fast_judgments if j.get('url')}
+
+        # 判定結果がない・境界付近のアイテムを上位モデルへ
+        escalated = [
+            item for item in items
+            if item.get('url') not in fast_by_url
+            or self._is_borderline(fast_by_url[item.get('url')])
+        ]
+
+        strong_by_url = {}
+        if escalated:
+            print(f"[ClaudeProcessor] {len(escalated)}/{len(items)} 件を上位モデルで再判定します")
+            strong_judgments = self._call_claude_api(escalated)
+            strong_by_url = {j.get('url'): j for j in strong_judgments if j.get('url')}
+
+        judgments = []
+        for item in items:
+            url = item.get('url')
+            if url in strong_by_url:
+                judgment = strong_by_url[url]
+                judgment['judge_tier'] = 'strong'
+            elif url in fast_by_url:
+                judgment = fast_by_url[url]
+                judgment['judge_tier'] = 'fast'
+            else:
+                continue
+            judgments.append(judgment)
 
-        # ユーザープロンプトを構築
-        user_prompt = f"""
-以下の情報について、関連性・重要度を判定してください。
+        return judgments
 
-【収集した情報】
-{items_json}
+    def _is_borderline(self, judgment: Dict[str, Any]) -> bool:
+        """
+        判定結果のスコアが閾値の不確実帯に入っているかチェック
 
-各情報について、判定結果をJSON配列形式で返してください。
-"""
+        Args:
+            judgment: 判定結果
+
+        Returns:
+            境界付近（上位モデルで再判定すべき）の場合True
+        """
+        relevance_score = judgment.get('relevance_score')
+        importance_score = judgment.get('importance_score')
+
+        # スコアが欠けている判定は信頼できない
+        if not isinstance(relevance_score, (int, float)) or not isinstance(importance_score, (int, float)):
+            return True
+
+        if any(abs(relevance_score - t) < self.uncertainty_band for t in self.relevance_thresholds):
+            return True
+
+        # 関連性が明らかに低いものは重要度に関わらず除外されるため再判定不要
+        if relevance_score < min(self.relevance_thresholds):
+            return False
+
+        return any(abs(importance_score - t) < self.uncertainty_band for t in self.importance_thresholds)
+
+    def _call_claude_api(self, items: List[Dict[str, Any]], model: str = None) -> List[Dict[str, Any]]:
+        """
+        Claude APIを呼び出して判定を取得
+
+        Args:
+            items: 収集した情報のリスト
+            model: 使用するモデル（省略時は設定の上位モデル）
+
+        Returns:
+            判定結果のリスト
+        """
+        user_prompt = self._build_user_prompt(items)
 
         try:
             # Claude APIを呼び出し
             message = self.client.messages.create(
-                model="claude-sonnet-4-20250514",  # 最新のSonnet 4モデル
-                max_tokens=4096,
+                model=model or self.model,
+                max_tokens=self.max_tokens,
                 system=self.judge_prompt,
                 messages=[
                     {
@@ -141,6 +311,42 @@ class ClaudeProcessor:
         except Exception as e:
             raise Exception(f"Claude API呼び出しに失敗しました: {e}")
 
+    def _build_user_prompt(self, items: List[Dict[str, Any]]) -> str:
+        """
+        判定依頼のユーザープロンプトを構築
+
+        Args:
+            items: 収集した情報のリスト
+
+        Returns:
+            ユーザープロンプト文字列
+        """
+        # 検出した重要度キーワードを判定のヒントとして添える
+        prompt_items = []
+        for item in items:
+            prompt_item = {field: item.get(field) for field in PROMPT_ITEM_FIELDS}
+            matches = self.keyword_matcher.scan(item.get('title') or '', item.get('content') or '')
+            hints = {
+                level: sorted(keywords)
+                for level, keywords in matches.items()
+                if level != 'excluded'
+            }
+            if hints:
+                prompt_item['keyword_hints'] = hints
+            prompt_items.append(prompt_item)
+
+        # アイテムをJSON形式で整形
+        items_json = json.dumps(prompt_items, ensure_ascii=False, indent=2)
+
+        return f"""
+以下の情報について、関連性・重要度を判定してください。
+
+【収集した情報】
+{items_json}
+
+各情報について、判定結果をJSON配列形式で返してください。
+"""
+
     def _parse_claude_response(self, response_text: str) -> List[Dict[str, Any]]:
         """
         Claudeのレスポンスから判定結果をパース
@@ -217,6 +423,7 @@ class ClaudeProcessor:
                 item['category'] = judgment.get('category')
                 item['summary'] = judgment.get('summary')
                 item['claude_reason'] = judgment.get('claude_reason')
+                item['judge_tier'] = judgment.get('judge_tier')
 
                 merged_items.append(item)
             else:
@@ -251,9 +458,8 @@ class ClaudeProcessor:
             # 除外キーワードチェック
             content = item.get('content', '') or ''
             title = item.get('title', '') or ''
-            full_text = f"{title} {content}"
 
-            if any(keyword in full_text for keyword in self.excluded_keywords):
+            if 'excluded' in self.keyword_matcher.matched_classes(title, content):
                 print(f"[ClaudeProcessor] 除外キーワードを含むため除外: {item.get('url')}")
                 continue
 
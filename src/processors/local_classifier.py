@@ -0,0 +1,372 @@
+"""
+ローカル関連性分類器
+過去のClaude判定結果で学習した軽量モデル（文字n-gram TF-IDF + 線形モデル）で、
+確信度の高いアイテムをClaudeに送らずに判定する
+
+scikit-learn が必要（未インストールの場合は無効になり、全件をClaudeで判定する）。
+"""
+import os
+import json
+import random
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Tuple
+
+try:
+    import joblib
+    import numpy as np
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.linear_model import LogisticRegression, Ridge
+    SKLEARN_AVAILABLE = True
+except ImportError:
+    SKLEARN_AVAILABLE = False
+
+from src.utils.text_normalizer import normalize_text
+
+MODEL_FILENAME = 'model.joblib'
+REPORT_FILENAME = 'report.json'
+LATEST_FILENAME = 'LATEST'
+
+
+def build_text(item: Dict[str, Any]) -> str:
+    """
+    分類器への入力テキストを構築（ソース + タイトル + 本文）
+
+    Args:
+        item: アイテム
+
+    Returns:
+        正規化済みテキスト
+    """
+    return normalize_text(
+        f"[{item.get('source') or ''}]{item.get('title') or ''} {item.get('content') or ''}"
+    )
+
+
+class LocalClassifier:
+    """
+    Claude判定を模倣するローカル分類器
+
+    - relevant: 関連性スコアが閾値以上か（二値分類）
+    - importance_level / category: 多クラス分類
+    - relevance_score / importance_score: 回帰
+    """
+
+    def __init__(self, version: str, vectorizer, heads: Dict[str, Any], metadata: Dict[str, Any]):
+        """
+        初期化
+
+        Args:
+            version: モデルバージョン（例: v0003）
+            vectorizer: 学習済みTF-IDFベクトライザー
+            heads: 学習済みの各推定器
+            metadata: 学習時の設定（閾値・スコア範囲など）
+        """
+        self.version = version
+        self.vectorizer = vectorizer
+        self.heads = heads
+        self.metadata = metadata
+
+    @classmethod
+    def train(cls, samples: List[Dict[str, Any]], settings: Dict[str, Any], version: str) -> 'LocalClassifier':
+        """
+        判定結果のサンプルから分類器を学習
+
+        Args:
+            samples: 判定済みアイテムのリスト（relevance_score等を含む）
+            settings: 設定辞書（config/settings.json）
+            version: モデルバージョン
+
+        Returns:
+            学習済みの LocalClassifier
+
+        Raises:
+            ValueError: 学習データが不足している場合
+        """
+        if not SKLEARN_AVAILABLE:
+            raise ValueError("scikit-learn がインストールされていません")
+
+        threshold = settings.get('filtering', {}).get('min_relevance_score', 30)
+        importance_levels = settings.get('judgment_criteria', {}).get('importance_levels', {})
+
+        texts = [build_text(s) for s in samples]
+        relevant = [int((s.get('relevance_score') or 0) >= threshold) for s in samples]
+
+        if len(set(relevant)) < 2:
+            raise ValueError("関連あり/なしの両方の判定結果が必要です（judgmentsテーブルの蓄積を待ってください）")
+
+        vectorizer = TfidfVectorizer(
+            analyzer='char',
+            ngram_range=(2, 4),
+            min_df=2 if len(samples) >= 50 else 1,
+            max_features=100000,
+            sublinear_tf=True
+        )
+        X = vectorizer.fit_transform(texts)
+
+        heads = {
+            'relevant': LogisticRegression(max_iter=1000, class_weight='balanced').fit(X, relevant),
+            'relevance_score': Ridge(alpha=1.0).fit(X, [s.get('relevance_score') or 0 for s in samples]),
+        }
+
+        # 重要度・カテゴリは関連ありのアイテムのみで学習
+        positive = [i for i, r in enumerate(relevant) if r]
+        X_pos = X[positive]
+        for field in ('importance_level', 'category'):
+            labels = [samples[i].get(field) or '' for i in positive]
+            if len(set(labels)) >= 2:
+                heads[field] = LogisticRegression(max_iter=1000).fit(X_pos, labels)
+        heads['importance_score'] = Ridge(alpha=1.0).fit(
+            X_pos, [samples[i].get('importance_score') or 0 for i in positive]
+        )
+
+        metadata = {
+            'relevance_threshold': threshold,
+            'score_ranges': {
+                level: values.get('score_range', [0, 100])
+                for level, values in importance_levels.items()
+            },
+            'trained_at': datetime.now().isoformat(),
+            'samples': len(samples),
+        }
+
+        return cls(version, vectorizer, heads, metadata)
+
+    @classmethod
+    def load_latest(cls, model_dir: str) -> Optional['LocalClassifier']:
+        """
+        最新バージョンのモデルを読み込む
+
+        Args:
+            model_dir: モデル保存ディレクトリ
+
+        Returns:
+            LocalClassifier（モデルがない・scikit-learnがない場合はNone）
+        """
+        if not SKLEARN_AVAILABLE:
+            return None
+
+        latest_path = os.path.join(model_dir, LATEST_FILENAME)
+        if not os.path.exists(latest_path):
+            return None
+
+        with open(latest_path, 'r', encoding='utf-8') as f:
+            version = f.read().strip()
+
+        payload = joblib.load(os.path.join(model_dir, version, MODEL_FILENAME))
+        return cls(version, payload['vectorizer'], payload['heads'], payload['metadata'])
+
+    @staticmethod
+    def next_version(model_dir: str) -> str:
+        """
+        次のモデルバージョン名を決定（v0001, v0002, ...）
+        """
+        existing = []
+        if os.path.isdir(model_dir):
+            for name in os.listdir(model_dir):
+                if name.startswith('v') and name[1:].isdigit():
+                    existing.append(int(name[1:]))
+        return f"v{max(existing, default=0) + 1:04d}"
+
+    def save(self, model_dir: str, report: Dict[str, Any] = None, promote: bool = True) -> str:
+        """
+        モデルをバージョン付きディレクトリに保存
+
+        Args:
+            model_dir: モデル保存ディレクトリ
+            report: 評価レポート
+            promote: LATEST をこのバージョンに更新するか
+
+        Returns:
+            保存先ディレクトリ
+        """
+        version_dir = os.path.join(model_dir, self.version)
+        os.makedirs(version_dir, exist_ok=True)
+
+        joblib.dump(
+            {'vectorizer': self.vectorizer, 'heads': self.heads, 'metadata': self.metadata},
+            os.path.join(version_dir, MODEL_FILENAME)
+        )
+
+        if report is not None:
+            with open(os.path.join(version_dir, REPORT_FILENAME), 'w', encoding='utf-8') as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+
+        if promote:
+            with open(os.path.join(model_dir, LATEST_FILENAME), 'w', encoding='utf-8') as f:
+                f.write(self.version)
+
+        return version_dir
+
+    def predict(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        アイテムの判定結果と確信度を推定
+
+        Args:
+            items: アイテムリスト
+
+        Returns:
+            推定結果のリスト（items と同順）
+            {
+                "url", "relevant", "relevance_score", "importance_score",
+                "importance_level", "category", "confidence"
+            }
+        """
+        if not items:
+            return []
+
+        X = self.vectorizer.transform([build_text(item) for item in items])
+
+        p_relevant = self.heads['relevant'].predict_proba(X)[:, list(self.heads['relevant'].classes_).index(1)]
+        relevance_scores = np.clip(self.heads['relevance_score'].predict(X), 0, 100)
+        importance_scores = np.clip(self.heads['importance_score'].predict(X), 0, 100)
+
+        label_predictions = {}
+        for field in ('importance_level', 'category'):
+            head = self.heads.get(field)
+            if head is None:
+                continue
+            proba = head.predict_proba(X)
+            label_predictions[field] = (head.classes_[proba.argmax(axis=1)], proba.max(axis=1))
+
+        threshold = self.metadata['relevance_threshold']
+        predictions = []
+        for i, item in enumerate(items):
+            relevant = bool(p_relevant[i] >= 0.5)
+            relevance_score = int(round(relevance_scores[i]))
+            confidence = float(max(p_relevant[i], 1 - p_relevant[i]))
+
+            prediction = {'url': item.get('url'), 'relevant': relevant}
+
+            if not relevant:
+                # 関連なしと判定した場合は必ず閾値未満のスコアにする
+                prediction['relevance_score'] = min(relevance_score, threshold - 1)
+                prediction['importance_score'] = 0
+                prediction['importance_level'] = 'low'
+                prediction['category'] = None
+            else:
+                prediction['relevance_score'] = max(relevance_score, threshold)
+                for field, (labels, probs) in label_predictions.items():
+                    prediction[field] = labels[i]
+                    confidence = min(confidence, float(probs[i]))
+                if 'importance_level' not in prediction or 'category' not in prediction:
+                    confidence = 0.0
+
+                # 重要度スコアを予測したレベルのスコア範囲に収める
+                low, high = self.metadata['score_ranges'].get(prediction.get('importance_level'), [0, 100])
+                prediction['importance_score'] = int(min(max(round(importance_scores[i]), low), high))
+
+            prediction['confidence'] = confidence
+            predictions.append(prediction)
+
+        return predictions
+
+    def split(
+        self,
+        items: List[Dict[str, Any]],
+        confidence: float
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        確信度の高いアイテムをローカルで判定し、残りをClaude判定用に分ける
+
+        Args:
+            items: アイテムリスト
+            confidence: 自動判定に必要な確信度（0-1）
+
+        Returns:
+            (ローカルの判定結果リスト, Claudeで判定するアイテムリスト)
+        """
+        judgments = []
+        uncertain_items = []
+
+        for item, prediction in zip(items, self.predict(items)):
+            if prediction['confidence'] < confidence:
+                uncertain_items.append(item)
+                continue
+
+            summary = (item.get('title') or item.get('content') or '')[:50]
+            judgments.append({
+                'url': prediction['url'],
+                'relevance_score': prediction['relevance_score'],
+                'importance_score': prediction['importance_score'],
+                'importance_level': prediction['importance_level'],
+                'category': prediction['category'],
+                'summary': summary,
+                'claude_reason': f"ローカル分類器 {self.version} による自動判定（確信度 {prediction['confidence']:.2f}）",
+                'judge_tier': 'local'
+            })
+
+        return judgments, uncertain_items
+
+    def evaluate(self, samples: List[Dict[str, Any]], confidence: float) -> Dict[str, Any]:
+        """
+        Claude判定との一致率を評価
+
+        Args:
+            samples: 評価用の判定済みアイテム
+            confidence: 自動判定に使う確信度
+
+        Returns:
+            評価レポートの辞書
+        """
+        threshold = self.metadata['relevance_threshold']
+        predictions = self.predict(samples)
+
+        def agreement(pairs):
+            pairs = list(pairs)
+            return round(sum(1 for a, b in pairs if a == b) / len(pairs), 4) if pairs else None
+
+        relevant_pairs = [
+            (p['relevant'], (s.get('relevance_score') or 0) >= threshold)
+            for s, p in zip(samples, predictions)
+        ]
+        positive = [
+            (s, p) for s, p in zip(samples, predictions)
+            if (s.get('relevance_score') or 0) >= threshold and p['relevant']
+        ]
+        confident = [
+            (s, p) for s, p in zip(samples, predictions) if p['confidence'] >= confidence
+        ]
+
+        return {
+            'version': self.version,
+            'samples': len(samples),
+            'relevant_agreement': agreement(relevant_pairs),
+            'importance_level_agreement': agreement(
+                (p.get('importance_level'), s.get('importance_level')) for s, p in positive
+            ),
+            'category_agreement': agreement(
+                (p.get('category'), s.get('category')) for s, p in positive
+            ),
+            'relevance_score_mae': round(
+                sum(abs(p['relevance_score'] - (s.get('relevance_score') or 0)) for s, p in zip(samples, predictions))
+                / len(samples), 2
+            ) if samples else None,
+            'confidence_threshold': confidence,
+            'auto_decided_ratio': round(len(confident) / len(samples), 4) if samples else None,
+            'auto_decided_agreement': agreement(
+                (
+                    (p['relevant'], p.get('importance_level'), p.get('category')) if p['relevant'] else (False,),
+                    (True, s.get('importance_level'), s.get('category'))
+                    if (s.get('relevance_score') or 0) >= threshold else (False,)
+                )
+                for s, p in confident
+            ),
+        }
+
+
+def train_test_split(samples: List[Dict[str, Any]], test_ratio: float = 0.2, seed: int = 42):
+    """
+    サンプルを学習用と評価用に分割
+
+    Args:
+        samples: サンプルリスト
+        test_ratio: 評価用の割合
+        seed: 乱数シード
+
+    Returns:
+        (学習用リスト, 評価用リスト)
+    """
+    shuffled = list(samples)
+    random.Random(seed).shuffle(shuffled)
+    test_size = max(1, int(len(shuffled) * test_ratio))
+    return shuffled[test_size:], shuffled[:test_size]
@@ -0,0 +1,344 @@
+"""
+近似重複クラスタリング
+SimHash + LSHバケットで同じニュースの記事・投稿（転載・引用・RT）をまとめ、
+代表1件だけをClaudeで判定して結果をクラスタ内に伝播する
+
+保存済みのアイテム（および同じ実行の先に判定したバッチ）のSimHashも照合し、
+その近似重複は判定せずに既存のクラスタへ加える。
+"""
+import re
+import hashlib
+from typing import List, Dict, Any, Iterable, Optional, Tuple
+
+from src.utils.text_normalizer import normalize_text
+
+# 判定結果として伝播する項目
+JUDGMENT_FIELDS = (
+    'relevance_score',
+    'importance_score',
+    'importance_level',
+    'category',
+    'summary',
+    'claude_reason',
+    'judge_tier',
+)
+
+# 代表に選ぶソースの優先順位（一次情報に近いものを優先）
+SOURCE_PRIORITY = {
+    'yahoo_news': 0,
+    'modelpress': 1,
+    'twitter': 2,
+}
+
+RETWEET_PREFIX = re.compile(r'^RT @\w+:?\s*')
+URL_PATTERN = re.compile(r'https?://\S+')
+
+
+class NearDuplicateClusterer:
+    """
+    SimHashによる近似重複クラスタリング
+    """
+
+    def __init__(
+        self,
+        shingle_size: int = 3,
+        bands: int = 8,
+        max_hamming_distance: int = 10,
+        min_text_length: int = 20,
+        lookback_days: int = 7
+    ):
+        """
+        初期化
+
+        Args:
+            shingle_size: 文字n-gramの長さ
+            bands: LSHのバンド数（64bitを等分する。いずれかのバンドが一致した組のみ比較する）
+            max_hamming_distance: 近似重複とみなすSimHashのハミング距離
+                （短いニュース本文の転載・引用は概ね10以内、別の記事は25以上になる）
+            min_text_length: クラスタリング対象とする最小文字数（短文は誤結合しやすいため対象外）
+            lookback_days: 照合する保存済みアイテムの期間（公開日時から何日以内か）
+        """
+        self.shingle_size = shingle_size
+        self.bands = bands
+        self.band_bits = 64 // bands
+        self.max_hamming_distance = max_hamming_distance
+        self.min_text_length = min_text_length
+        self.lookback_days = lookback_days
+
+        # 判定済みアイテムの索引（reset_index で保存済みアイテムから作り、remember で追加する）
+        self._known: List[Dict[str, Any]] = []
+        self._known_buckets: Dict[Tuple[int, int], List[int]] = {}
+
+    @classmethod
+    def from_settings(cls, settings: Dict[str, Any]) -> 'NearDuplicateClusterer':
+        """
+        設定（config/settings.json の dedup.near_duplicate）から生成
+        """
+        config = settings.get('dedup', {}).get('near_duplicate', {})
+        return cls(
+            shingle_size=config.get('shingle_size', 3),
+            bands=config.get('bands', 8),
+            max_hamming_distance=config.get('max_hamming_distance', 10),
+            min_text_length=config.get('min_text_length', 20),
+            lookback_days=config.get('lookback_days', 7)
+        )
+
+    def reset_index(self, stored_items: Iterable[Dict[str, Any]]):
+        """
+        判定済みアイテムの索引を保存済みアイテムから作り直す（実行の開始時に呼ぶ）
+
+        Args:
+            stored_items: 保存済みアイテム（url, simhash, cluster_id と判定結果の項目を持つ辞書）
+        """
+        self._known = []
+        self._known_buckets = {}
+        for item in stored_items:
+            self._add_known(item, item.get('simhash'), owner=None)
+
+    def remember(self, judged_items: List[Dict[str, Any]]):
+        """
+        判定済み（フィルタ通過）のアイテムを索引に加える
+        （ストリーミング実行で、後のバッチのアイテムを先のバッチのクラスタに加えられるようにする）
+
+        Args:
+            judged_items: 判定済みのアイテムリスト
+        """
+        for item in judged_items:
+            self._add_known(item, self._fingerprint(item), owner=item)
+
+    def match_known(
+        self,
+        items: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        判定済みアイテムの近似重複を取り出し、判定結果とクラスタIDを引き継ぐ
+
+        引き継いだアイテムには cluster_anchor_url（クラスタIDを付ける保存済みアイテムのURL）を付与する。
+
+        Args:
+            items: アイテムリスト
+
+        Returns:
+            (判定が必要なアイテムリスト, 判定結果を引き継いだアイテムリスト)
+        """
+        remaining = []
+        matched = []
+
+        for item in items:
+            entry = self._find_known(self._fingerprint(item))
+            if entry is None:
+                remaining.append(item)
+                continue
+
+            if not entry['cluster_id']:
+                entry['cluster_id'] = self._cluster_id(entry['url'])
+                if entry['owner'] is not None:
+                    # 同じ実行で判定したアイテム（未保存の場合は保存時にクラスタIDが付く）
+                    entry['owner']['cluster_id'] = entry['cluster_id']
+
+            for field in JUDGMENT_FIELDS:
+                item[field] = entry['judgment'].get(field)
+            item['cluster_id'] = entry['cluster_id']
+            item['cluster_anchor_url'] = entry['url']
+            matched.append(item)
+
+        return remaining, matched
+
+    def cluster(
+        self,
+        items: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, List[Dict[str, Any]]]]:
+        """
+        アイテムを近似重複クラスタにまとめる
+
+        複数件からなるクラスタの全アイテムに cluster_id を付与する。
+
+        Args:
+            items: アイテムリスト
+
+        Returns:
+            (判定対象の代表アイテムリスト, {cluster_id: 代表以外のメンバーリスト})
+        """
+        fingerprints = [self._fingerprint(item) for item in items]
+
+        # LSH: いずれかのバンドが一致するものだけを比較する
+        buckets: Dict[Tuple[int, int], List[int]] = {}
+        for index, fingerprint in enumerate(fingerprints):
+            if fingerprint is None:
+                continue
+            for key in self._band_keys(fingerprint):
+                buckets.setdefault(key, []).append(index)
+
+        parent = list(range(len(items)))
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        for indexes in buckets.values():
+            for pos, i in enumerate(indexes):
+                for j in indexes[pos + 1:]:
+                    if find(i) == find(j):
+                        continue
+                    if bin(fingerprints[i] ^ fingerprints[j]).count('1') <= self.max_hamming_distance:
+                        parent[find(j)] = find(i)
+
+        groups: Dict[int, List[int]] = {}
+        for index in range(len(items)):
+            groups.setdefault(find(index), []).append(index)
+
+        representatives = []
+        clusters: Dict[str, List[Dict[str, Any]]] = {}
+        for indexes in groups.values():
+            members = [items[i] for i in indexes]
+            representative = min(members, key=self._representative_key)
+            representatives.append(representative)
+
+            if len(members) == 1:
+                continue
+
+            cluster_id = self._cluster_id(representative.get('url'))
+            for member in members:
+                member['cluster_id'] = cluster_id
+            clusters[cluster_id] = [m for m in members if m is not representative]
+
+        return representatives, clusters
+
+    def propagate(
+        self,
+        judged_items: List[Dict[str, Any]],
+        clusters: Dict[str, List[Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        代表アイテムの判定結果をクラスタ内の他のメンバーに伝播
+
+        Args:
+            judged_items: 判定済み（フィルタ通過）の代表アイテムリスト
+            clusters: cluster() が返したクラスタ
+
+        Returns:
+            代表 + 伝播したメンバーのリスト
+        """
+        result = list(judged_items)
+
+        for item in judged_items:
+            members = clusters.get(item.get('cluster_id'), [])
+            for member in members:
+                for field in JUDGMENT_FIELDS:
+                    member[field] = item.get(field)
+                result.append(member)
+
+        return result
+
+    def _fingerprint(self, item: Dict[str, Any]) -> Optional[int]:
+        """
+        アイテムのSimHashを計算し、item['simhash']（16進数。items.simhash に保存する）に記録
+        """
+        if 'simhash' in item:
+            return int(item['simhash'], 16) if item['simhash'] else None
+
+        fingerprint = self._simhash(self._prepare_text(item))
+        item['simhash'] = f'{fingerprint:016x}' if fingerprint is not None else None
+        return fingerprint
+
+    def _add_known(self, item: Dict[str, Any], fingerprint, owner: Optional[Dict[str, Any]]):
+        """
+        索引に判定済みアイテムを追加
+        """
+        if isinstance(fingerprint, str):
+            fingerprint = int(fingerprint, 16)
+        if fingerprint is None:
+            return
+
+        index = len(self._known)
+        self._known.append({
+            'url': item.get('url'),
+            'fingerprint': fingerprint,
+            'cluster_id': item.get('cluster_id'),
+            'judgment': {field: item.get(field) for field in JUDGMENT_FIELDS},
+            'owner': owner,
+        })
+        for key in self._band_keys(fingerprint):
+            self._known_buckets.setdefault(key, []).append(index)
+
+    def _find_known(self, fingerprint: Optional[int]) -> Optional[Dict[str, Any]]:
+        """
+        索引からハミング距離が最も近い判定済みアイテムを探す（距離が max_hamming_distance を超える場合はNone）
+        """
+        if fingerprint is None or not self._known:
+            return None
+
+        candidates = {
+            index
+            for key in self._band_keys(fingerprint)
+            for index in self._known_buckets.get(key, [])
+        }
+        best, best_distance = None, self.max_hamming_distance + 1
+        for index in sorted(candidates):
+            distance = bin(fingerprint ^ self._known[index]['fingerprint']).count('1')
+            if distance < best_distance:
+                best, best_distance = self._known[index], distance
+        return best
+
+    def _band_keys(self, fingerprint: int) -> List[Tuple[int, int]]:
+        """
+        LSHバケットのキー（バンド番号, バンドの値）
+        """
+        mask = (1 << self.band_bits) - 1
+        return [(band, (fingerprint >> (band * self.band_bits)) & mask) for band in range(self.bands)]
+
+    @staticmethod
+    def _cluster_id(url: Optional[str]) -> str:
+        """
+        代表アイテムのURLからクラスタIDを生成
+        """
+        return 'c_' + hashlib.sha1((url or '').encode('utf-8')).hexdigest()[:16]
+
+    def _prepare_text(self, item: Dict[str, Any]) -> str:
+        """
+        比較用テキストを作成（RTプレフィックス・URLを除去して正規化）
+        """
+        content = RETWEET_PREFIX.sub('', (item.get('content') or '').strip())
+        text = f"{item.get('title') or ''} {content}"
+        return normalize_text(URL_PATTERN.sub('', text))
+
+    def _simhash(self, text: str):
+        """
+        文字n-gramのSimHash（64bit）を計算
+
+        Returns:
+            SimHash値（短すぎるテキストはNone）
+        """
+        if len(text) < self.min_text_length:
+            return None
+
+        shingles = {
+            text[i:i + self.shingle_size]
+            for i in range(len(text) - self.shingle_size + 1)
+        }
+
+        weights = [0] * 64
+        for shingle in shingles:
+            value = int.from_bytes(
+                hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'big'
+            )
+            for bit in range(64):
+                weights[bit] += 1 if (value >> bit) & 1 else -1
+
+        fingerprint = 0
+        for bit, weight in enumerate(weights):
+            if weight > 0:
+                fingerprint |= 1 << bit
+        return fingerprint
+
+    @staticmethod
+    def _representative_key(item: Dict[str, Any]):
+        """
+        代表選択の並び順（ソース優先度 -> 本文が長い順）
+        """
+        return (
+            SOURCE_PRIORITY.get(item.get('source'), len(SOURCE_PRIORITY)),
+            -len(item.get('content') or '')
+        )
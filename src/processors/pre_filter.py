@@ -0,0 +1,133 @@
+"""
+ローカル事前フィルタ
+Claude判定の前に、明らかに無関係なアイテムをローカルのルールで除外する
+（除外キーワード・本人への言及・ソース別ルール）
+"""
+from typing import List, Dict, Any, Tuple
+
+from src.utils.config_service import get_config_service, SETTINGS_PATH
+from src.utils.keyword_matcher import KeywordMatcher
+from src.utils.text_normalizer import normalize_text
+
+
+class PreFilter:
+    """
+    Claude判定前にローカルで実行するフィルタ
+    """
+
+    def __init__(self, sources_config: Dict[str, Any], settings_path: str = SETTINGS_PATH):
+        """
+        初期化
+
+        Args:
+            sources_config: ソース設定（config/sources.jsonの内容）
+            settings_path: 設定ファイルのパス
+        """
+        settings = get_config_service().get_json(settings_path)
+
+        filtering = settings.get('filtering', {})
+        pre_filter = filtering.get('pre_filter', {})
+
+        self.enabled = pre_filter.get('enabled', True)
+        self.source_rules = pre_filter.get('sources', {})
+
+        # 本人を指す表記（別名 + 各ソースの検索キーワード）
+        subject_terms = list(pre_filter.get('subject_aliases', []))
+        for source_config in sources_config.values():
+            keyword = source_config.get('search_keyword')
+            if keyword:
+                subject_terms.append(keyword)
+
+        # 除外キーワード・本人表記を1つのマッチャーで照合する
+        # Xはファン向けハッシュタグも本人への言及とみなす
+        self.matcher = KeywordMatcher({
+            'excluded': filtering.get('excluded_keywords', []),
+            'subject': subject_terms,
+            'subject:twitter': sources_config.get('twitter', {}).get('hashtags', []),
+        })
+        self.has_subject_terms = any(normalize_text(t) for t in subject_terms)
+
+    def apply(self, items: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        アイテムに事前フィルタを適用
+
+        Args:
+            items: アイテムリスト
+
+        Returns:
+            (通過したアイテムリスト, 集計結果)
+            集計結果の形式:
+            {
+                "input": 入力件数,
+                "dropped": 除外件数,
+                "by_reason": {理由: 件数},
+                "by_source": {ソース: 除外件数}
+            }
+        """
+        stats = {
+            'input': len(items),
+            'dropped': 0,
+            'by_reason': {},
+            'by_source': {}
+        }
+
+        if not self.enabled:
+            return items, stats
+
+        kept_items = []
+        for item in items:
+            reason = self._drop_reason(item)
+            if reason is None:
+                kept_items.append(item)
+                continue
+
+            source = item.get('source') or 'unknown'
+            stats['dropped'] += 1
+            stats['by_reason'][reason] = stats['by_reason'].get(reason, 0) + 1
+            stats['by_source'][source] = stats['by_source'].get(source, 0) + 1
+            print(f"[PreFilter] 除外 ({reason}): {item.get('url')}")
+
+        print(f"[PreFilter] 事前フィルタ: {len(items)} 件 -> {len(kept_items)} 件")
+
+        return kept_items, stats
+
+    def _drop_reason(self, item: Dict[str, Any]):
+        """
+        アイテムを除外すべき理由を判定
+
+        Args:
+            item: アイテム
+
+        Returns:
+            除外理由（通過する場合はNone）
+        """
+        source = item.get('source')
+        rules = self.source_rules.get(source, {})
+        url = item.get('url') or ''
+        title = item.get('title') or ''
+        content = item.get('content') or ''
+
+        # ソース別: URLパターン
+        url_patterns = rules.get('url_patterns')
+        if url_patterns and not any(pattern in url for pattern in url_patterns):
+            return 'url_pattern'
+
+        # ソース別: リツイートの除外
+        if rules.get('drop_retweets') and content.lstrip().startswith('RT @'):
+            return 'retweet'
+
+        # ソース別: 本文が短すぎる
+        if len(normalize_text(title)) + len(normalize_text(content)) < rules.get('min_text_length', 0):
+            return 'too_short'
+
+        matched = self.matcher.matched_classes(title, content)
+
+        # 除外キーワード
+        if 'excluded' in matched:
+            return 'excluded_keyword'
+
+        # 本人への言及
+        if self.has_subject_terms and not ({'subject', f'subject:{source}'} & matched):
+            return 'no_subject_mention'
+
+        return None
@@ -0,0 +1,199 @@
+"""
+情報ソースごとのサーキットブレーカー
+失敗が続くソースを一定時間スキップし、他のソースの収集を妨げないようにする
+状態は source_health テーブルに保存し、実行をまたいで引き継ぐ
+
+    closed（通常） -> 連続失敗が閾値に達する -> open（スキップ）
+    open -> 待機時間の経過 -> half_open（リトライなしで1回だけ試行）
+    half_open -> 成功: closed / 失敗: open
+"""
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Any, Optional
+import pytz
+
+from src.database.models import SourceHealth
+
+ALLOW = 'allow'
+TRIAL = 'trial'
+SKIP = 'skip'
+
+
+class SourceCircuitBreaker:
+    """
+    DBに状態を保存するソース単位のサーキットブレーカー
+    """
+
+    def __init__(
+        self,
+        db_manager,
+        failure_threshold: int = 3,
+        cooldown_minutes: int = 60,
+        enabled: bool = True,
+        lock=None
+    ):
+        """
+        初期化
+
+        Args:
+            db_manager: データベースマネージャー
+            failure_threshold: スキップを開始する連続失敗回数
+            cooldown_minutes: スキップを続ける時間（分）。経過後に1回だけ試行する
+            enabled: Falseの場合は常に実行を許可し、状態も記録しない
+            lock: DBアクセスを直列化するロック（省略時は専用のロックを使用）
+        """
+        self.db_manager = db_manager
+        self.failure_threshold = failure_threshold
+        self.cooldown = timedelta(minutes=cooldown_minutes)
+        self.enabled = enabled
+        self.lock = lock or threading.RLock()
+        self.jst = pytz.timezone('Asia/Tokyo')
+
+    @classmethod
+    def from_settings(cls, db_manager, settings: Dict[str, Any], lock=None) -> 'SourceCircuitBreaker':
+        """
+        設定（config/settings.json の circuit_breaker）から生成
+        """
+        config = settings.get('circuit_breaker', {})
+        return cls(
+            db_manager,
+            failure_threshold=config.get('failure_threshold', 3),
+            cooldown_minutes=config.get('cooldown_minutes', 60),
+            enabled=config.get('enabled', True),
+            lock=lock
+        )
+
+    def before_call(self, source: str) -> str:
+        """
+        ソースを実行してよいか判定
+
+        Args:
+            source: ソース（Agent名）
+
+        Returns:
+            ALLOW: 通常どおり実行 / TRIAL: リトライなしで1回だけ試行 / SKIP: スキップ
+        """
+        if not self.enabled:
+            return ALLOW
+
+        with self.lock:
+            session = self.db_manager.get_session()
+            try:
+                health = session.query(SourceHealth).filter_by(source=source).first()
+                if health is None or health.state == 'closed':
+                    return ALLOW
+
+                if health.state == 'open':
+                    if self._now() - self._aware(health.opened_at) < self.cooldown:
+                        return SKIP
+                    health.state = 'half_open'
+                    session.commit()
+
+                return TRIAL
+            finally:
+                session.close()
+
+    def skip_reason(self, source: str) -> Optional[str]:
+        """
+        スキップ中のソースの理由を取得
+
+        Args:
+            source: ソース（Agent名）
+
+        Returns:
+            理由の文字列（スキップ中でない場合はNone）
+        """
+        with self.lock:
+            session = self.db_manager.get_session()
+            try:
+                health = session.query(SourceHealth).filter_by(source=source).first()
+                if health is None or health.state != 'open':
+                    return None
+                retry_at = self._aware(health.opened_at) + self.cooldown
+                return (
+                    f"連続 {health.consecutive_failures} 回失敗したためスキップします"
+                    f"（{retry_at.strftime('%Y-%m-%d %H:%M')} 以降に再試行）: {health.last_error}"
+                )
+            finally:
+                session.close()
+
+    def record_success(self, source: str):
+        """
+        成功を記録（状態を closed に戻す）
+
+        Args:
+            source: ソース（Agent名）
+        """
+        if not self.enabled:
+            return
+
+        with self.lock:
+            session = self.db_manager.get_session()
+            try:
+                health = self._get_or_create(session, source)
+                health.state = 'closed'
+                health.consecutive_failures = 0
+                health.opened_at = None
+                health.last_success_at = self._now()
+                session.commit()
+            finally:
+                session.close()
+
+    def record_failure(self, source: str, error: str) -> bool:
+        """
+        失敗を記録（連続失敗が閾値に達した場合、または試行中の失敗で open にする）
+
+        Args:
+            source: ソース（Agent名）
+            error: エラーメッセージ
+
+        Returns:
+            スキップを開始した（open になった）場合True
+        """
+        if not self.enabled:
+            return False
+
+        with self.lock:
+            session = self.db_manager.get_session()
+            try:
+                health = self._get_or_create(session, source)
+                now = self._now()
+                health.consecutive_failures = (health.consecutive_failures or 0) + 1
+                health.last_failure_at = now
+                health.last_error = error
+
+                opened = (
+                    health.state == 'half_open'
+                    or health.consecutive_failures >= self.failure_threshold
+                )
+                if opened:
+                    health.state = 'open'
+                    health.opened_at = now
+
+                session.commit()
+                return opened
+            finally:
+                session.close()
+
+    def _get_or_create(self, session, source: str) -> SourceHealth:
+        """
+        ソースの状態レコードを取得（なければ作成）
+        """
+        health = session.query(SourceHealth).filter_by(source=source).first()
+        if health is None:
+            health = SourceHealth(source=source, state='closed', consecutive_failures=0)
+            session.add(health)
+        return health
+
+    def _now(self) -> datetime:
+        return datetime.now(self.jst)
+
+    def _aware(self, value: datetime) -> datetime:
+        """
+        タイムゾーンなしの日時（SQLiteから読み込んだ値）をJSTとして扱う
+        """
+        if value is None:
+            return datetime.min.replace(tzinfo=pytz.utc)
+        if value.tzinfo is None:
+            return self.jst.localize(value)
+        return value
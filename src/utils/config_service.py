@@ -0,0 +1,199 @@
+"""
+設定ファイルの管理サービス
+config/ 配下のファイル（settings.json / sources.json / プロンプト）を1か所で読み込み、検証してキャッシュする
+
+- ファイルの更新日時（mtime）とサイズが変わった場合のみ読み直す（確認は os.stat だけで、ファイルは読まない）
+- 読み直すたびにファイルごとのバージョン番号が進むため、設定から作ったキャッシュの無効化に使える
+- 読み直した内容が不正な場合（編集途中のJSON等）は、直前の正しい内容を使い続ける
+
+返す設定の辞書は全ての利用者で共有するため、変更しないこと。
+"""
+import os
+import json
+import threading
+from typing import Any, Dict, NamedTuple, Optional
+
+# 設定ファイルのパス
+SETTINGS_PATH = 'config/settings.json'
+SOURCES_PATH = 'config/sources.json'
+
+
+def validate_settings(settings: Any):
+    """
+    settings.json の内容を検証
+
+    Args:
+        settings: 読み込んだ内容
+
+    Raises:
+        ValueError: 内容が不正な場合
+    """
+    if not isinstance(settings, dict):
+        raise ValueError("settings.json の最上位はオブジェクトにしてください")
+    for name, section in settings.items():
+        if not isinstance(section, dict):
+            raise ValueError(f"settings.json の {name} はオブジェクトにしてください")
+
+    categories = settings.get('judgment_criteria', {}).get('categories', [])
+    if not isinstance(categories, list) or not all(isinstance(c, str) for c in categories):
+        raise ValueError("judgment_criteria.categories は文字列のリストにしてください")
+
+
+def validate_sources(sources: Any):
+    """
+    sources.json の内容を検証
+
+    Args:
+        sources: 読み込んだ内容
+
+    Raises:
+        ValueError: 内容が不正な場合
+    """
+    if not isinstance(sources, dict):
+        raise ValueError("sources.json の最上位はオブジェクトにしてください")
+    for name, source in sources.items():
+        if not isinstance(source, dict):
+            raise ValueError(f"sources.json の {name} はオブジェクトにしてください")
+
+
+# ファイル名ごとの検証関数（ここにないJSONファイルは形式のみ確認する）
+VALIDATORS = {
+    'settings.json': validate_settings,
+    'sources.json': validate_sources,
+}
+
+
+class _Entry(NamedTuple):
+    signature: tuple  # (mtime_ns, size)
+    data: Any
+    version: int
+
+
+class ConfigService:
+    """
+    設定ファイルを読み込み、更新されるまでキャッシュするサービス
+    """
+
+    def __init__(self):
+        """
+        初期化
+        """
+        self._entries: Dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+
+    def settings(self) -> Dict[str, Any]:
+        """
+        config/settings.json の内容を取得
+        """
+        return self.get_json(SETTINGS_PATH)
+
+    def sources(self) -> Dict[str, Any]:
+        """
+        config/sources.json の内容を取得
+        """
+        return self.get_json(SOURCES_PATH)
+
+    def get_json(self, path: str) -> Any:
+        """
+        JSONファイルの内容を取得（更新されていなければキャッシュを返す）
+
+        Args:
+            path: ファイルのパス
+
+        Returns:
+            読み込んだ内容
+
+        Raises:
+            FileNotFoundError: ファイルが存在しない場合
+            ValueError: 初回の読み込みで内容が不正な場合
+        """
+        return self._get(path, as_json=True).data
+
+    def get_text(self, path: str) -> str:
+        """
+        テキストファイル（プロンプト等）の内容を取得（更新されていなければキャッシュを返す）
+
+        Args:
+            path: ファイルのパス
+
+        Returns:
+            ファイルの内容
+
+        Raises:
+            FileNotFoundError: ファイルが存在しない場合
+        """
+        return self._get(path, as_json=False).data
+
+    def version(self, path: str) -> int:
+        """
+        ファイルのバージョン番号を取得（読み直すたびに進む）
+
+        Args:
+            path: ファイルのパス（拡張子が .json の場合はJSONとして読み込む）
+
+        Returns:
+            バージョン番号（1から始まる）
+        """
+        return self._get(path, as_json=path.endswith('.json')).version
+
+    def invalidate(self, path: Optional[str] = None):
+        """
+        キャッシュを破棄（次回の取得時に読み直す）
+
+        Args:
+            path: ファイルのパス（省略時は全て）
+        """
+        with self._lock:
+            if path is None:
+                self._entries = {key: entry._replace(signature=None) for key, entry in self._entries.items()}
+            elif os.path.abspath(path) in self._entries:
+                key = os.path.abspath(path)
+                self._entries[key] = self._entries[key]._replace(signature=None)
+
+    def _get(self, path: str, as_json: bool) -> _Entry:
+        """
+        ファイルの更新を確認し、更新されていれば読み直す
+        """
+        key = os.path.abspath(path)
+        stat = os.stat(key)
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.signature == signature:
+                return entry
+
+            try:
+                with open(key, 'r', encoding='utf-8') as f:
+                    data = f.read()
+                if as_json:
+                    data = json.loads(data)
+                    validator = VALIDATORS.get(os.path.basename(key))
+                    if validator:
+                        validator(data)
+            except ValueError as e:
+                if entry is None:
+                    raise ValueError(f"設定ファイルが不正です: {path}: {e}") from e
+                # 同じ内容を何度も読み直さないよう、確認済みとして記録する
+                print(f"[ConfigService] 設定ファイルが不正なため、前回の内容を使います: {path}: {e}")
+                entry = entry._replace(signature=signature)
+                self._entries[key] = entry
+                return entry
+
+            entry = _Entry(signature, data, entry.version + 1 if entry else 1)
+            self._entries[key] = entry
+            return entry
+
+
+# グローバルな設定サービスインスタンス
+_config_service: Optional[ConfigService] = None
+
+
+def get_config_service() -> ConfigService:
+    """
+    設定サービスのシングルトンインスタンスを取得
+    """
+    global _config_service
+    if _config_service is None:
+        _config_service = ConfigService()
+    return _config_service
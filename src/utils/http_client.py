@@ -0,0 +1,187 @@
+"""
+HTTPクライアント
+リクエスト単位のリトライ（指数バックオフ + ジッター、Retry-After対応）と、
+1回の実行全体でのリトライ回数の上限（リトライ予算）を提供する
+"""
+import time
+import random
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, Optional
+
+import requests
+
+# リトライするHTTPステータス
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class RetryBudget:
+    """
+    1回の実行全体で使えるリトライ回数（全Agentで共有する）
+    """
+
+    def __init__(self, max_retries: int):
+        """
+        初期化
+
+        Args:
+            max_retries: リトライ回数の上限
+        """
+        self.max_retries = max_retries
+        self.used = 0
+        self._lock = threading.Lock()
+
+    def try_consume(self) -> bool:
+        """
+        リトライを1回分消費
+
+        Returns:
+            消費できた場合True（予算を使い切っている場合はFalse）
+        """
+        with self._lock:
+            if self.used >= self.max_retries:
+                return False
+            self.used += 1
+            return True
+
+    def summary(self) -> Dict[str, int]:
+        """
+        使用状況を取得
+        """
+        return {'used': self.used, 'max': self.max_retries}
+
+
+class HttpClient:
+    """
+    リトライ付きのHTTPクライアント（接続はセッションで再利用する）
+    """
+
+    def __init__(
+        self,
+        name: str = 'http',
+        timeout: float = 15,
+        max_attempts: int = 3,
+        backoff_base: float = 1.0,
+        backoff_max: float = 30.0,
+        retry_after_max: float = 120.0,
+        budget: Optional[RetryBudget] = None
+    ):
+        """
+        初期化
+
+        Args:
+            name: ログに表示する名前（Agent名）
+            timeout: タイムアウト（秒）
+            max_attempts: 1リクエストあたりの最大試行回数
+            backoff_base: バックオフの基準時間（秒）。n回目のリトライは最大 base * 2^(n-1) 秒待つ
+            backoff_max: 指数バックオフの待ち時間の上限（秒）
+            retry_after_max: Retry-After に従って待つ時間の上限（秒）。これより長い場合は再試行しない
+            budget: リトライ予算（Noneの場合は上限なし）
+        """
+        self.name = name
+        self.timeout = timeout
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_after_max = retry_after_max
+        self.budget = budget
+        self.session = requests.Session()
+
+    @classmethod
+    def from_settings(cls, settings: Dict[str, Any], name: str = 'http') -> 'HttpClient':
+        """
+        設定（config/settings.json の http）から生成
+        """
+        config = settings.get('http', {})
+        return cls(
+            name=name,
+            timeout=config.get('timeout_sec', 15),
+            max_attempts=config.get('max_attempts', 3),
+            backoff_base=config.get('backoff_base_sec', 1.0),
+            backoff_max=config.get('backoff_max_sec', 30.0),
+            retry_after_max=config.get('retry_after_max_sec', 120.0)
+        )
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """
+        GETリクエストを送信（一時的なエラーはリトライする）
+
+        接続エラー・タイムアウト・RETRY_STATUSES のレスポンスをリトライし、
+        それ以外のエラーレスポンスは即座に例外にする。
+        Retry-After が retry_after_max より長い場合は、早すぎる再試行でリトライ予算を使わないよう即座に例外にする。
+
+        Args:
+            url: URL
+            **kwargs: requests に渡す引数
+
+        Returns:
+            レスポンス（2xx/3xx）
+
+        Raises:
+            requests.RequestException: 試行回数またはリトライ予算を使い切った場合
+        """
+        kwargs.setdefault('timeout', self.timeout)
+
+        for attempt in range(1, self.max_attempts + 1):
+            retry_after = None
+            try:
+                response = self.session.get(url, **kwargs)
+                if response.status_code not in RETRY_STATUSES:
+                    response.raise_for_status()
+                    return response
+                error = requests.HTTPError(
+                    f"{response.status_code} Error for url: {url}", response=response
+                )
+                retry_after = self._parse_retry_after(response.headers.get('Retry-After'))
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = e
+
+            if attempt >= self.max_attempts:
+                raise error
+            if retry_after is not None and retry_after > self.retry_after_max:
+                print(f"[{self.name}] Retry-After（{retry_after:.0f}秒）が上限を超えるため再試行しません: {url}")
+                raise error
+            if self.budget is not None and not self.budget.try_consume():
+                print(f"[{self.name}] リトライ予算を使い切ったため再試行しません: {url}")
+                raise error
+
+            delay = self._backoff(attempt, retry_after)
+            print(f"[{self.name}] リクエスト失敗 ({error})、{delay:.1f}秒後に再試行します ({attempt}/{self.max_attempts})")
+            time.sleep(delay)
+
+    def _backoff(self, attempt: int, retry_after: Optional[float]) -> float:
+        """
+        待ち時間を計算（Retry-Afterがあればその時間、なければ指数バックオフ + フルジッター）
+
+        Args:
+            attempt: 失敗した試行の番号（1始まり）
+            retry_after: Retry-After の秒数
+
+        Returns:
+            待ち時間（秒）
+        """
+        if retry_after is not None:
+            return max(retry_after, 0.0)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1))))
+
+    @staticmethod
+    def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """
+        Retry-After ヘッダー（秒数またはHTTP日付）を秒数に変換
+
+        Returns:
+            秒数（ヘッダーがない・解釈できない場合はNone）
+        """
+        if not value:
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return (retry_at - datetime.now(timezone.utc)).total_seconds()
@@ -0,0 +1,81 @@
+"""
+JSONシリアライザ
+APIレスポンスや一括出力のJSON変換を行う
+
+orjson がインストールされている場合は orjson（C実装）で変換し、ない場合は標準の json モジュールで変換する。
+どちらも日本語をエスケープせず（\\uXXXX にしない）、日時は ISO 8601 形式（datetime.isoformat と同じ）で出力するため、
+変換前に日時を文字列にしておく必要はない。
+"""
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def default(value: Any) -> Any:
+    """
+    JSONで表せない値の変換（orjson / json 共通）
+
+    Args:
+        value: 変換する値
+
+    Returns:
+        JSONで表せる値
+
+    Raises:
+        TypeError: 変換できない値の場合
+    """
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"JSONに変換できない値です: {type(value).__name__}")
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """
+    JSON（UTF-8のバイト列）に変換
+
+    Args:
+        obj: 変換するオブジェクト
+
+    Returns:
+        JSONのバイト列
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, default=default, separators=(',', ':')).encode('utf-8')
+
+
+def dumps(obj: Any) -> str:
+    """
+    JSON文字列に変換
+
+    Args:
+        obj: 変換するオブジェクト
+
+    Returns:
+        JSON文字列
+    """
+    return dumps_bytes(obj).decode('utf-8')
+
+
+def loads(data) -> Any:
+    """
+    JSON文字列（またはバイト列）を読み込む
+
+    Args:
+        data: JSON文字列またはバイト列
+
+    Returns:
+        読み込んだオブジェクト
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,142 @@
+"""
+キーワードマッチャー
+Aho-Corasick法で複数クラスのキーワードを1パスで照合する
+（除外キーワード・重要度キーワード・本人表記など）
+"""
+from collections import deque
+from typing import Dict, Iterable, List, Set, Tuple
+
+from src.utils.text_normalizer import normalize_text
+
+
+class KeywordMatcher:
+    """
+    キーワードクラスごとの辞書をオートマトンにコンパイルし、テキストを1回の走査で照合する
+
+    キーワード・テキストともに normalize_text で正規化してから照合するため、
+    全角/半角・大文字/小文字・空白の揺れは区別しない。
+    """
+
+    def __init__(self, keyword_classes: Dict[str, Iterable[str]]):
+        """
+        初期化（オートマトンを構築）
+
+        Args:
+            keyword_classes: {クラス名: キーワードのリスト}
+        """
+        self.classes = list(keyword_classes.keys())
+
+        # ノードごとの遷移・失敗リンク・出力（クラス名, 元のキーワード）
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Tuple[str, str]]] = [[]]
+
+        for class_name, keywords in keyword_classes.items():
+            for keyword in keywords:
+                self._add(class_name, keyword)
+
+        self._build_failure_links()
+
+    @classmethod
+    def from_settings(cls, settings: Dict, extra_classes: Dict[str, Iterable[str]] = None) -> 'KeywordMatcher':
+        """
+        設定（config/settings.json）からマッチャーを構築
+
+        クラスは "excluded"（除外キーワード）と各重要度レベル（"high" / "medium" / "low"）。
+
+        Args:
+            settings: 設定辞書
+            extra_classes: 追加するキーワードクラス
+
+        Returns:
+            KeywordMatcher
+        """
+        importance_levels = settings.get('judgment_criteria', {}).get('importance_levels', {})
+
+        keyword_classes = {
+            'excluded': settings.get('filtering', {}).get('excluded_keywords', [])
+        }
+        for level, level_settings in importance_levels.items():
+            keyword_classes[level] = level_settings.get('keywords', [])
+
+        if extra_classes:
+            keyword_classes.update(extra_classes)
+
+        return cls(keyword_classes)
+
+    def scan(self, *texts: str) -> Dict[str, Set[str]]:
+        """
+        テキストを走査し、マッチしたキーワードをクラスごとに返す
+
+        Args:
+            *texts: 照合するテキスト（複数渡した場合はそれぞれ走査する）
+
+        Returns:
+            {クラス名: マッチしたキーワードの集合}（マッチしたクラスのみ）
+        """
+        matches: Dict[str, Set[str]] = {}
+
+        for text in texts:
+            state = 0
+            for char in normalize_text(text):
+                while state and char not in self._goto[state]:
+                    state = self._fail[state]
+                state = self._goto[state].get(char, 0)
+
+                for class_name, keyword in self._output[state]:
+                    matches.setdefault(class_name, set()).add(keyword)
+
+        return matches
+
+    def matched_classes(self, *texts: str) -> Set[str]:
+        """
+        マッチしたキーワードクラスの集合を返す
+
+        Args:
+            *texts: 照合するテキスト
+
+        Returns:
+            クラス名の集合
+        """
+        return set(self.scan(*texts).keys())
+
+    def _add(self, class_name: str, keyword: str):
+        """
+        キーワードをトライに追加
+        """
+        pattern = normalize_text(keyword)
+        if not pattern:
+            return
+
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][char] = next_state
+            state = next_state
+
+        self._output[state].append((class_name, keyword))
+
+    def _build_failure_links(self):
+        """
+        幅優先で失敗リンクを張り、接尾辞ノードの出力を引き継ぐ
+        """
+        queue = deque(self._goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                if self._fail[next_state] == next_state:
+                    self._fail[next_state] = 0
+
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
@@ -1,10 +1,12 @@
 """
 プロンプト管理クラス
 config/prompts/ 配下のプロンプトファイルを読み込み、管理する
+（ファイルの読み込みとキャッシュは設定サービスで行い、編集すると次の取得から反映される）
 """
 import os
-import json
-from typing import Dict, Any
+from typing import Dict, Optional, Tuple
+
+from src.utils.config_service import ConfigService, get_config_service, SETTINGS_PATH
 
 
 class PromptManager:
@@ -12,15 +14,18 @@ class PromptManager:
     プロンプトファイルを読み込み、管理するクラス
     """
 
-    def __init__(self, prompts_dir: str = 'config/prompts'):
+    def __init__(self, prompts_dir: str = 'config/prompts', config_service: Optional[ConfigService] = None):
         """
         初期化
 
         Args:
             prompts_dir: プロンプトファイルが格納されているディレクトリパス
+            config_service: 設定サービス（省略時は共有のインスタンス）
         """
         self.prompts_dir = prompts_dir
-        self._prompts_cache: Dict[str, str] = {}
+        self.config = config_service or get_config_service()
+        # 設定を埋め込んだJudgeプロンプト（プロンプト・設定ファイルのバージョンが変わるまで再利用する）
+        self._judge_prompt_cache: Dict[Tuple, str] = {}
 
     def load_prompt(self, agent_name: str) -> str:
         """
@@ -35,26 +40,15 @@ class PromptManager:
         Raises:
             FileNotFoundError: プロンプトファイルが見つからない場合
         """
-        # キャッシュに存在する場合はキャッシュから返す
-        if agent_name in self._prompts_cache:
-            return self._prompts_cache[agent_name]
-
-        # プロンプトファイルのパスを構築
-        prompt_file = os.path.join(self.prompts_dir, f'{agent_name}_agent_prompt.txt')
+        prompt_file = self._prompt_path(agent_name)
 
         if not os.path.exists(prompt_file):
             raise FileNotFoundError(f"プロンプトファイルが見つかりません: {prompt_file}")
 
-        # ファイルを読み込み
-        with open(prompt_file, 'r', encoding='utf-8') as f:
-            prompt = f.read()
-
-        # キャッシュに保存
-        self._prompts_cache[agent_name] = prompt
-
-        return prompt
+        # ファイルが更新されていなければキャッシュから返す
+        return self.config.get_text(prompt_file)
 
-    def load_judge_prompt_with_settings(self, settings_path: str = 'config/settings.json') -> str:
+    def load_judge_prompt_with_settings(self, settings_path: str = SETTINGS_PATH) -> str:
         """
         Judge Agentプロンプトを読み込み、設定ファイルの内容を埋め込む
 
@@ -68,8 +62,16 @@ class PromptManager:
         prompt = self.load_prompt('judge')
 
         # 設定ファイルを読み込み
-        with open(settings_path, 'r', encoding='utf-8') as f:
-            settings = json.load(f)
+        settings = self.config.get_json(settings_path)
+
+        # プロンプト・設定ファイルが更新されていなければ埋め込み済みのものを返す
+        cache_key = (
+            settings_path,
+            self.config.version(self._prompt_path('judge')),
+            self.config.version(settings_path)
+        )
+        if cache_key in self._judge_prompt_cache:
+            return self._judge_prompt_cache[cache_key]
 
         # 判定基準を取得
         criteria = settings.get('judgment_criteria', {})
@@ -98,10 +100,18 @@ class PromptManager:
         excluded_keywords = filtering.get('excluded_keywords', [])
         prompt = prompt.replace('{EXCLUDED_KEYWORDS}', ', '.join(excluded_keywords))
 
+        self._judge_prompt_cache = {cache_key: prompt}
         return prompt
 
     def clear_cache(self):
         """
-        キャッシュをクリア
+        キャッシュをクリア（次回の取得時にファイルを読み直す）
+        """
+        self._judge_prompt_cache.clear()
+        self.config.invalidate()
+
+    def _prompt_path(self, agent_name: str) -> str:
+        """
+        Agentのプロンプトファイルのパス
         """
-        self._prompts_cache.clear()
+        return os.path.join(self.prompts_dir, f'{agent_name}_agent_prompt.txt')
@@ -0,0 +1,21 @@
+"""
+テキスト正規化ユーティリティ
+キーワード照合や重複判定の前処理として表記揺れを吸収する
+"""
+import unicodedata
+
+
+def normalize_text(text: str) -> str:
+    """
+    照合用にテキストを正規化（NFKC + 小文字化 + 空白除去）
+
+    全角/半角や「諸橋 沙夏」のような空白の揺れを吸収する。
+
+    Args:
+        text: 元のテキスト
+
+    Returns:
+        正規化したテキスト
+    """
+    normalized = unicodedata.normalize('NFKC', text or '').casefold()
+    return ''.join(normalized.split())
@@ -0,0 +1,115 @@
+"""
+URL正規化ユーティリティ
+ソースごとのルールでURLを正規化し、重複チェック用のキーを生成する
+（twitter.com / x.com の揺れ、トラッキングパラメータ、フラグメント、写真ページ等）
+"""
+import re
+import hashlib
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+# 除去するトラッキング用クエリパラメータ（どのホストでもトラッキング用途のもの）
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'yclid', 'mc_cid', 'mc_eid', 'igshid',
+    'ref_src', 'ref_url',
+}
+TRACKING_PREFIXES = ('utm_',)
+
+# ホストごとに除去するクエリパラメータ（正規ホスト名 -> パラメータ）
+# from / source / ref は一般的な名前で、他のサイトではページの内容を変えるパラメータとして使われるため、
+# 流入元の記録に使っていることが分かっているホストでのみ除去する
+HOST_TRACKING_PARAMS = {
+    'news.yahoo.co.jp': {'source', 'from', 'ref'},
+    'mdpr.jp': {'from', 'ref'},
+}
+
+# ホスト名の別名 -> 正規ホスト名
+HOST_ALIASES = {
+    'twitter.com': 'x.com',
+    'mobile.twitter.com': 'x.com',
+    'mobile.x.com': 'x.com',
+    'www.twitter.com': 'x.com',
+    'www.x.com': 'x.com',
+    'www.mdpr.jp': 'mdpr.jp',
+    'm.mdpr.jp': 'mdpr.jp',
+}
+
+TWEET_PATH = re.compile(r'^/(?:[^/]+|i(?:/web)?)/status(?:es)?/(\d+)')
+MDPR_NEWS_PATH = re.compile(r'^/news/(?:detail/)?(\d+)')
+YAHOO_ARTICLE_PATH = re.compile(r'^/(articles|pickup)/([0-9A-Za-z]+)')
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    URLを正規化
+
+    - スキームは https、ホスト名は小文字にし、別名ホストを統一
+    - フラグメントとトラッキング用パラメータ（HOST_TRACKING_PARAMS のホスト別の分も）を除去し、
+      残りのパラメータは並び替え
+    - X: https://x.com/i/status/<ツイートID>（ユーザー名・/photo/1 等は除去）
+    - モデルプレス: https://mdpr.jp/news/detail/<記事ID>（/photo/ 以下は除去）
+    - Yahoo!ニュース: /articles/<ID> 以下の /images/・/comments 等やページ指定を除去
+
+    Args:
+        url: 元のURL
+
+    Returns:
+        正規化したURL（空の場合は空文字列）
+    """
+    url = (url or '').strip()
+    if not url:
+        return ''
+
+    parts = urlsplit(url)
+    host = (parts.hostname or '').lower()
+    host = HOST_ALIASES.get(host, host)
+    path = re.sub(r'/{2,}', '/', parts.path or '/')
+
+    host_params = HOST_TRACKING_PARAMS.get(host, set())
+    query = [
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS
+        and key.lower() not in host_params
+        and not key.lower().startswith(TRACKING_PREFIXES)
+    ]
+
+    if host == 'x.com':
+        match = TWEET_PATH.match(path)
+        if match:
+            return f'https://x.com/i/status/{match.group(1)}'
+        # ツイート以外（プロフィール等）はクエリ不要
+        query = []
+
+    elif host == 'mdpr.jp':
+        match = MDPR_NEWS_PATH.match(path)
+        if match:
+            return f'https://mdpr.jp/news/detail/{match.group(1)}'
+
+    elif host == 'news.yahoo.co.jp':
+        match = YAHOO_ARTICLE_PATH.match(path)
+        if match:
+            return f'https://news.yahoo.co.jp/{match.group(1)}/{match.group(2)}'
+
+    if len(path) > 1:
+        path = path.rstrip('/')
+
+    netloc = host
+    if parts.port and parts.port not in (80, 443):
+        netloc = f'{host}:{parts.port}'
+
+    return urlunsplit(('https', netloc, path, urlencode(sorted(query)), ''))
+
+
+def canonical_key(url: str) -> str:
+    """
+    正規化URLから重複チェック用のキー（SHA-256の16進文字列）を生成
+
+    Args:
+        url: 元のURL
+
+    Returns:
+        64文字のキー（URLが空の場合は空文字列）
+    """
+    canonical = canonicalize_url(url)
+    if not canonical:
+        return ''
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
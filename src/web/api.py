@@ -2,16 +2,27 @@
 API エンドポイント
 諸橋沙夏情報収集AgentのREST API
 """
-import threading
-from datetime import datetime, timedelta
+import json
+import queue
+from datetime import datetime
 import pytz
-from flask import Blueprint, request, jsonify
-from sqlalchemy import desc, or_
+from flask import Blueprint, request, jsonify, Response, stream_with_context
+from sqlalchemy import desc
 
 from src.database.db_manager import get_db_manager
-from src.database.models import Item, Execution
+from src.database.models import Execution, Item
+from src.database.queries import (
+    MAX_PER_PAGE, ItemCountCache, build_item_query, order_items, apply_cursor, encode_cursor,
+    ITEM_DICT_FIELDS, parse_fields, project_items, row_to_dict
+)
+from src.database.generations import get_generation, ITEMS, EXECUTIONS
+from src.database.search import order_by_relevance, split_terms
+from src.database.export import EXPORT_FORMATS, iter_item_rows, format_rows, buffer_chunks
+from src.pipeline.job_queue import JobQueue
+from src.pipeline.events import EventBroadcaster
+from src.web.response_cache import ResponseCache, CachedResponse
 from src.utils.logger import get_logger
-from main import NatsuAgentExecutor
+from src.utils.config_service import get_config_service, SETTINGS_PATH
 
 # Blueprint作成
 api_bp = Blueprint('api', __name__)
@@ -19,12 +30,57 @@ api_bp = Blueprint('api', __name__)
 # ロガー
 logger = get_logger()
 
-# 実行状態を管理
-execution_state = {
-    'is_running': False,
-    'current_execution_id': None,
-    'started_at': None
-}
+# 実行はジョブキューに登録し、ワーカープロセス（scripts/run_worker.py）が実行する
+_job_queue = None
+
+# フィルタ条件ごとの総件数（アイテムの世代が変わるまで再計算しない）
+_count_cache = ItemCountCache()
+
+# 読み取りAPIのレスポンス（データの世代が変わるまで再作成しない）
+_response_cache = None
+
+# 進捗イベントの配信（Webプロセスごとに1つ）
+_event_broadcaster = None
+_event_settings = None
+
+
+def get_job_queue() -> JobQueue:
+    """
+    ジョブキューを取得（初回のみ生成）
+    """
+    global _job_queue
+    if _job_queue is None:
+        _job_queue = JobQueue(get_db_manager())
+    return _job_queue
+
+
+def get_response_cache() -> ResponseCache:
+    """
+    レスポンスキャッシュを取得（初回のみ生成）
+    """
+    global _response_cache
+    if _response_cache is None:
+        cache_settings = get_config_service().settings().get('response_cache', {})
+        _response_cache = ResponseCache(
+            max_entries=cache_settings.get('max_entries', 512),
+            ttl_sec=cache_settings.get('ttl_sec', 60)
+        )
+    return _response_cache
+
+
+def get_event_broadcaster() -> EventBroadcaster:
+    """
+    進捗イベントの配信を取得（初回のみ生成）
+    """
+    global _event_broadcaster, _event_settings
+    if _event_broadcaster is None:
+        _event_settings = get_config_service().settings().get('events', {})
+        _event_broadcaster = EventBroadcaster(
+            get_db_manager(),
+            poll_interval_sec=_event_settings.get('poll_interval_sec', 0.5),
+            reread_window=_event_settings.get('reread_window')
+        )
+    return _event_broadcaster
 
 
 @api_bp.route('/items', methods=['GET'])
@@ -37,111 +93,242 @@ def get_items():
         period: 期間（24h, 7d, 30d, all）
         importance: 重要度（all, high, medium_up）
         category: カテゴリ（all, またはカテゴリ名）
-        keyword: キーワード検索
-        page: ページ番号（デフォルト: 1）
-        per_page: 1ページあたり件数（デフォルト: 20）
+        keyword: キーワード検索（空白区切りで複数指定した場合は全てを含むもの）
+        sort: 並び順（デフォルト: score）
+            score: 重要度スコア順
+            relevance: キーワードとの関連度順（keyword が必要。page で取得し、cursor は使えない）
+        cursor: 前ページの next_cursor（省略時は先頭から。指定した場合 page は無視する）
+        page: ページ番号（デフォルト: 1。cursor を使わない従来の取得方法）
+        per_page: 1ページあたり件数（デフォルト: 20、上限: MAX_PER_PAGE）
+        fields: 返す項目（カンマ区切り。省略時は全項目）。content_snippet で本文の先頭
+            SNIPPET_LENGTH 文字を返す。指定した項目のカラムだけを読み込む
+        count: 総件数の取得方法（デフォルト: cached）
+            exact: 総件数を返す（同じフィルタ条件の件数はアイテムが書き込まれるまでキャッシュする）
+            cached: キャッシュ済みの場合のみ総件数を返す（総件数の計算はしない）
+            none: 総件数を返さない
 
     Returns:
         JSON:
         {
             "items": [...],
-            "total": 総件数,
+            "total": 総件数（計算していない場合はNone）,
             "page": ページ番号,
             "per_page": 1ページあたり件数,
-            "has_next": 次ページがあるか
+            "has_next": 次ページがあるか,
+            "next_cursor": 次ページを取得するカーソル（次ページがない場合・関連度順の場合はNone）
         }
+        ETagを付けて返し、If-None-Match が一致する場合は本文なしの 304 を返す
     """
     try:
+        # クエリパラメータを取得
+        cursor = request.args.get('cursor') or None
+        sort = request.args.get('sort', 'score')
+        if sort not in ('score', 'relevance'):
+            return jsonify({'error': 'sort は score / relevance で指定してください'}), 400
+        if sort == 'relevance' and cursor:
+            return jsonify({'error': 'sort=relevance では cursor は使えません（page を指定してください）'}), 400
+        count_mode = request.args.get('count', 'cached')
+        if count_mode not in ('exact', 'cached', 'none'):
+            return jsonify({'error': 'count は exact / cached / none で指定してください'}), 400
+        try:
+            fields = parse_fields(request.args.get('fields'))
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        try:
+            page = max(int(request.args.get('page', 1)), 1)
+            per_page = min(max(int(request.args.get('per_page', 20)), 1), MAX_PER_PAGE)
+        except ValueError:
+            return jsonify({'error': 'page / per_page は整数で指定してください'}), 400
+
         db_manager = get_db_manager()
         session = db_manager.get_session()
 
-        # クエリパラメータを取得
-        period = request.args.get('period', '7d')
-        importance = request.args.get('importance', 'all')
-        category = request.args.get('category', 'all')
-        keyword = request.args.get('keyword', '')
-        page = int(request.args.get('page', 1))
-        per_page = int(request.args.get('per_page', 20))
-
-        # ベースクエリ
-        query = session.query(Item)
-
-        # 期間フィルタ
-        if period != 'all':
-            jst = pytz.timezone('Asia/Tokyo')
-            now = datetime.now(jst)
-
-            if period == '24h':
-                cutoff = now - timedelta(hours=24)
-            elif period == '7d':
-                cutoff = now - timedelta(days=7)
-            elif period == '30d':
-                cutoff = now - timedelta(days=30)
-            else:
-                cutoff = None
-
-            if cutoff:
-                query = query.filter(Item.published_at >= cutoff)
-
-        # 重要度フィルタ
-        if importance == 'high':
-            query = query.filter(Item.importance_level == 'high')
-        elif importance == 'medium_up':
-            query = query.filter(Item.importance_level.in_(['high', 'medium']))
-
-        # カテゴリフィルタ
-        if category != 'all':
-            query = query.filter(Item.category == category)
-
-        # キーワード検索
-        if keyword:
-            search_pattern = f'%{keyword}%'
-            query = query.filter(
-                or_(
-                    Item.title.like(search_pattern),
-                    Item.content.like(search_pattern),
-                    Item.summary.like(search_pattern)
-                )
+        try:
+            filters = (
+                request.args.get('period', '7d'),
+                request.args.get('importance', 'all'),
+                request.args.get('category', 'all'),
+                ' '.join(split_terms(request.args.get('keyword', '')))
             )
+            generation = get_generation(session, ITEMS)
 
-        # 総件数を取得
-        total = query.count()
+            # 総件数がキャッシュ済みの場合は count=exact と同じレスポンスになる
+            if count_mode == 'cached' and _count_cache.get(filters, generation) is not None:
+                count_mode = 'exact'
 
-        # ソート: 重要度スコア降順 -> 公開日時降順
-        query = query.order_by(
-            desc(Item.importance_score),
-            desc(Item.published_at)
-        )
+            # アイテムが書き込まれるまでは同じレスポンスを返す
+            key = ('items',) + filters + (sort, cursor, page, per_page, count_mode, fields)
+            cached = get_response_cache().get_or_build(key, generation, lambda: _build_items_body(
+                session, filters, generation, sort, cursor, page, per_page, count_mode, fields
+            ))
 
-        # ページネーション
-        offset = (page - 1) * per_page
-        items = query.limit(per_page).offset(offset).all()
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        finally:
+            session.close()
 
-        # 次ページがあるかチェック
-        has_next = (offset + per_page) < total
+        return _conditional_response(cached)
 
-        # レスポンスを構築
-        response = {
-            'items': [item.to_dict() for item in items],
-            'total': total,
-            'page': page,
-            'per_page': per_page,
-            'has_next': has_next
-        }
+    except Exception as e:
+        logger.error(f"GET /api/items エラー: {e}", exc_info=True)
+        return jsonify({'error': str(e)}), 500
 
-        session.close()
-        return jsonify(response)
+
+@api_bp.route('/items/export', methods=['GET'])
+def export_items():
+    """
+    GET /api/items/export
+    フィルタ条件に一致する全アイテムをNDJSONまたはCSVでストリーミング出力
+    （一覧の並び順。件数に関係なくメモリ使用量は一定）
+
+    Query Parameters:
+        format: 出力形式（ndjson, csv。デフォルト: ndjson）
+        period: 期間（24h, 7d, 30d, all。デフォルト: all）
+        importance: 重要度（all, high, medium_up）
+        category: カテゴリ（all, またはカテゴリ名）
+        keyword: キーワード検索
+        fields: 出力する項目（カンマ区切り。省略時は全項目）
+
+    Returns:
+        NDJSON（1行1アイテム）またはCSV（ヘッダー行付き、UTF-8）
+    """
+    export_format = request.args.get('format', 'ndjson')
+    if export_format not in EXPORT_FORMATS:
+        return jsonify({'error': 'format は ndjson / csv で指定してください'}), 400
+    try:
+        fields = parse_fields(request.args.get('fields'))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    filters = {
+        'period': request.args.get('period', 'all'),
+        'importance': request.args.get('importance', 'all'),
+        'category': request.args.get('category', 'all'),
+        'keyword': request.args.get('keyword', '')
+    }
+
+    def generate():
+        # 出力が終わるまでセッション（カーソル）を開いたままにする
+        session = get_db_manager().get_session()
+        try:
+            rows = iter_item_rows(session, filters, fields)
+            yield from buffer_chunks(format_rows(rows, export_format, fields))
+        except Exception as e:
+            # ステータスコードは送信済みのため、ログに記録して出力を打ち切る
+            logger.error(f"GET /api/items/export エラー: {e}", exc_info=True)
+        finally:
+            session.close()
+
+    jst = pytz.timezone('Asia/Tokyo')
+    filename = datetime.now(jst).strftime(f'items_%Y%m%d_%H%M%S.{export_format}')
+    return Response(
+        stream_with_context(generate()),
+        mimetype=EXPORT_FORMATS[export_format],
+        headers={'Content-Disposition': f'attachment; filename={filename}'}
+    )
+
+
+@api_bp.route('/items/<int:item_id>', methods=['GET'])
+def get_item(item_id):
+    """
+    GET /api/items/<アイテムID>
+    アイテムの全項目を取得（一覧は fields で項目を絞り、詳細はこちらで取得する）
+
+    Returns:
+        JSON: アイテムの全項目（Item.to_dict）
+        ETagを付けて返し、If-None-Match が一致する場合は本文なしの 304 を返す
+    """
+    try:
+        db_manager = get_db_manager()
+        session = db_manager.get_session()
+
+        try:
+            # アイテムが書き込まれるまでは同じレスポンスを返す
+            key = ('item', item_id)
+            generation = get_generation(session, ITEMS)
+            cached = get_response_cache().get(key, generation)
+            if cached is None:
+                item = session.get(Item, item_id)
+                if item is None:
+                    return jsonify({'error': f'アイテムが見つかりません: {item_id}'}), 404
+                cached = get_response_cache().put(key, generation, jsonify(item.to_dict()).get_data())
+        finally:
+            session.close()
+
+        return _conditional_response(cached)
 
     except Exception as e:
-        logger.error(f"GET /api/items エラー: {e}", exc_info=True)
+        logger.error(f"GET /api/items/{item_id} エラー: {e}", exc_info=True)
         return jsonify({'error': str(e)}), 500
 
 
+def _build_items_body(session, filters, generation, sort, cursor, page, per_page, count_mode, fields) -> bytes:
+    """
+    GET /api/items のレスポンス本文を作成
+
+    Raises:
+        ValueError: カーソルが不正な場合
+    """
+    query = build_item_query(session, *filters)
+
+    # 総件数（全件を数えるため、求められた場合のみ計算してキャッシュする）
+    total = None
+    if count_mode == 'exact':
+        total = _count_cache.get_or_compute(filters, generation, query.count)
+    elif count_mode == 'cached':
+        total = _count_cache.get(filters, generation)
+
+    # ソート: (関連度順の場合はキーワードとの関連度 ->) 重要度スコア降順 -> 公開日時降順
+    if sort == 'relevance':
+        query = order_by_relevance(query, session, filters[3])
+    query = order_items(query)
+
+    # ページネーション（カーソル指定時はカーソルの位置から取得し、深いページでも一定のコストで済む）
+    if cursor:
+        query = apply_cursor(query, cursor)
+    else:
+        query = query.offset((page - 1) * per_page)
+
+    # 必要なカラムだけを行として読む（ORMオブジェクトを作らず、日時はJSON変換時に文字列にする）
+    fields = fields or ITEM_DICT_FIELDS
+    query = project_items(query, fields)
+
+    # 1件多く取得して次ページがあるか判定
+    items = query.limit(per_page + 1).all()
+    has_next = len(items) > per_page
+    items = items[:per_page]
+
+    return jsonify({
+        'items': [row_to_dict(item, fields) for item in items],
+        'total': total,
+        'page': page,
+        'per_page': per_page,
+        'has_next': has_next,
+        'next_cursor': encode_cursor(items[-1]) if has_next and sort == 'score' else None
+    }).get_data()
+
+
+def _conditional_response(cached: CachedResponse) -> Response:
+    """
+    キャッシュしたレスポンスにETagを付けて返す
+    （If-None-Match が一致する場合は本文なしの 304 Not Modified）
+    """
+    response = Response(cached.body, mimetype='application/json')
+    response.set_etag(cached.etag)
+    # ブラウザや中継サーバーがキャッシュを使う前に必ずETagで確認させる
+    response.headers['Cache-Control'] = 'no-cache'
+    return response.make_conditional(request)
+
+
 @api_bp.route('/execute', methods=['POST'])
 def execute_collection():
     """
     POST /api/execute
-    情報収集を実行
+    情報収集の実行をジョブキューに登録（ワーカープロセスが実行する）
+
+    Request Body (JSON, 任意):
+        stream: Trueの場合、判定済みのものから順に保存するストリーミングモードで実行
+            （省略時は設定に従う）
 
     Returns:
         JSON:
@@ -151,41 +338,16 @@ def execute_collection():
             "message": メッセージ
         }
     """
-    global execution_state
-
     try:
-        # すでに実行中の場合
-        if execution_state['is_running']:
-            return jsonify({
-                'status': 'already_running',
-                'execution_id': execution_state['current_execution_id'],
-                'message': 'すでに実行中です'
-            }), 409
-
-        # バックグラウンドで実行
-        def run_executor():
-            global execution_state
-            try:
-                executor = NatsuAgentExecutor()
-                result = executor.execute()
-                logger.info(f"バックグラウンド実行完了: {result}")
-            except Exception as e:
-                logger.error(f"バックグラウンド実行エラー: {e}", exc_info=True)
-            finally:
-                execution_state['is_running'] = False
-                execution_state['current_execution_id'] = None
-                execution_state['started_at'] = None
-
-        # 実行状態を更新
+        body = request.get_json(silent=True) or {}
+
         jst = pytz.timezone('Asia/Tokyo')
         execution_id = datetime.now(jst).strftime('exec_%Y%m%d_%H%M%S')
-        execution_state['is_running'] = True
-        execution_state['current_execution_id'] = execution_id
-        execution_state['started_at'] = datetime.now(jst).isoformat()
 
-        # スレッドで実行
-        thread = threading.Thread(target=run_executor, daemon=True)
-        thread.start()
+        _expire_unclaimed_jobs()
+        job = get_job_queue().enqueue('execute', execution_id, {'stream': body.get('stream')})
+        if job is None:
+            return _already_running_response()
 
         return jsonify({
             'status': 'started',
@@ -195,10 +357,74 @@ def execute_collection():
 
     except Exception as e:
         logger.error(f"POST /api/execute エラー: {e}", exc_info=True)
-        execution_state['is_running'] = False
         return jsonify({'error': str(e)}), 500
 
 
+@api_bp.route('/executions/<execution_id>/resume', methods=['POST'])
+def resume_execution(execution_id):
+    """
+    POST /api/executions/<execution_id>/resume
+    失敗した実行を完了済みの段階（収集済み・判定済み）から再開（ジョブキューに登録する）
+
+    Returns:
+        JSON:
+        {
+            "status": "started" or "already_running",
+            "execution_id": 実行ID,
+            "message": メッセージ
+        }
+    """
+    try:
+        db_manager = get_db_manager()
+        session = db_manager.get_session()
+        try:
+            execution = session.query(Execution).filter_by(id=execution_id).first()
+        finally:
+            session.close()
+
+        if execution is None:
+            return jsonify({'error': f'実行が見つかりません: {execution_id}'}), 404
+        if execution.status in ('success', 'partial'):
+            return jsonify({'error': f'実行はすでに完了しています: {execution_id}'}), 400
+
+        _expire_unclaimed_jobs()
+        job = get_job_queue().enqueue('resume', execution_id)
+        if job is None:
+            return _already_running_response()
+
+        return jsonify({
+            'status': 'started',
+            'execution_id': execution_id,
+            'message': '実行を再開しました'
+        })
+
+    except Exception as e:
+        logger.error(f"POST /api/executions/{execution_id}/resume エラー: {e}", exc_info=True)
+        return jsonify({'error': str(e)}), 500
+
+
+def _expire_unclaimed_jobs():
+    """
+    ワーカーに取り出されないまま worker.stale_queued_minutes を過ぎた待機中のジョブを解放
+    （ワーカーが起動していないと、待機中のジョブが枠を持ち続けて実行を登録できなくなるため）
+    """
+    config = get_config_service().settings().get('worker', {})
+    for execution_id in get_job_queue().expire_queued(config.get('stale_queued_minutes', 30)):
+        logger.warning(f"ワーカーに取り出されなかったジョブを期限切れにしました: {execution_id}")
+
+
+def _already_running_response():
+    """
+    待機中・実行中のジョブがある場合のレスポンス
+    """
+    job = get_job_queue().active_job()
+    return jsonify({
+        'status': 'already_running',
+        'execution_id': job['execution_id'] if job else None,
+        'message': 'すでに実行中です'
+    }), 409
+
+
 @api_bp.route('/status', methods=['GET'])
 def get_status():
     """
@@ -208,12 +434,130 @@ def get_status():
     Returns:
         JSON:
         {
-            "is_running": true/false,
-            "execution_id": 実行ID,
-            "started_at": 開始日時
+            "is_running": true/false（ワーカーの実行待ち・コマンドラインからの実行も含む）,
+            "status": ジョブのステータス（queued/running、実行中でなければNone）,
+            "current_execution_id": 実行ID,
+            "started_at": 開始日時（実行待ちの場合は登録日時）,
+            "worker_missing": 実行待ちのジョブが worker.missing_after_sec 以上取り出されていない場合true
+                （ワーカーが起動していない）
         }
     """
-    return jsonify(execution_state)
+    try:
+        return jsonify(_current_status())
+
+    except Exception as e:
+        logger.error(f"GET /api/status エラー: {e}", exc_info=True)
+        return jsonify({'error': str(e)}), 500
+
+
+def _current_status():
+    """
+    ジョブキューから現在の実行状態を作成
+    （ジョブキューを経由しないコマンドラインからの実行は、実行中の実行記録から作成する）
+    """
+    _expire_unclaimed_jobs()
+
+    job_queue = get_job_queue()
+    job = job_queue.active_job()
+    if job is None:
+        stale_minutes = get_config_service().settings().get('schedule', {}).get('stale_running_minutes', 120)
+        execution = job_queue.running_execution(stale_minutes)
+        if execution:
+            return {
+                'is_running': True,
+                'status': 'running',
+                'current_execution_id': execution['id'],
+                'started_at': execution['started_at'],
+                'worker_missing': False
+            }
+        return {
+            'is_running': False,
+            'status': None,
+            'current_execution_id': None,
+            'started_at': None,
+            'worker_missing': False
+        }
+
+    worker_missing = False
+    if job['status'] == 'queued':
+        missing_after = get_config_service().settings().get('worker', {}).get('missing_after_sec', 60)
+        worker_missing = job_queue.waiting_since(missing_after) is not None
+
+    return {
+        'is_running': True,
+        'status': job['status'],
+        'current_execution_id': job['execution_id'],
+        'started_at': job['claimed_at'] or job['created_at'],
+        'worker_missing': worker_missing
+    }
+
+
+@api_bp.route('/events', methods=['GET'])
+def stream_events():
+    """
+    GET /api/events
+    実行の進捗をServer-Sent Eventsで配信
+
+    接続直後に現在の実行状態（status イベント）を送り、以降は進捗イベントを記録順に送る。
+    再接続時は Last-Event-ID ヘッダー（または last_event_id パラメータ）以降のイベントを再送する。
+
+    Events:
+        status: 現在の実行状態（/api/status と同じ内容）
+        job_queued / job_finished: ジョブの登録・終了
+        execution_started / execution_finished: 実行の開始・終了（件数・メッセージ）
+        agent_started / agent_finished: Agentの収集開始・終了（件数）
+        judge_started / judge_finished: Claude判定バッチの開始・終了（件数）
+        saved: 保存した件数
+    """
+    last_event_id = request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
+    try:
+        last_event_id = int(last_event_id) if last_event_id else None
+    except ValueError:
+        last_event_id = None
+
+    broadcaster = get_event_broadcaster()
+    keepalive = _event_settings.get('keepalive_sec', 15)
+
+    try:
+        replay, subscriber = broadcaster.subscribe(last_event_id)
+        status = _current_status()
+    except Exception as e:
+        logger.error(f"GET /api/events エラー: {e}", exc_info=True)
+        return jsonify({'error': str(e)}), 500
+
+    def generate():
+        try:
+            yield _format_sse('status', status)
+            for event in replay:
+                yield _format_sse(event['event_type'], event, event['id'])
+
+            while True:
+                try:
+                    event = subscriber.get(timeout=keepalive)
+                except queue.Empty:
+                    # 接続を維持するためのコメント行（切断されたクライアントもここで検知される）
+                    yield ': keepalive\n\n'
+                    continue
+                yield _format_sse(event['event_type'], event, event['id'])
+        finally:
+            broadcaster.unsubscribe(subscriber)
+
+    return Response(generate(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no',  # リバースプロキシでバッファリングしない
+    })
+
+
+def _format_sse(event_type, data, event_id=None):
+    """
+    Server-Sent Eventsの1イベント分の文字列を作成
+    """
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event_type}")
+    lines.append(f"data: {json.dumps(data, ensure_ascii=False)}")
+    return '\n'.join(lines) + '\n\n'
 
 
 @api_bp.route('/logs', methods=['GET'])
@@ -230,6 +574,7 @@ def get_logs():
         {
             "logs": [...]
         }
+        ETagを付けて返し、If-None-Match が一致する場合は本文なしの 304 を返す
     """
     try:
         limit = int(request.args.get('limit', 10))
@@ -237,17 +582,24 @@ def get_logs():
         db_manager = get_db_manager()
         session = db_manager.get_session()
 
-        # 最新の実行ログを取得
-        executions = session.query(Execution).order_by(
-            desc(Execution.started_at)
-        ).limit(limit).all()
-
-        response = {
-            'logs': [execution.to_dict() for execution in executions]
-        }
+        try:
+            def build():
+                # 最新の実行ログを取得
+                executions = session.query(Execution).order_by(
+                    desc(Execution.started_at)
+                ).limit(limit).all()
+                return jsonify({
+                    'logs': [execution.to_dict() for execution in executions]
+                }).get_data()
+
+            # 実行記録が更新されるまでは同じレスポンスを返す
+            cached = get_response_cache().get_or_build(
+                ('logs', limit), get_generation(session, EXECUTIONS), build
+            )
+        finally:
+            session.close()
 
-        session.close()
-        return jsonify(response)
+        return _conditional_response(cached)
 
     except Exception as e:
         logger.error(f"GET /api/logs エラー: {e}", exc_info=True)
@@ -265,17 +617,22 @@ def get_categories():
         {
             "categories": [...]
         }
+        ETagを付けて返し、If-None-Match が一致する場合は本文なしの 304 を返す
     """
     try:
-        import json
-        with open('config/settings.json', 'r', encoding='utf-8') as f:
-            settings = json.load(f)
+        config = get_config_service()
 
-        categories = settings.get('judgment_criteria', {}).get('categories', [])
+        def build():
+            categories = config.settings().get('judgment_criteria', {}).get('categories', [])
+            return jsonify({
+                'categories': categories
+            }).get_data()
 
-        return jsonify({
-            'categories': categories
-        })
+        # 設定ファイルが更新されるまでは同じレスポンスを返す（更新の確認はファイルの更新日時のみ）
+        cached = get_response_cache().get_or_build(
+            ('categories',), config.version(SETTINGS_PATH), build
+        )
+        return _conditional_response(cached)
 
     except Exception as e:
         logger.error(f"GET /api/categories エラー: {e}", exc_info=True)
@@ -11,6 +11,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../.
 from flask import Flask, render_template
 from flask_cors import CORS
 from src.utils.logger import get_logger
+from src.web.json_provider import FastJSONProvider
 
 # ロガーを取得
 logger = get_logger()
@@ -24,7 +25,8 @@ def create_app():
         Flaskアプリケーション
     """
     app = Flask(__name__)
-    app.config['JSON_AS_ASCII'] = False  # 日本語のJSONレスポンス対応
+    # JSONレスポンスは日本語をエスケープせず、orjson があれば orjson で変換する
+    app.json = FastJSONProvider(app)
 
     # CORSを有効化
     CORS(app)
@@ -0,0 +1,32 @@
+"""
+FlaskのJSONプロバイダー
+jsonify / app.json による変換を src/utils/json_serializer.py（orjson があれば orjson）で行う
+"""
+from flask.json.provider import JSONProvider
+
+from src.utils.json_serializer import dumps, dumps_bytes, loads
+
+
+class FastJSONProvider(JSONProvider):
+    """
+    json_serializer で変換するJSONプロバイダー（日本語をエスケープせず、日時はISO 8601）
+    """
+
+    def dumps(self, obj, **kwargs) -> str:
+        """
+        JSON文字列に変換（json.dumps 向けの引数は使わない）
+        """
+        return dumps(obj)
+
+    def loads(self, s, **kwargs):
+        """
+        JSON文字列を読み込む
+        """
+        return loads(s)
+
+    def response(self, *args, **kwargs):
+        """
+        JSONレスポンスを作成（文字列を経由せずバイト列を本文にする）
+        """
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumps_bytes(obj), mimetype='application/json')
@@ -0,0 +1,121 @@
+"""
+読み取りAPIのレスポンスキャッシュ
+正規化したクエリパラメータとデータの世代番号をキーに、シリアライズ済みのレスポンス本文をメモリに保持する
+
+データが変わるのは実行・バッチ判定で書き込まれたときだけのため、世代番号（data_generations）が
+進むまでは同じ本文を返し、DBへの問い合わせとJSONへの変換を省く。
+本文と一緒に本文のハッシュ（ETag）も保持し、If-None-Match による条件付きリクエストに使う。
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, NamedTuple, Optional, Tuple
+
+
+class CachedResponse(NamedTuple):
+    """
+    キャッシュしたレスポンス
+    """
+    body: bytes
+    etag: str
+
+
+def compute_etag(body: bytes) -> str:
+    """
+    レスポンス本文からETag（強いバリデータ）を作成
+
+    期間フィルタの結果は書き込みがなくても時間の経過で変わるため、世代番号ではなく本文から作成する。
+
+    Args:
+        body: レスポンス本文
+
+    Returns:
+        ETag（引用符なし）
+    """
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+class ResponseCache:
+    """
+    世代番号で無効化するLRUのレスポンスキャッシュ（プロセス内）
+    """
+
+    def __init__(self, max_entries: int = 512, ttl_sec: float = 60):
+        """
+        初期化
+
+        Args:
+            max_entries: 保持するレスポンスの数の上限
+            ttl_sec: キャッシュの有効期間（秒）。
+                期間フィルタ等、書き込みがなくても時間の経過で変わる結果の古さの上限
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl_sec
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple, generation: Any) -> Optional[CachedResponse]:
+        """
+        キャッシュ済みのレスポンスを取得
+
+        Args:
+            key: エンドポイントと正規化したクエリパラメータ
+            generation: 現在のデータの世代番号
+
+        Returns:
+            レスポンス（キャッシュがない・世代が古い・期限切れの場合はNone）
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] != generation or time.monotonic() - entry[2] > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: Tuple, generation: Any, body: bytes) -> CachedResponse:
+        """
+        レスポンス本文を保存（上限を超えた場合は最も使われていないものから削除）
+
+        Args:
+            key: エンドポイントと正規化したクエリパラメータ
+            generation: 本文を作成したときのデータの世代番号
+            body: レスポンス本文
+
+        Returns:
+            保存したレスポンス
+        """
+        cached = CachedResponse(body, compute_etag(body))
+        with self._lock:
+            self._entries[key] = (generation, cached, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return cached
+
+    def get_or_build(self, key: Tuple, generation: Any, build: Callable[[], bytes]) -> CachedResponse:
+        """
+        レスポンスを取得（キャッシュがなければ本文を作成して保存）
+
+        Args:
+            key: エンドポイントと正規化したクエリパラメータ
+            generation: 現在のデータの世代番号
+            build: レスポンス本文を作成する関数（例外を送出した場合は保存しない）
+
+        Returns:
+            レスポンス
+        """
+        cached = self.get(key, generation)
+        if cached is None:
+            cached = self.put(key, generation, build())
+        return cached
+
+    def clear(self):
+        """
+        全てのキャッシュを削除
+        """
+        with self._lock:
+            self._entries.clear()
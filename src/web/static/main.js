@@ -9,7 +9,19 @@ let currentFilters = {
     keyword: ''
 };
 let hasNextPage = false;
+let nextCursor = null; // 次ページを取得するカーソル（/api/items の next_cursor）
+let shownCount = 0; // 表示済みのアイテム数
+let renderedClusters = {}; // cluster_id -> 表示済みカード（近似重複をまとめて表示する）
 let wasRunning = false; // 前回の実行状態を記憶して完了を検知する
+let savedInRun = 0; // 実行中に保存された件数
+let shownTotal = null; // 表示中の一覧の総件数（実行中に保存された新着の検知に使う）
+const responseCache = new Map(); // URL -> { etag, data }（変更がなければサーバーは 304 を返す）
+const RESPONSE_CACHE_SIZE = 50;
+// 一覧のカードで使う項目（本文は抜粋だけを受け取り、全項目は /api/items/<id> で取得できる）
+const ITEM_LIST_FIELDS = [
+    'id', 'source', 'title', 'content_snippet', 'summary', 'url', 'published_at',
+    'importance_score', 'importance_level', 'category', 'metrics', 'cluster_id'
+].join(',');
 
 // ページ読み込み時の初期化
 document.addEventListener('DOMContentLoaded', function() {
@@ -25,8 +37,8 @@ document.addEventListener('DOMContentLoaded', function() {
     // 最終実行情報を読み込み
     loadLastExecution();
 
-    // 実行状態を定期的にチェック
-    setInterval(checkExecutionStatus, 3000);
+    // 実行の進捗を受信（実行状態の変化はサーバーから通知される）
+    subscribeExecutionEvents();
 });
 
 // イベントリスナーの設定
@@ -48,11 +60,33 @@ function setupEventListeners() {
     });
 }
 
+// APIからJSONを取得（前回のETagを送り、変更がない場合は前回の内容を使う）
+async function fetchJson(url) {
+    const cached = responseCache.get(url);
+    const headers = cached ? { 'If-None-Match': cached.etag } : {};
+    const response = await fetch(url, { headers });
+
+    if (response.status === 304 && cached) {
+        return cached.data;
+    }
+
+    const data = await response.json();
+    const etag = response.headers.get('ETag');
+    if (response.ok && etag) {
+        responseCache.delete(url);
+        responseCache.set(url, { etag, data });
+        // 古いものから削除して件数を制限する
+        if (responseCache.size > RESPONSE_CACHE_SIZE) {
+            responseCache.delete(responseCache.keys().next().value);
+        }
+    }
+    return data;
+}
+
 // カテゴリを読み込み
 async function loadCategories() {
     try {
-        const response = await fetch('/api/categories');
-        const data = await response.json();
+        const data = await fetchJson('/api/categories');
 
         const categorySelect = document.getElementById('categoryFilter');
         data.categories.forEach(category => {
@@ -73,6 +107,9 @@ async function loadItems(append = false) {
     if (!append) {
         container.innerHTML = '<div class="loading">読み込み中...</div>';
         currentPage = 1;
+        nextCursor = null;
+        shownCount = 0;
+        renderedClusters = {};
     }
 
     try {
@@ -81,15 +118,22 @@ async function loadItems(append = false) {
             importance: currentFilters.importance,
             category: currentFilters.category,
             keyword: currentFilters.keyword,
-            page: currentPage,
-            per_page: 20
+            per_page: 20,
+            fields: ITEM_LIST_FIELDS
         });
+        // 続きはカーソルで取得（何ページ目でも同じコストで、途中で新着が保存されても重複・欠落しない）
+        // 総件数は1ページ目でのみ取得する
+        if (append && nextCursor) {
+            params.set('cursor', nextCursor);
+        } else {
+            params.set('count', 'exact');
+        }
 
-        const response = await fetch(`/api/items?${params}`);
-        const data = await response.json();
+        const data = await fetchJson(`/api/items?${params}`);
 
         if (!append) {
             container.innerHTML = '';
+            shownTotal = data.total;
         } else {
             // ローディング表示を削除
             const loading = container.querySelector('.loading');
@@ -101,7 +145,16 @@ async function loadItems(append = false) {
             container.innerHTML = '<div class="empty-message">該当する情報が見つかりませんでした</div>';
         } else {
             data.items.forEach(item => {
-                container.appendChild(createItemCard(item));
+                // 同じクラスタの記事は最初のカードにまとめる
+                if (item.cluster_id && renderedClusters[item.cluster_id]) {
+                    addDuplicateToCard(renderedClusters[item.cluster_id], item);
+                    return;
+                }
+                const card = createItemCard(item);
+                if (item.cluster_id) {
+                    renderedClusters[item.cluster_id] = card;
+                }
+                container.appendChild(card);
             });
         }
 
@@ -168,7 +221,7 @@ function createItemCard(item) {
         </div>
         ${item.title ? `<div class="item-title">${escapeHtml(item.title)}</div>` : ''}
         ${item.summary ? `<div class="item-summary">${escapeHtml(item.summary)}</div>` : ''}
-        ${item.content && !item.summary ? `<div class="item-summary">${escapeHtml(item.content.substring(0, 100))}...</div>` : ''}
+        ${item.content_snippet && !item.summary ? `<div class="item-summary">${escapeHtml(item.content_snippet.substring(0, 100))}...</div>` : ''}
         ${metricsHTML}
         <a href="${item.url}" target="_blank" class="item-link">記事を開く ↗</a>
     `;
@@ -176,17 +229,41 @@ function createItemCard(item) {
     return card;
 }
 
+// 近似重複の記事をカードにまとめる
+function addDuplicateToCard(card, item) {
+    let duplicates = card.querySelector('.item-duplicates');
+    if (!duplicates) {
+        duplicates = document.createElement('details');
+        duplicates.className = 'item-duplicates';
+        duplicates.innerHTML = '<summary></summary><ul></ul>';
+        card.appendChild(duplicates);
+    }
+
+    const li = document.createElement('li');
+    const link = document.createElement('a');
+    link.href = item.url;
+    link.target = '_blank';
+    link.textContent = item.title || (item.content_snippet || item.url).substring(0, 60);
+    li.appendChild(link);
+    duplicates.querySelector('ul').appendChild(li);
+
+    const count = duplicates.querySelectorAll('li').length;
+    duplicates.querySelector('summary').textContent = `類似の記事・投稿 ${count}件`;
+}
+
 // ページネーション情報を更新
 function updatePagination(data) {
     const itemCount = document.getElementById('itemCount');
     const loadMoreBtn = document.getElementById('loadMoreBtn');
 
-    const start = (data.page - 1) * data.per_page + 1;
-    const end = Math.min(start + data.items.length - 1, data.total);
-
-    itemCount.textContent = `表示: ${start}-${end} / ${data.total}件`;
+    shownCount += data.items.length;
+    if (data.total !== null) {
+        shownTotal = data.total;
+    }
+    itemCount.textContent = `表示: ${shownCount} / ${shownTotal}件`;
 
     hasNextPage = data.has_next;
+    nextCursor = data.next_cursor;
     loadMoreBtn.style.display = hasNextPage ? 'block' : 'none';
 }
 
@@ -226,8 +303,11 @@ async function executeCollection() {
     statusDiv.textContent = '情報収集を開始しています...';
 
     try {
+        // 判定済みのものから一覧に表示されるようストリーミングモードで実行
         const response = await fetch('/api/execute', {
-            method: 'POST'
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ stream: true })
         });
         const data = await response.json();
 
@@ -244,39 +324,109 @@ async function executeCollection() {
     }
 }
 
-// 実行状態をチェック
-async function checkExecutionStatus() {
-    try {
-        const response = await fetch('/api/status');
-        const data = await response.json();
-
-        const btn = document.getElementById('executeBtn');
-        const statusDiv = document.getElementById('executionStatus');
+// 実行の進捗をServer-Sent Eventsで受信（切断時はブラウザが自動で再接続し、未受信分は再送される）
+function subscribeExecutionEvents() {
+    const source = new EventSource('/api/events');
+    const on = (type, handler) => source.addEventListener(type, (e) => handler(JSON.parse(e.data)));
 
+    // 接続直後の実行状態
+    on('status', (data) => {
         if (data.is_running) {
-            btn.disabled = true;
-            statusDiv.textContent = '情報収集中...';
+            // ワーカーが取り出すまでは実行待ち
+            if (data.worker_missing) {
+                showRunning('実行待ち... (ワーカーが起動していません)');
+            } else {
+                showRunning(data.status === 'queued' ? '実行待ち...' : '情報収集中...');
+            }
         } else {
-            btn.disabled = false;
-            statusDiv.textContent = '';
+            showFinished('');
+        }
+    });
 
-            // 直前まで実行中だった場合のみ、完了後にリストと最終実行情報をリロード
-            if (wasRunning) {
-                wasRunning = false;
-                loadItems();          // 最新データを取得
-                loadLastExecution();  // 最終実行情報を更新
-            }
+    on('job_queued', () => showRunning('実行待ち...'));
+    on('execution_started', () => {
+        savedInRun = 0;
+        showRunning('情報収集中...');
+    });
+    on('agent_started', (event) => showRunning(`情報収集中... (${event.data.agent})`));
+    on('agent_finished', (event) => {
+        const d = event.data;
+        const result = d.status === 'success' ? `${d.count} 件` : (d.status === 'skipped' ? 'スキップ' : '失敗');
+        showRunning(`情報収集中... (${d.agent}: ${result})`);
+    });
+    on('judge_started', (event) => showRunning(`判定中... (${event.data.items} 件)`));
+    on('judge_finished', (event) => showRunning(`判定完了: ${event.data.items} 件中 ${event.data.passed} 件が基準を満たしました`));
+    on('saved', (event) => {
+        savedInRun += event.data.count;
+        showRunning(`保存中... (${savedInRun} 件保存済み)`);
+
+        // ストリーミング実行では判定済みのものから保存されるため、実行中も新着を反映する
+        if (event.data.count > 0) {
+            refreshItemsIfChanged();
+        }
+    });
+    on('execution_finished', (event) => showFinished(event.data.message || ''));
+    on('job_finished', (event) => {
+        // 実行を開始できずに終わった場合（再開できない実行など）
+        if (event.data.status === 'failed') {
+            showFinished(`エラー: ${event.data.error || '実行に失敗しました'}`);
+        } else {
+            showFinished(null);
+        }
+    });
+}
+
+// 実行中の表示
+function showRunning(message) {
+    document.getElementById('executeBtn').disabled = true;
+    document.getElementById('executionStatus').textContent = message;
+    wasRunning = true;
+}
+
+// 実行終了の表示（message が null の場合は表示を変えない）
+function showFinished(message) {
+    document.getElementById('executeBtn').disabled = false;
+    if (message !== null) {
+        document.getElementById('executionStatus').textContent = message;
+    }
+
+    // 直前まで実行中だった場合のみ、完了後にリストと最終実行情報をリロード
+    if (wasRunning) {
+        wasRunning = false;
+        loadItems();          // 最新データを取得
+        loadLastExecution();  // 最終実行情報を更新
+    }
+}
+
+// 総件数が変わっていれば一覧を再読み込み（1ページ目を表示中の場合のみ）
+async function refreshItemsIfChanged() {
+    if (currentPage !== 1 || shownTotal === null) return;
+
+    try {
+        const params = new URLSearchParams({
+            period: currentFilters.period,
+            importance: currentFilters.importance,
+            category: currentFilters.category,
+            keyword: currentFilters.keyword,
+            per_page: 1,
+            count: 'exact',
+            fields: 'id'
+        });
+
+        const data = await fetchJson(`/api/items?${params}`);
+
+        if (data.total !== shownTotal) {
+            loadItems();
         }
     } catch (error) {
-        console.error('ステータスチェックエラー:', error);
+        console.error('新着チェックエラー:', error);
     }
 }
 
 // 最終実行情報を読み込み
 async function loadLastExecution() {
     try {
-        const response = await fetch('/api/logs?limit=1');
-        const data = await response.json();
+        const data = await fetchJson('/api/logs?limit=1');
 
         if (data.logs.length > 0) {
             const lastExec = data.logs[0];
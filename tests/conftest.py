@@ -0,0 +1,63 @@
+"""
+テストの共通設定
+
+- DBはテストごとに新しいインメモリSQLite（StaticPoolのため全スレッドで1つの接続を共有する）
+- 設定ファイル・プロンプトはリポジトリの config/ を使う
+- Claude APIは呼び出さない（スタブサーバーまたはテスト内の判定関数を使う）
+"""
+import os
+import logging
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# 既存のDB・APIキーを使わないよう、モジュールの読み込み前に設定する
+os.environ['DB_TYPE'] = 'sqlite'
+os.environ['DB_PATH'] = ':memory:'
+os.environ['CLAUDE_API_KEY'] = 'test-key'
+
+# logs/ にファイルを作らない（get_logger が返すロガーを先に用意しておく）
+from src.utils import logger as logger_module  # noqa: E402
+
+logger_module._global_logger = logging.getLogger('natsu_agent')
+logger_module._global_logger.addHandler(logging.NullHandler())
+
+
+@pytest.fixture(autouse=True)
+def repo_root(monkeypatch):
+    """
+    設定ファイルの相対パス（config/settings.json 等）をリポジトリから読むため、作業ディレクトリを移動
+    """
+    monkeypatch.chdir(ROOT)
+
+
+@pytest.fixture
+def db_manager(monkeypatch):
+    """
+    空のインメモリDBに接続したデータベースマネージャー（get_db_manager もこれを返す）
+    """
+    from src.database import db_manager as db_module
+    from src.web import api
+
+    monkeypatch.setattr(db_module, '_db_manager', None)
+    manager = db_module.get_db_manager()
+    manager.create_tables()
+
+    # 世代番号はDBごとに0から始まるため、Web APIのキャッシュ・ジョブキューも作り直す
+    monkeypatch.setattr(api, '_job_queue', None)
+    monkeypatch.setattr(api, '_response_cache', None)
+    monkeypatch.setattr(api, '_count_cache', api.ItemCountCache())
+
+    yield manager
+    manager.engine.dispose()
+
+
+@pytest.fixture
+def client(db_manager):
+    """
+    Flaskのテストクライアント
+    """
+    from src.web.app import create_app
+
+    return create_app().test_client()
@@ -0,0 +1,150 @@
+"""
+Web APIのテスト（ETag/304・実行状態・実行の再開）
+"""
+from datetime import datetime
+
+import pytest
+import pytz
+
+from src.database.generations import bump_generation, ITEMS
+from src.database.models import Execution, Item
+
+JST = pytz.timezone('Asia/Tokyo')
+
+
+def add_item(db_manager, url, importance_score=80):
+    """
+    アイテムを登録し、アイテムの世代を進める（保存処理と同じ手順）
+
+    Returns:
+        登録したアイテムのID
+    """
+    session = db_manager.get_session()
+    try:
+        item = Item(
+            source='yahoo_news',
+            title='諸橋沙夏 主演ドラマ決定',
+            url=url,
+            published_at=datetime.now(JST),
+            importance_score=importance_score,
+            importance_level='high',
+        )
+        session.add(item)
+        bump_generation(session, ITEMS)
+        session.commit()
+        return item.id
+    finally:
+        session.close()
+
+
+def add_execution(db_manager, execution_id, status):
+    session = db_manager.get_session()
+    try:
+        session.add(Execution(id=execution_id, started_at=datetime.now(JST), status=status))
+        session.commit()
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def item_id(db_manager):
+    return add_item(db_manager, 'https://news.yahoo.co.jp/articles/first')
+
+
+def test_items_returns_etag_and_304_when_unchanged(client, item_id):
+    response = client.get('/api/items?per_page=5')
+
+    assert response.status_code == 200
+    assert response.headers['Cache-Control'] == 'no-cache'
+    etag = response.headers['ETag']
+    assert [item['id'] for item in response.get_json()['items']] == [item_id]
+
+    not_modified = client.get('/api/items?per_page=5', headers={'If-None-Match': etag})
+
+    assert not_modified.status_code == 304
+    assert not_modified.data == b''
+    assert not_modified.headers['ETag'] == etag
+
+
+def test_items_etag_changes_after_items_are_written(client, db_manager, item_id):
+    etag = client.get('/api/items?per_page=5').headers['ETag']
+
+    new_id = add_item(db_manager, 'https://news.yahoo.co.jp/articles/second', importance_score=90)
+    response = client.get('/api/items?per_page=5', headers={'If-None-Match': etag})
+
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+    assert [item['id'] for item in response.get_json()['items']] == [new_id, item_id]
+
+
+def test_item_detail_returns_etag_and_304(client, item_id):
+    response = client.get(f'/api/items/{item_id}')
+
+    assert response.status_code == 200
+    assert response.get_json()['url'] == 'https://news.yahoo.co.jp/articles/first'
+
+    not_modified = client.get(f'/api/items/{item_id}', headers={'If-None-Match': response.headers['ETag']})
+
+    assert not_modified.status_code == 304
+
+
+def test_missing_item_returns_404(client, db_manager):
+    assert client.get('/api/items/999').status_code == 404
+
+
+def test_status_is_idle_without_jobs(client):
+    assert client.get('/api/status').get_json() == {
+        'is_running': False,
+        'status': None,
+        'current_execution_id': None,
+        'started_at': None,
+        'worker_missing': False
+    }
+
+
+def test_status_reports_execution_started_outside_the_job_queue(client, db_manager):
+    add_execution(db_manager, 'exec_cli', 'running')
+
+    status = client.get('/api/status').get_json()
+
+    assert status['is_running'] is True
+    assert status['status'] == 'running'
+    assert status['current_execution_id'] == 'exec_cli'
+
+
+def test_status_reports_queued_job(client):
+    assert client.post('/api/execute', json={}).status_code == 200
+
+    status = client.get('/api/status').get_json()
+
+    assert status['is_running'] is True
+    assert status['status'] == 'queued'
+
+
+def test_second_execute_request_is_rejected(client):
+    execution_id = client.post('/api/execute', json={}).get_json()['execution_id']
+
+    response = client.post('/api/execute', json={})
+
+    assert response.status_code == 409
+    assert response.get_json()['execution_id'] == execution_id
+
+
+@pytest.mark.parametrize('status', ['success', 'partial'])
+def test_completed_execution_cannot_be_resumed(client, db_manager, status):
+    # partial の実行も NatsuAgentExecutor.resume が再開を拒否するため、キューに入れずに400を返す
+    add_execution(db_manager, 'exec_done', status)
+
+    response = client.post('/api/executions/exec_done/resume')
+
+    assert response.status_code == 400
+
+
+def test_failed_execution_is_queued_for_resume(client, db_manager):
+    add_execution(db_manager, 'exec_failed', 'failed')
+
+    response = client.post('/api/executions/exec_failed/resume')
+
+    assert response.status_code == 200
+    assert response.get_json()['status'] == 'started'
+    assert client.get('/api/status').get_json()['current_execution_id'] == 'exec_failed'
@@ -0,0 +1,89 @@
+"""
+scripts/batch_judge.py の判定結果のDB反映のテスト
+"""
+from datetime import datetime
+
+import pytest
+import pytz
+
+from scripts.batch_judge import merge_results_into_database
+from src.database.models import Item, Judgment
+from src.utils.url_canonicalizer import canonical_key
+
+JST = pytz.timezone('Asia/Tokyo')
+
+KEPT_URL = 'https://news.yahoo.co.jp/articles/kept'
+REJECTED_URL = 'https://news.yahoo.co.jp/articles/rejected'
+
+
+@pytest.fixture
+def stored_items(db_manager):
+    """
+    以前の判定で基準を通過して保存済みのアイテム
+    """
+    session = db_manager.get_session()
+    try:
+        for url in (KEPT_URL, REJECTED_URL):
+            session.add(Item(
+                source='yahoo_news',
+                title='諸橋沙夏 主演ドラマ決定',
+                url=url,
+                canonical_key=canonical_key(url),
+                published_at=datetime.now(JST),
+                relevance_score=90,
+                importance_score=85,
+                importance_level='high',
+            ))
+        session.commit()
+    finally:
+        session.close()
+
+
+def judged(url, importance_score, importance_level):
+    return {
+        'source': 'yahoo_news',
+        'title': '諸橋沙夏 主演ドラマ決定',
+        'url': url,
+        'relevance_score': 90,
+        'importance_score': importance_score,
+        'importance_level': importance_level,
+        'category': 'イベント',
+        'judge_tier': 'strong',
+    }
+
+
+def rejudge(db_manager, keep_rejected=False):
+    """
+    KEPT_URL は基準を通過、REJECTED_URL は通過しなかった再判定結果を反映
+    """
+    judged_items = [judged(KEPT_URL, 70, 'medium'), judged(REJECTED_URL, 10, 'low')]
+    on_results = merge_results_into_database(db_manager, 'batch_test', insert_new=False, keep_rejected=keep_rejected)
+    on_results(judged_items, judged_items[:1])
+
+
+def stored_scores(db_manager):
+    session = db_manager.get_session()
+    try:
+        return {item.url: item.importance_score for item in session.query(Item)}
+    finally:
+        session.close()
+
+
+def test_rejudge_removes_items_that_no_longer_pass(db_manager, stored_items):
+    rejudge(db_manager)
+
+    assert stored_scores(db_manager) == {KEPT_URL: 70}
+
+    # 判定結果は削除したアイテムの分も残る
+    session = db_manager.get_session()
+    try:
+        passed = {judgment.url: judgment.passed for judgment in session.query(Judgment)}
+    finally:
+        session.close()
+    assert passed == {KEPT_URL: True, REJECTED_URL: False}
+
+
+def test_rejudge_keeps_previous_judgment_with_keep_rejected(db_manager, stored_items):
+    rejudge(db_manager, keep_rejected=True)
+
+    assert stored_scores(db_manager) == {KEPT_URL: 70, REJECTED_URL: 85}
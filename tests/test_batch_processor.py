@@ -0,0 +1,126 @@
+"""
+ClaudeBatchProcessor のテスト
+scripts/batch_stub_server.py のスタブサーバーに向けて、投入・ポーリング・結果の取り込みをオフラインで確認する
+"""
+import threading
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+from scripts.batch_stub_server import BatchStubHandler
+from src.processors.batch_processor import ClaudeBatchProcessor
+from src.utils.prompt_manager import PromptManager
+
+
+@pytest.fixture
+def stub_server(monkeypatch):
+    """
+    スタブサーバーを起動し、ベースURLを返す（完了扱いになるまで2回ポーリングさせる）
+    """
+    monkeypatch.setattr(BatchStubHandler, 'batches', {})
+    monkeypatch.setattr(BatchStubHandler, 'polls_until_ended', 2)
+    monkeypatch.setattr(BatchStubHandler, 'errored_custom_ids', frozenset())
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), BatchStubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def processor(stub_server, monkeypatch):
+    """
+    スタブサーバーに向けたプロセッサー（通常のAPI呼び出しもスタブサーバーに送る）
+    """
+    monkeypatch.setenv('ANTHROPIC_BASE_URL', stub_server)
+    processor = ClaudeBatchProcessor(PromptManager(), base_url=stub_server)
+    processor.items_per_request = 10
+    processor.max_requests_per_batch = 1000
+    processor.poll_interval_sec = 0
+    return processor
+
+
+def make_items(count):
+    """
+    判定対象のアイテムを作成（3件に1件は本人と無関係な記事）
+    """
+    return [
+        {
+            'source': 'yahoo_news',
+            'title': f'諸橋沙夏 主演ドラマ決定 その{i}' if i % 3 else f'別の話題 その{i}',
+            'content': '春の新ドラマで主演を務める。' if i % 3 else '無関係な記事です。',
+            'url': f'https://news.example.com/articles/{i}',
+            'published_at': '2026-01-01T00:00:00+09:00',
+        }
+        for i in range(count)
+    ]
+
+
+def test_submits_polls_and_collects_results(processor):
+    items = make_items(25)
+    received = []
+
+    summary = processor.judge_items_in_batches(items, lambda judged, passed: received.append((judged, passed)))
+
+    assert summary['batches'] == 1
+    assert summary['requests'] == 3
+    assert summary['judged'] == 25
+    assert summary['errored'] == 0
+    assert summary['fallback'] == 0
+
+    assert len(received) == 1
+    judged, passed = received[0]
+    assert {item['url'] for item in judged} == {item['url'] for item in items}
+    assert {item['url'] for item in passed} == {item['url'] for item in items if '諸橋沙夏' in item['title']}
+    assert all(item['importance_level'] == 'high' for item in passed)
+    assert all(item['judge_tier'] == 'strong' for item in judged)
+
+
+def test_results_are_delivered_per_batch(processor):
+    processor.max_requests_per_batch = 2
+    received = []
+
+    summary = processor.judge_items_in_batches(make_items(45), lambda judged, passed: received.append(judged))
+
+    assert summary['batches'] == 3
+    assert summary['judged'] == 45
+    assert sorted(len(judged) for judged in received) == [5, 20, 20]
+
+
+def test_errored_requests_fall_back_to_direct_calls(processor, monkeypatch):
+    monkeypatch.setattr(BatchStubHandler, 'errored_custom_ids', frozenset({'chunk-000001'}))
+    direct_calls = []
+    call_claude_api = processor._call_claude_api
+
+    def record_call(items, model=None):
+        direct_calls.append([item['url'] for item in items])
+        return call_claude_api(items, model=model)
+
+    monkeypatch.setattr(processor, '_call_claude_api', record_call)
+    items = make_items(25)
+    received = []
+
+    summary = processor.judge_items_in_batches(items, lambda judged, passed: received.extend(judged))
+
+    assert summary['errored'] == 0
+    assert summary['fallback'] == 1
+    assert summary['judged'] == 25
+    assert direct_calls == [[item['url'] for item in items[10:20]]]
+    assert {item['url'] for item in received} == {item['url'] for item in items}
+
+
+def test_errored_requests_are_counted_when_fallback_is_disabled(processor, monkeypatch):
+    monkeypatch.setattr(BatchStubHandler, 'errored_custom_ids', frozenset({'chunk-000001'}))
+    processor.fallback_to_direct = False
+    received = []
+
+    summary = processor.judge_items_in_batches(make_items(25), lambda judged, passed: received.extend(judged))
+
+    assert summary['errored'] == 1
+    assert summary['fallback'] == 0
+    assert summary['judged'] == 15
+    assert len(received) == 15
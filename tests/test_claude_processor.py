@@ -0,0 +1,120 @@
+"""
+ClaudeProcessor のテスト（ティア判定・ローカル分類器の既定値）
+"""
+import pytest
+
+from src.processors.claude_processor import ClaudeProcessor
+from src.processors.local_classifier import LocalClassifier
+from src.utils.prompt_manager import PromptManager
+
+
+@pytest.fixture
+def processor():
+    """
+    閾値を固定したプロセッサー（関連性30、重要度40/70、不確実帯10）
+    """
+    processor = ClaudeProcessor(PromptManager())
+    processor.local_classifier = None
+    processor.fast_model = 'fast-model'
+    processor.uncertainty_band = 10
+    processor.relevance_thresholds = [30]
+    processor.importance_thresholds = [40, 70]
+    return processor
+
+
+def test_tiered_judging_is_disabled_by_default(processor):
+    assert processor.tiered_enabled is False
+
+
+@pytest.mark.parametrize('relevance, importance, expected', [
+    (90, 85, False),    # どの閾値からも離れている
+    (35, 85, True),     # 関連性の閾値付近
+    (25, 85, True),
+    (10, 65, False),    # 関連性が明らかに低い場合は重要度を見ない
+    (90, 65, True),     # 重要度の閾値付近
+    (90, 45, True),
+    (90, 55, False),
+    (90, 80, False),    # 不確実帯の境界ちょうどは含めない
+    (None, 85, True),   # スコアが欠けている判定は信頼できない
+    (90, 'high', True),
+])
+def test_is_borderline(processor, relevance, importance, expected):
+    judgment = {'relevance_score': relevance, 'importance_score': importance}
+
+    assert processor._is_borderline(judgment) is expected
+
+
+def make_judgment(url, relevance, importance):
+    return {'url': url, 'relevance_score': relevance, 'importance_score': importance}
+
+
+def test_only_borderline_and_missing_items_are_escalated(processor):
+    items = [{'url': f'https://example.com/{i}', 'title': f'記事{i}'} for i in range(4)]
+    fast = {
+        items[0]['url']: make_judgment(items[0]['url'], 90, 85),   # 確定
+        items[1]['url']: make_judgment(items[1]['url'], 90, 65),   # 境界付近
+        items[2]['url']: make_judgment(items[2]['url'], 5, 5),     # 確定（対象外）
+        # items[3] は一次判定の結果なし
+    }
+    calls = []
+
+    def call_claude_api(batch, model=None):
+        calls.append((model, [item['url'] for item in batch]))
+        if model == 'fast-model':
+            return [dict(fast[item['url']]) for item in batch if item['url'] in fast]
+        return [make_judgment(item['url'], 95, 90) for item in batch]
+
+    processor._call_claude_api = call_claude_api
+
+    judgments = processor._judge_tiered(items)
+
+    assert calls == [
+        ('fast-model', [item['url'] for item in items]),
+        (None, [items[1]['url'], items[3]['url']]),
+    ]
+    assert [(j['url'], j['judge_tier']) for j in judgments] == [
+        (items[0]['url'], 'fast'),
+        (items[1]['url'], 'strong'),
+        (items[2]['url'], 'fast'),
+        (items[3]['url'], 'strong'),
+    ]
+    assert judgments[1]['importance_score'] == 90
+
+
+def test_fast_model_failure_escalates_everything(processor):
+    items = [{'url': f'https://example.com/{i}', 'title': f'記事{i}'} for i in range(3)]
+
+    def call_claude_api(batch, model=None):
+        if model == 'fast-model':
+            raise RuntimeError('overloaded')
+        return [make_judgment(item['url'], 95, 90) for item in batch]
+
+    processor._call_claude_api = call_claude_api
+
+    judgments = processor._judge_tiered(items)
+
+    assert [j['judge_tier'] for j in judgments] == ['strong'] * 3
+
+
+def test_judge_items_uses_tiers_only_when_enabled(processor):
+    items = [{'url': 'https://example.com/0', 'title': '諸橋沙夏 主演決定', 'content': ''}]
+    models = []
+
+    def call_claude_api(batch, model=None):
+        models.append(model)
+        return [make_judgment(item['url'], 95, 90) for item in batch]
+
+    processor._call_claude_api = call_claude_api
+
+    processor.judge_items(items)
+    processor.tiered_enabled = True
+    processor.judge_items(items)
+
+    assert models == [None, 'fast-model']
+
+
+def test_local_classifier_is_not_loaded_by_default(monkeypatch):
+    # 学習済みのモデルがあっても、有効にするまでは使わない
+    monkeypatch.setattr(LocalClassifier, 'load_latest', classmethod(lambda cls, model_dir: object()))
+
+    assert ClaudeProcessor(PromptManager()).local_classifier is None
@@ -0,0 +1,168 @@
+"""
+ConfigService のテスト（更新日時での読み直し・不正な編集時の前回の内容の維持）と、
+常駐プロセスでの設定の反映（ClaudeProcessor・事前フィルタの作り直し）
+"""
+import json
+import os
+import shutil
+
+import pytest
+
+from main import NatsuAgentExecutor
+from src.processors.claude_processor import ClaudeProcessor
+from src.utils.config_service import ConfigService, get_config_service, SETTINGS_PATH
+from src.utils.prompt_manager import PromptManager
+
+
+def write_file(path, content):
+    """
+    ファイルを書き換え、更新日時を1秒進める（同じ時刻に書き換えても変更として検出させる）
+    """
+    before = os.stat(path).st_mtime_ns if os.path.exists(path) else 0
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    mtime = max(os.stat(path).st_mtime_ns, before + 1_000_000_000)
+    os.utime(path, ns=(mtime, mtime))
+
+
+@pytest.fixture
+def settings_file(tmp_path):
+    path = str(tmp_path / 'settings.json')
+    write_file(path, json.dumps({'filtering': {'min_relevance_score': 30}}))
+    return path
+
+
+def test_reloads_when_mtime_changes(settings_file):
+    service = ConfigService()
+    first = service.get_json(settings_file)
+
+    assert service.get_json(settings_file) is first
+    assert service.version(settings_file) == 1
+
+    write_file(settings_file, json.dumps({'filtering': {'min_relevance_score': 50}}))
+
+    assert service.get_json(settings_file)['filtering']['min_relevance_score'] == 50
+    assert service.version(settings_file) == 2
+
+
+def test_unchanged_file_is_not_read_again(settings_file, monkeypatch):
+    service = ConfigService()
+    service.get_json(settings_file)
+
+    def fail_open(*args, **kwargs):
+        raise AssertionError('更新されていないファイルを読み直しました')
+
+    monkeypatch.setattr('builtins.open', fail_open)
+
+    assert service.get_json(settings_file)['filtering']['min_relevance_score'] == 30
+
+
+@pytest.mark.parametrize('content', [
+    '{"filtering": {"min_relevance_score": ',                  # 編集途中のJSON
+    json.dumps({'filtering': 'invalid'}),                      # セクションがオブジェクトでない
+    json.dumps({'judgment_criteria': {'categories': 'x'}}),    # カテゴリがリストでない
+])
+def test_invalid_edit_keeps_last_good_content(settings_file, content):
+    service = ConfigService()
+    service.get_json(settings_file)
+
+    write_file(settings_file, content)
+
+    assert service.get_json(settings_file)['filtering']['min_relevance_score'] == 30
+    assert service.version(settings_file) == 1
+
+    # 直した内容は読み込む
+    write_file(settings_file, json.dumps({'filtering': {'min_relevance_score': 60}}))
+
+    assert service.get_json(settings_file)['filtering']['min_relevance_score'] == 60
+    assert service.version(settings_file) == 2
+
+
+def test_invalid_file_on_first_load_raises(settings_file):
+    write_file(settings_file, '{')
+
+    with pytest.raises(ValueError):
+        ConfigService().get_json(settings_file)
+
+
+def test_invalidate_forces_reload(settings_file):
+    service = ConfigService()
+    service.get_json(settings_file)
+
+    service.invalidate(settings_file)
+
+    assert service.version(settings_file) == 2
+
+
+@pytest.fixture
+def processor_settings(tmp_path):
+    """
+    リポジトリの設定をコピーした、テストで編集できる設定ファイル
+    """
+    path = str(tmp_path / 'settings.json')
+    shutil.copy(SETTINGS_PATH, path)
+    return path
+
+
+def edit_settings(path, update):
+    with open(path, encoding='utf-8') as f:
+        settings = json.load(f)
+    update(settings)
+    write_file(path, json.dumps(settings, ensure_ascii=False))
+
+
+def judge_relevance_60(items, model=None):
+    return [
+        {'url': item['url'], 'relevance_score': 60, 'importance_score': 50, 'importance_level': 'medium'}
+        for item in items
+    ]
+
+
+def test_processor_rebuilds_filtering_when_settings_change(processor_settings):
+    processor = ClaudeProcessor(PromptManager(), settings_path=processor_settings)
+    processor._call_claude_api = judge_relevance_60
+    items = [{'url': 'https://example.com/1', 'title': '諸橋沙夏 出演情報', 'content': ''}]
+    matcher = processor.keyword_matcher
+
+    passed, _ = processor.judge_items([dict(item) for item in items])
+    assert len(passed) == 1
+
+    def raise_threshold(settings):
+        settings['filtering']['min_relevance_score'] = 80
+        settings['filtering']['excluded_keywords'].append('出演情報')
+
+    edit_settings(processor_settings, raise_threshold)
+
+    passed, _ = processor.judge_items([dict(item) for item in items])
+
+    assert passed == []
+    assert processor.min_relevance_score == 80
+    assert 80 in processor.relevance_thresholds
+    assert processor.keyword_matcher is not matcher
+    assert '出演情報' in processor.excluded_keywords
+
+
+def test_processor_keeps_last_good_settings_on_invalid_edit(processor_settings):
+    processor = ClaudeProcessor(PromptManager(), settings_path=processor_settings)
+    version = processor.settings_version
+
+    write_file(processor_settings, '{"filtering": ')
+
+    assert processor.refresh_settings() is False
+    assert processor.settings_version == version
+    assert processor.min_relevance_score == 30
+
+
+def test_executor_rebuilds_pre_filter_when_config_changes(db_manager):
+    executor = NatsuAgentExecutor()
+    pre_filter = executor.pre_filter
+
+    executor._refresh_config()
+    assert executor.pre_filter is pre_filter
+
+    # 設定ファイルを読み直す（編集された場合と同じくバージョンが進む）
+    get_config_service().invalidate()
+    executor._refresh_config()
+
+    assert executor.pre_filter is not pre_filter
+    assert executor.claude_processor.settings_version == get_config_service().version(SETTINGS_PATH)
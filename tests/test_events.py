@@ -0,0 +1,127 @@
+"""
+EventBroadcaster のテスト（DB確認中のロック・遅れてコミットされたイベント・再送）
+"""
+import queue
+import threading
+from datetime import datetime
+
+import pytest
+import pytz
+
+from src.database.models import ExecutionEvent
+from src.pipeline.events import EventBroadcaster
+
+JST = pytz.timezone('Asia/Tokyo')
+
+
+def add_event(db_manager, event_id, event_type='saved'):
+    """
+    IDを指定してイベントを記録（PostgreSQLで先に採番されたイベントが後からコミットされた状態を再現する）
+    """
+    session = db_manager.get_session()
+    try:
+        session.add(ExecutionEvent(
+            id=event_id, execution_id='exec_1', event_type=event_type, data={}, created_at=datetime.now(JST)
+        ))
+        session.commit()
+    finally:
+        session.close()
+
+
+def received_ids(subscriber, count, timeout=2):
+    ids = [subscriber.get(timeout=timeout)['id'] for _ in range(count)]
+    # 余分なイベント（重複した配信）がないこと
+    with pytest.raises(queue.Empty):
+        subscriber.get(timeout=0.1)
+    return ids
+
+
+@pytest.fixture
+def broadcasters():
+    created = []
+
+    def create(db_manager, **kwargs):
+        broadcaster = EventBroadcaster(db_manager, poll_interval_sec=0.01, **kwargs)
+        created.append(broadcaster)
+        return broadcaster
+
+    yield create
+    # 監視スレッドを止める
+    for broadcaster in created:
+        with broadcaster.lock:
+            broadcaster.subscribers = []
+
+
+def test_new_events_are_delivered_in_order(db_manager, broadcasters):
+    broadcaster = broadcasters(db_manager)
+    add_event(db_manager, 1)
+    replay, subscriber = broadcaster.subscribe()
+
+    add_event(db_manager, 2)
+    add_event(db_manager, 3)
+
+    assert replay == []
+    assert received_ids(subscriber, 2) == [2, 3]
+
+
+def test_reconnect_replays_events_after_last_event_id(db_manager, broadcasters):
+    broadcaster = broadcasters(db_manager)
+    for event_id in (1, 2, 3):
+        add_event(db_manager, event_id)
+
+    replay, subscriber = broadcaster.subscribe(last_event_id=1)
+
+    assert [event['id'] for event in replay] == [2, 3]
+
+
+def test_subscribe_is_not_blocked_while_polling(db_manager, broadcasters):
+    broadcaster = broadcasters(db_manager)
+    broadcaster.subscribe()
+
+    fetching = threading.Event()
+    release = threading.Event()
+    fetch = broadcaster._fetch
+
+    def slow_fetch(after_id, until_id=None):
+        fetching.set()
+        release.wait(5)
+        return fetch(after_id, until_id)
+
+    broadcaster._fetch = slow_fetch
+    try:
+        assert fetching.wait(2)
+        subscribed = threading.Thread(target=broadcaster.subscribe)
+        subscribed.start()
+        subscribed.join(1)
+        assert not subscribed.is_alive(), 'DBの確認中に subscribe がロックを待っています'
+    finally:
+        release.set()
+
+
+def test_late_committed_event_within_window_is_delivered(db_manager, broadcasters):
+    broadcaster = broadcasters(db_manager, reread_window=10)
+    replay, subscriber = broadcaster.subscribe()
+
+    add_event(db_manager, 1)
+    add_event(db_manager, 3)
+    assert received_ids(subscriber, 2) == [1, 3]
+
+    # ID 2 のトランザクションが ID 3 より後にコミットされた
+    add_event(db_manager, 2)
+
+    assert received_ids(subscriber, 1) == [2]
+
+
+def test_existing_events_in_window_are_not_delivered_on_subscribe(db_manager, broadcasters):
+    broadcaster = broadcasters(db_manager, reread_window=10)
+    for event_id in (1, 2, 3):
+        add_event(db_manager, event_id)
+
+    replay, subscriber = broadcaster.subscribe()
+    add_event(db_manager, 4)
+
+    assert received_ids(subscriber, 1) == [4]
+
+
+def test_reread_window_is_used_only_on_postgresql(db_manager):
+    assert EventBroadcaster(db_manager).reread_window == 0
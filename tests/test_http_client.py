@@ -0,0 +1,158 @@
+"""
+HttpClient のテスト（Retry-After・待機時間の上限・リトライ予算）
+"""
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+import requests
+
+from src.utils import http_client as http_module
+from src.utils.http_client import HttpClient, RetryBudget
+
+URL = 'https://news.yahoo.co.jp/topics'
+
+
+def make_response(status_code, headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response.url = URL
+    return response
+
+
+class FakeSession:
+    """
+    決まった順にレスポンス（または例外）を返すセッション
+    """
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def get(self, url, **kwargs):
+        self.calls += 1
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """
+    待機せずに待ち時間を記録する
+    """
+    delays = []
+    monkeypatch.setattr(http_module.time, 'sleep', delays.append)
+    return delays
+
+
+def make_client(responses, **kwargs):
+    kwargs.setdefault('backoff_base', 1.0)
+    kwargs.setdefault('backoff_max', 30.0)
+    client = HttpClient(name='test', **kwargs)
+    client.session = FakeSession(responses)
+    return client
+
+
+def test_retry_after_seconds_is_honored_beyond_backoff_cap(sleeps):
+    client = make_client([make_response(429, {'Retry-After': '60'}), make_response(200)])
+
+    response = client.get(URL)
+
+    assert response.status_code == 200
+    assert sleeps == [60.0]
+
+
+def test_retry_after_http_date_is_converted_to_seconds(sleeps):
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=45)
+    header = format_datetime(retry_at, usegmt=True)
+    client = make_client([make_response(503, {'Retry-After': header}), make_response(200)])
+
+    client.get(URL)
+
+    # HTTP日付は秒単位のため、最大1秒の切り捨てと経過時間を許容する
+    assert len(sleeps) == 1
+    assert 40 <= sleeps[0] <= 45
+
+
+def test_retry_after_in_the_past_retries_immediately(sleeps):
+    header = format_datetime(datetime.now(timezone.utc) - timedelta(minutes=1), usegmt=True)
+    client = make_client([make_response(503, {'Retry-After': header}), make_response(200)])
+
+    client.get(URL)
+
+    assert sleeps == [0.0]
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('120', 120.0),
+    (' 5 ', 5.0),
+    ('', None),
+    (None, None),
+    ('soon', None),
+])
+def test_parse_retry_after(value, expected):
+    assert HttpClient._parse_retry_after(value) == expected
+
+
+def test_retry_after_longer_than_cap_fails_without_spending_budget(sleeps):
+    budget = RetryBudget(5)
+    client = make_client(
+        [make_response(429, {'Retry-After': '600'}), make_response(200)],
+        retry_after_max=120.0,
+        budget=budget
+    )
+
+    with pytest.raises(requests.HTTPError):
+        client.get(URL)
+
+    assert client.session.calls == 1
+    assert sleeps == []
+    assert budget.summary() == {'used': 0, 'max': 5}
+
+
+def test_backoff_without_retry_after_is_capped(sleeps, monkeypatch):
+    monkeypatch.setattr(http_module.random, 'uniform', lambda low, high: high)
+    client = make_client(
+        [requests.ConnectionError('reset'), requests.Timeout('timeout'), make_response(200)],
+        max_attempts=3,
+        backoff_max=1.5
+    )
+
+    client.get(URL)
+
+    assert sleeps == [1.0, 1.5]
+
+
+def test_budget_is_shared_and_stops_retries_when_exhausted(sleeps):
+    budget = RetryBudget(1)
+    first = make_client([make_response(500), make_response(200)], budget=budget)
+    second = make_client([make_response(500), make_response(200)], budget=budget)
+
+    assert first.get(URL).status_code == 200
+    with pytest.raises(requests.HTTPError):
+        second.get(URL)
+
+    assert second.session.calls == 1
+    assert budget.summary() == {'used': 1, 'max': 1}
+
+
+def test_non_retryable_error_is_raised_immediately(sleeps):
+    client = make_client([make_response(404), make_response(200)])
+
+    with pytest.raises(requests.HTTPError):
+        client.get(URL)
+
+    assert client.session.calls == 1
+
+
+def test_last_attempt_error_is_raised(sleeps):
+    client = make_client([make_response(502)] * 3, max_attempts=3)
+
+    with pytest.raises(requests.HTTPError):
+        client.get(URL)
+
+    assert client.session.calls == 3
+    assert len(sleeps) == 2
@@ -0,0 +1,207 @@
+"""
+JobQueue・JobWorker・ExecutionScheduler のテスト（待機中・実行中の実行は同時に1件だけ）
+"""
+import threading
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+import pytz
+
+from src.database.models import Execution, ExecutionJob
+from src.pipeline.job_queue import JobQueue
+from src.pipeline.scheduler import ExecutionScheduler
+from src.pipeline.worker import JobWorker
+from src.web.api import get_job_queue
+
+JST = pytz.timezone('Asia/Tokyo')
+
+
+@pytest.fixture
+def executor(db_manager):
+    """
+    実行内容を記録するだけのExecutor
+    """
+    calls = []
+
+    def execute(streaming=None, sources=None, execution_id=None):
+        calls.append({'sources': sources, 'execution_id': execution_id})
+        return {'status': 'success', 'message': '完了しました', 'execution_id': execution_id}
+
+    return SimpleNamespace(db_manager=db_manager, db_lock=threading.RLock(), execute=execute, calls=calls)
+
+
+@pytest.fixture
+def queue(executor):
+    return JobQueue(executor.db_manager, lock=executor.db_lock)
+
+
+def add_running_execution(db_manager, execution_id):
+    """
+    ジョブキューを経由しない実行（コマンドラインからの実行等）を実行中として記録
+    """
+    session = db_manager.get_session()
+    try:
+        session.add(Execution(id=execution_id, started_at=datetime.now(JST), status='running'))
+        session.commit()
+    finally:
+        session.close()
+
+
+def backdate_job(db_manager, job_id, minutes):
+    """
+    ジョブの登録日時を過去にずらす（ワーカーに取り出されないまま時間が経過した状態）
+    """
+    session = db_manager.get_session()
+    try:
+        job = session.get(ExecutionJob, job_id)
+        job.created_at = datetime.now(JST) - timedelta(minutes=minutes)
+        session.commit()
+    finally:
+        session.close()
+
+
+def test_only_one_job_can_be_queued(queue):
+    assert queue.enqueue('execute', 'exec_1') is not None
+    assert queue.enqueue('execute', 'exec_2') is None
+    assert queue.active_job()['execution_id'] == 'exec_1'
+
+
+def test_acquire_is_blocked_while_a_job_is_queued(queue):
+    queue.enqueue('execute', 'exec_1')
+
+    assert queue.acquire('execute', 'exec_2', 'scheduler') is None
+
+
+def test_finished_job_releases_the_slot(queue):
+    queue.enqueue('execute', 'exec_1')
+    job = queue.claim('worker-1')
+
+    assert job['status'] == 'running'
+    assert queue.claim('worker-2') is None
+    assert queue.enqueue('execute', 'exec_2') is None
+
+    queue.finish(job['id'], 'done')
+
+    assert queue.active_job() is None
+    assert queue.enqueue('execute', 'exec_2') is not None
+
+
+def test_worker_runs_claimed_job_and_releases_the_slot(executor, queue):
+    queue.enqueue('execute', 'exec_1', {'sources': ['yahoo']})
+    worker = JobWorker(executor, queue, worker_id='worker-1')
+
+    assert worker.run_once() is True
+
+    assert executor.calls == [{'sources': ['yahoo'], 'execution_id': 'exec_1'}]
+    assert queue.active_job() is None
+    assert worker.run_once() is False
+
+
+def test_worker_fails_job_while_another_execution_is_running(executor, queue, db_manager):
+    add_running_execution(db_manager, 'exec_cli')
+    job = queue.enqueue('execute', 'exec_1')
+    worker = JobWorker(executor, queue, worker_id='worker-1')
+
+    assert worker.run_once() is True
+
+    assert executor.calls == []
+    assert queue.active_job() is None
+
+    session = db_manager.get_session()
+    try:
+        finished = session.get(ExecutionJob, job['id'])
+        assert finished.status == 'failed'
+        assert 'exec_cli' in finished.error_message
+    finally:
+        session.close()
+
+
+def test_scheduler_skips_while_the_slot_is_taken(executor, queue):
+    queue.enqueue('execute', 'exec_api')
+    scheduler = ExecutionScheduler(executor, {'schedule': {}})
+
+    assert scheduler.run_execution(['yahoo']) is None
+    assert executor.calls == []
+    assert queue.active_job()['execution_id'] == 'exec_api'
+
+
+def test_scheduler_skips_while_another_execution_is_running(executor, db_manager):
+    add_running_execution(db_manager, 'exec_cli')
+    scheduler = ExecutionScheduler(executor, {'schedule': {}})
+
+    assert scheduler.run_execution() is None
+    assert executor.calls == []
+
+
+def test_scheduler_takes_the_slot_while_running(executor, queue):
+    scheduler = ExecutionScheduler(executor, {'schedule': {}})
+    seen = []
+
+    def execute(streaming=None, sources=None, execution_id=None):
+        # 実行中はWeb APIからジョブを登録できない
+        seen.append(queue.enqueue('execute', 'exec_api'))
+        return {'status': 'success', 'message': '完了しました'}
+
+    executor.execute = execute
+
+    result = scheduler.run_execution(['yahoo'])
+
+    assert result['status'] == 'success'
+    assert seen == [None]
+    assert queue.active_job() is None
+
+
+def test_expire_queued_releases_unclaimed_jobs(queue, db_manager):
+    job = queue.enqueue('execute', 'exec_1')
+    backdate_job(db_manager, job['id'], 31)
+
+    assert queue.expire_queued(30) == ['exec_1']
+
+    assert queue.active_job() is None
+    assert queue.enqueue('execute', 'exec_2') is not None
+
+    session = db_manager.get_session()
+    try:
+        expired = session.get(ExecutionJob, job['id'])
+        assert expired.status == 'failed'
+        assert expired.error_message
+    finally:
+        session.close()
+
+
+def test_expire_queued_keeps_recent_and_running_jobs(queue, db_manager):
+    job = queue.enqueue('execute', 'exec_1')
+    assert queue.expire_queued(30) == []
+
+    # 実行中のジョブは応答の途絶え（recover_stale）でのみ解放する
+    queue.claim('worker-1')
+    backdate_job(db_manager, job['id'], 60)
+
+    assert queue.expire_queued(30) == []
+    assert queue.active_job()['status'] == 'running'
+
+
+def test_status_reports_missing_worker(client, db_manager):
+    execution_id = client.post('/api/execute', json={}).get_json()['execution_id']
+    assert client.get('/api/status').get_json()['worker_missing'] is False
+
+    job = get_job_queue().active_job()
+    backdate_job(db_manager, job['id'], 5)
+
+    status = client.get('/api/status').get_json()
+    assert status['status'] == 'queued'
+    assert status['current_execution_id'] == execution_id
+    assert status['worker_missing'] is True
+
+
+def test_execute_is_accepted_after_unclaimed_job_expires(client, db_manager):
+    client.post('/api/execute', json={})
+    job = get_job_queue().active_job()
+    assert client.post('/api/execute', json={}).status_code == 409
+
+    backdate_job(db_manager, job['id'], 31)
+
+    response = client.post('/api/execute', json={})
+    assert response.status_code == 200
+    assert get_job_queue().active_job()['id'] != job['id']
@@ -0,0 +1,145 @@
+"""
+KeywordMatcher のテスト
+
+置き換え前の照合（正規化したテキストに対する部分文字列チェック）と同じ結果になることを確認する。
+"""
+import random
+
+import pytest
+
+from src.utils.keyword_matcher import KeywordMatcher
+from src.utils.text_normalizer import normalize_text
+
+
+def substring_matches(keyword_classes, *texts):
+    """
+    置き換え前の照合: キーワードごとに正規化したテキストへの部分文字列チェック
+    """
+    matches = {}
+    for class_name, keywords in keyword_classes.items():
+        for keyword in keywords:
+            pattern = normalize_text(keyword)
+            if pattern and any(pattern in normalize_text(text) for text in texts):
+                matches.setdefault(class_name, set()).add(keyword)
+    return matches
+
+
+CASES = [
+    # (説明, キーワードクラス, テキスト, 期待するマッチ)
+    (
+        '重なり合うキーワードは全て返す',
+        {'high': ['ライブ', 'ライブ配信'], 'medium': ['配信']},
+        ['今夜ライブ配信します'],
+        {'high': {'ライブ', 'ライブ配信'}, 'medium': {'配信'}},
+    ),
+    (
+        '他のキーワードの接尾辞になっているキーワード',
+        {'a': ['he', 'she', 'his', 'hers']},
+        ['ushers'],
+        {'a': {'he', 'she', 'hers'}},
+    ),
+    (
+        '失敗リンクをたどった先のキーワード',
+        {'a': ['abcd', 'bce']},
+        ['abce'],
+        {'a': {'bce'}},
+    ),
+    (
+        '同じキーワードが複数クラスにある場合はどちらにも入る',
+        {'excluded': ['炎上'], 'low': ['炎上']},
+        ['炎上しています'],
+        {'excluded': {'炎上'}, 'low': {'炎上'}},
+    ),
+    (
+        'NFKC: 全角英数字・半角カナ',
+        {'high': ['LIVE', 'ライブ']},
+        ['ＬＩＶＥ開催！ ﾗｲﾌﾞ'],
+        {'high': {'LIVE', 'ライブ'}},
+    ),
+    (
+        'casefold: 大文字小文字・ß',
+        {'a': ['Morohashi Sana', 'STRASSE']},
+        ['MOROHASHI sana in der Straße'],
+        {'a': {'Morohashi Sana', 'STRASSE'}},
+    ),
+    (
+        '空白の揺れは区別しない',
+        {'subject': ['諸橋沙夏']},
+        ['諸橋　沙夏さん'],
+        {'subject': {'諸橋沙夏'}},
+    ),
+    (
+        'マッチしない場合は空',
+        {'excluded': ['アンチ']},
+        ['新曲リリース'],
+        {},
+    ),
+    (
+        'テキストごとに走査する（タイトルと本文をまたいだマッチはしない）',
+        {'a': ['新曲', 'リリース']},
+        ['新曲', 'リリース決定'],
+        {'a': {'新曲', 'リリース'}},
+    ),
+    (
+        '空のキーワード・空白のみのキーワードは無視する',
+        {'a': ['', '  ', '発売']},
+        ['発売日'],
+        {'a': {'発売'}},
+    ),
+    (
+        'キーワードが1つもない',
+        {},
+        ['諸橋沙夏'],
+        {},
+    ),
+    (
+        'キーワードのないクラス',
+        {'excluded': [], 'high': ['主演']},
+        ['主演ドラマ'],
+        {'high': {'主演'}},
+    ),
+    (
+        '空・Noneのテキスト',
+        {'a': ['発売']},
+        ['', None],
+        {},
+    ),
+]
+
+
+@pytest.mark.parametrize('keyword_classes, texts, expected', [case[1:] for case in CASES], ids=[case[0] for case in CASES])
+def test_scan(keyword_classes, texts, expected):
+    matcher = KeywordMatcher(keyword_classes)
+
+    assert matcher.scan(*texts) == expected
+    assert matcher.scan(*texts) == substring_matches(keyword_classes, *texts)
+    assert matcher.matched_classes(*texts) == set(expected)
+
+
+def test_same_results_as_substring_checks_on_random_texts():
+    rng = random.Random(0)
+    alphabet = 'abcアイ 　Ａ'
+    keyword_classes = {
+        name: [''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))) for _ in range(8)]
+        for name in ('excluded', 'high', 'medium')
+    }
+    matcher = KeywordMatcher(keyword_classes)
+
+    for _ in range(300):
+        texts = [''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 30))) for _ in range(2)]
+        assert matcher.scan(*texts) == substring_matches(keyword_classes, *texts)
+
+
+def test_from_settings_builds_excluded_and_importance_classes():
+    settings = {
+        'filtering': {'excluded_keywords': ['炎上']},
+        'judgment_criteria': {'importance_levels': {
+            'high': {'keywords': ['主演']},
+            'medium': {'keywords': ['インタビュー']},
+        }},
+    }
+
+    matcher = KeywordMatcher.from_settings(settings, extra_classes={'subject': ['諸橋沙夏']})
+
+    assert matcher.classes == ['excluded', 'high', 'medium', 'subject']
+    assert matcher.matched_classes('諸橋沙夏 主演', '炎上') == {'excluded', 'high', 'subject'}
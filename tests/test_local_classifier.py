@@ -0,0 +1,123 @@
+"""
+LocalClassifier のテスト（学習・バージョン管理・確信度による振り分け）
+"""
+import os
+
+import pytest
+
+pytest.importorskip('sklearn')
+
+from src.processors.local_classifier import LocalClassifier, LATEST_FILENAME, MODEL_FILENAME, REPORT_FILENAME  # noqa: E402
+
+SETTINGS = {
+    'filtering': {'min_relevance_score': 30},
+    'judgment_criteria': {'importance_levels': {
+        'high': {'score_range': [70, 100]},
+        'medium': {'score_range': [40, 69]},
+        'low': {'score_range': [0, 39]},
+    }},
+}
+
+
+def make_samples(count=60):
+    """
+    本人の出演情報（関連あり）と無関係な記事（関連なし）が半々の判定結果
+    """
+    samples = []
+    for i in range(count):
+        if i % 2:
+            level = 'high' if i % 4 == 1 else 'medium'
+            samples.append({
+                'source': 'yahoo_news',
+                'title': f'諸橋沙夏が新ドラマに主演 {i}' if level == 'high' else f'諸橋沙夏 インタビュー {i}',
+                'content': '諸橋沙夏の出演が決定した。' if level == 'high' else '諸橋沙夏が近況を語った。',
+                'url': f'https://news.yahoo.co.jp/articles/relevant-{i}',
+                'relevance_score': 90,
+                'importance_score': 85 if level == 'high' else 55,
+                'importance_level': level,
+                'category': 'メディア出演（TV/ラジオ/雑誌）' if level == 'high' else 'インタビュー/記事',
+            })
+        else:
+            samples.append({
+                'source': 'yahoo_news',
+                'title': f'株価が続落 {i}',
+                'content': '東京市場で株価が値下がりした。',
+                'url': f'https://news.yahoo.co.jp/articles/other-{i}',
+                'relevance_score': 5,
+                'importance_score': 0,
+                'importance_level': 'low',
+                'category': 'その他',
+            })
+    return samples
+
+
+@pytest.fixture(scope='module')
+def classifier():
+    return LocalClassifier.train(make_samples(), SETTINGS, 'v0001')
+
+
+def test_training_requires_both_classes():
+    samples = [s for s in make_samples() if s['relevance_score'] >= 30]
+
+    with pytest.raises(ValueError):
+        LocalClassifier.train(samples, SETTINGS, 'v0001')
+
+
+def test_versions_and_latest_pointer(classifier, tmp_path):
+    model_dir = str(tmp_path / 'local_classifier')
+
+    assert LocalClassifier.load_latest(model_dir) is None
+    assert LocalClassifier.next_version(model_dir) == 'v0001'
+
+    classifier.save(model_dir, report={'relevant_agreement': 1.0})
+    assert os.path.exists(os.path.join(model_dir, 'v0001', MODEL_FILENAME))
+    assert os.path.exists(os.path.join(model_dir, 'v0001', REPORT_FILENAME))
+    assert LocalClassifier.next_version(model_dir) == 'v0002'
+
+    # 評価のみ（promote=False）の場合は LATEST を切り替えない
+    LocalClassifier.train(make_samples(), SETTINGS, 'v0002').save(model_dir, promote=False)
+    with open(os.path.join(model_dir, LATEST_FILENAME), encoding='utf-8') as f:
+        assert f.read() == 'v0001'
+    assert LocalClassifier.load_latest(model_dir).version == 'v0001'
+    assert LocalClassifier.next_version(model_dir) == 'v0003'
+
+    LocalClassifier.train(make_samples(), SETTINGS, 'v0003').save(model_dir)
+    assert LocalClassifier.load_latest(model_dir).version == 'v0003'
+
+
+def test_predictions_stay_consistent_with_the_threshold(classifier):
+    items = [
+        {'source': 'yahoo_news', 'title': '諸橋沙夏が新ドラマに主演', 'content': '諸橋沙夏の出演が決定した。', 'url': 'a'},
+        {'source': 'yahoo_news', 'title': '株価が続落', 'content': '東京市場で株価が値下がりした。', 'url': 'b'},
+    ]
+
+    relevant, other = classifier.predict(items)
+
+    assert relevant['relevant'] is True
+    assert relevant['relevance_score'] >= 30
+    low, high = SETTINGS['judgment_criteria']['importance_levels'][relevant['importance_level']]['score_range']
+    assert low <= relevant['importance_score'] <= high
+
+    assert other['relevant'] is False
+    assert other['relevance_score'] < 30
+    assert other['importance_score'] == 0
+
+
+def test_split_uses_the_confidence_threshold(classifier):
+    items = make_samples(10)
+    confidences = [p['confidence'] for p in classifier.predict(items)]
+    threshold = sorted(confidences)[len(confidences) // 2]
+
+    judgments, uncertain = classifier.split(items, threshold)
+
+    assert len(judgments) == sum(1 for c in confidences if c >= threshold)
+    assert [item['url'] for item in uncertain] == [
+        item['url'] for item, c in zip(items, confidences) if c < threshold
+    ]
+    assert all(j['judge_tier'] == 'local' for j in judgments)
+    assert all('v0001' in j['claude_reason'] for j in judgments)
+
+    # 確信度1を超える閾値では全件をClaudeへ回す
+    judgments, uncertain = classifier.split(items, 1.01)
+    assert judgments == []
+    assert len(uncertain) == len(items)
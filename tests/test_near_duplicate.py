@@ -0,0 +1,172 @@
+"""
+NearDuplicateClusterer のテスト（SimHash・LSHバンド・union-find・保存済みアイテムとの照合）
+"""
+from datetime import datetime
+
+import pytest
+import pytz
+
+from main import NatsuAgentExecutor
+from src.database.models import Item
+from src.processors.near_duplicate import NearDuplicateClusterer
+
+JST = pytz.timezone('Asia/Tokyo')
+
+ARTICLE = '女優の諸橋沙夏が春の新ドラマで主演を務めることが決定した。共演者には人気俳優が名を連ね、4月から毎週金曜夜に放送される。'
+EDITED = ARTICLE.replace('毎週金曜夜', '毎週金曜の夜')
+RETWEET = f'RT @natsu_fan: {ARTICLE} https://t.co/abc'
+OTHER = '諸橋沙夏が写真集の発売記念イベントを開催。ファン500人が集まり、撮影の裏話を語った。次回作への意欲も見せた。'
+
+
+def make_item(url, content, source='yahoo_news', title=''):
+    return {'source': source, 'url': url, 'title': title, 'content': content}
+
+
+def fingerprint(clusterer, content):
+    return clusterer._simhash(clusterer._prepare_text({'content': content}))
+
+
+def distance(a, b):
+    return bin(a ^ b).count('1')
+
+
+@pytest.fixture
+def clusterer():
+    return NearDuplicateClusterer()
+
+
+def test_simhash_ignores_retweet_prefix_and_urls(clusterer):
+    assert fingerprint(clusterer, RETWEET) == fingerprint(clusterer, ARTICLE)
+
+
+def test_simhash_distance_separates_edits_from_other_articles(clusterer):
+    article = fingerprint(clusterer, ARTICLE)
+
+    assert distance(article, fingerprint(clusterer, EDITED)) <= clusterer.max_hamming_distance
+    assert distance(article, fingerprint(clusterer, OTHER)) > clusterer.max_hamming_distance
+
+
+def test_short_text_has_no_fingerprint(clusterer):
+    assert fingerprint(clusterer, '短い投稿') is None
+
+
+def test_cluster_groups_near_duplicates_and_picks_representative(clusterer):
+    tweet = make_item('https://twitter.com/a/status/1', RETWEET, source='twitter')
+    article = make_item('https://news.yahoo.co.jp/articles/1', ARTICLE)
+    edited = make_item('https://mdpr.jp/news/1', EDITED, source='modelpress')
+    other = make_item('https://news.yahoo.co.jp/articles/2', OTHER)
+
+    representatives, clusters = clusterer.cluster([tweet, article, edited, other])
+
+    # 代表はソースの優先順位（yahoo_news -> modelpress -> twitter）で選ぶ
+    assert representatives == [article, other]
+    assert list(clusters.values()) == [[tweet, edited]]
+    assert tweet['cluster_id'] == article['cluster_id'] == edited['cluster_id']
+    assert 'cluster_id' not in other
+    assert all(item['simhash'] for item in (tweet, article, edited, other))
+
+
+def test_union_find_joins_transitive_matches(clusterer, monkeypatch):
+    # a-b, b-c は距離10以内、a-c は距離20（直接は近似重複ではない）
+    fingerprints = {'a': 0, 'b': (1 << 10) - 1, 'c': (1 << 20) - 1}
+    monkeypatch.setattr(clusterer, '_simhash', lambda text: fingerprints[text])
+    monkeypatch.setattr(clusterer, '_prepare_text', lambda item: item['url'])
+    items = [make_item(url, '') for url in ('a', 'b', 'c')]
+
+    representatives, clusters = clusterer.cluster(items)
+
+    assert len(representatives) == 1
+    assert len({item['cluster_id'] for item in items}) == 1
+
+
+def test_lsh_only_compares_items_sharing_a_band(clusterer, monkeypatch):
+    # 全8バンドで1ビットずつ異なる（距離8）が、一致するバンドがないため比較されない
+    spread = sum(1 << (band * 8) for band in range(8))
+    fingerprints = {'a': 0, 'b': spread}
+    monkeypatch.setattr(clusterer, '_simhash', lambda text: fingerprints[text])
+    monkeypatch.setattr(clusterer, '_prepare_text', lambda item: item['url'])
+
+    representatives, clusters = clusterer.cluster([make_item('a', ''), make_item('b', '')])
+
+    assert len(representatives) == 2
+    assert clusters == {}
+
+
+def test_propagate_copies_the_representative_judgment(clusterer):
+    article = make_item('https://news.yahoo.co.jp/articles/1', ARTICLE)
+    tweet = make_item('https://twitter.com/a/status/1', RETWEET, source='twitter')
+    representatives, clusters = clusterer.cluster([article, tweet])
+    article.update({'relevance_score': 90, 'importance_score': 80, 'importance_level': 'high', 'judge_tier': 'strong'})
+
+    result = clusterer.propagate(representatives, clusters)
+
+    assert result == [article, tweet]
+    assert tweet['importance_score'] == 80
+    assert tweet['judge_tier'] == 'strong'
+
+
+def test_match_known_joins_items_judged_earlier(clusterer):
+    article = make_item('https://news.yahoo.co.jp/articles/1', ARTICLE)
+    article.update({'relevance_score': 90, 'importance_score': 80, 'importance_level': 'high'})
+    clusterer.reset_index([])
+    clusterer.remember([article])
+
+    edited = make_item('https://mdpr.jp/news/1', EDITED, source='modelpress')
+    other = make_item('https://news.yahoo.co.jp/articles/2', OTHER)
+    remaining, matched = clusterer.match_known([edited, other])
+
+    assert remaining == [other]
+    assert matched == [edited]
+    assert edited['importance_score'] == 80
+    assert edited['cluster_anchor_url'] == article['url']
+    # 単独だった判定済みアイテムにも同じクラスタIDが付く
+    assert edited['cluster_id'] == article['cluster_id']
+
+
+def test_reset_index_forgets_previous_run(clusterer):
+    clusterer.remember([make_item('https://news.yahoo.co.jp/articles/1', ARTICLE)])
+    clusterer.reset_index([])
+
+    remaining, matched = clusterer.match_known([make_item('https://mdpr.jp/news/1', EDITED)])
+
+    assert matched == []
+
+
+def test_new_item_joins_cluster_of_stored_item(db_manager):
+    executor = NatsuAgentExecutor()
+    executor.claude_processor.local_classifier = None
+    judged_urls = []
+
+    def judge(items, model=None):
+        judged_urls.extend(item['url'] for item in items)
+        return [
+            {'url': item['url'], 'relevance_score': 90, 'importance_score': 80, 'importance_level': 'high'}
+            for item in items
+        ]
+
+    executor.claude_processor._call_claude_api = judge
+
+    # 前回の実行で保存したアイテム
+    stored = make_item('https://news.yahoo.co.jp/articles/1', ARTICLE)
+    stored['published_at'] = datetime.now(JST)
+    executor._load_near_duplicate_index()
+    judged, _, _ = executor._judge_batch([stored], 'exec_1')
+    executor._save_to_database(judged, 'exec_1')
+
+    # 今回の実行で収集した近似重複
+    edited = make_item('https://mdpr.jp/news/1', EDITED, source='modelpress')
+    edited['published_at'] = datetime.now(JST)
+    executor._load_near_duplicate_index()
+    judged, _, stats = executor._judge_batch([edited], 'exec_2')
+    executor._save_to_database(judged, 'exec_2')
+
+    assert judged_urls == [stored['url']]
+    assert stats['stored_matches'] == 1
+
+    session = db_manager.get_session()
+    try:
+        cluster_ids = {item.url: item.cluster_id for item in session.query(Item)}
+    finally:
+        session.close()
+    assert cluster_ids[stored['url']] is not None
+    assert cluster_ids[stored['url']] == cluster_ids[edited['url']]
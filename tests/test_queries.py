@@ -0,0 +1,124 @@
+"""
+一覧のキーセットページネーション（order_items / apply_cursor）のテスト
+"""
+import base64
+import json
+from datetime import datetime, timedelta
+
+import pytest
+import pytz
+
+from src.database.models import Item
+from src.database.queries import build_item_query, order_items, apply_cursor, encode_cursor, decode_cursor
+
+JST = pytz.timezone('Asia/Tokyo')
+BASE_TIME = JST.localize(datetime(2026, 1, 1, 12, 0))
+
+
+@pytest.fixture
+def session(db_manager):
+    session = db_manager.get_session()
+    yield session
+    session.close()
+
+
+def add_items(session, specs, prefix='item'):
+    """
+    (重要度スコア, 公開日時のずれ（時間）) のリストからアイテムを登録
+
+    Returns:
+        登録したアイテムのIDリスト
+    """
+    items = [
+        Item(
+            source='yahoo_news',
+            title=f'{prefix} {i}',
+            url=f'https://news.yahoo.co.jp/articles/{prefix}-{i}',
+            published_at=BASE_TIME - timedelta(hours=hours),
+            importance_score=score,
+        )
+        for i, (score, hours) in enumerate(specs)
+    ]
+    session.add_all(items)
+    session.commit()
+    return [item.id for item in items]
+
+
+def fetch_page(session, cursor=None, per_page=3):
+    """
+    1ページ分のアイテムと次ページのカーソルを取得
+    """
+    query = apply_cursor(order_items(build_item_query(session, period='all')), cursor)
+    items = query.limit(per_page).all()
+    next_cursor = encode_cursor(items[-1]) if len(items) == per_page else None
+    return items, next_cursor
+
+
+def fetch_all_pages(session, per_page=3):
+    ids, cursor = [], None
+    while True:
+        items, cursor = fetch_page(session, cursor, per_page)
+        ids.extend(item.id for item in items)
+        if cursor is None:
+            return ids
+
+
+def test_pages_cover_every_item_once_with_unscored_items_last(session):
+    # 同じスコア・同じ公開日時の行と、スコアがNULLの行を含む
+    add_items(session, [
+        (80, 0), (80, 0), (80, 1), (None, 0), (50, 2),
+        (None, 0), (None, 3), (50, 2), (0, 0), (None, 1),
+    ])
+
+    ids = fetch_all_pages(session)
+    expected = [item.id for item in order_items(build_item_query(session, period='all')).all()]
+
+    assert ids == expected
+    assert sorted(ids) == sorted(item_id for (item_id,) in session.query(Item.id))
+
+    scores = [session.get(Item, item_id).importance_score for item_id in ids]
+    assert scores[-4:] == [None] * 4
+
+
+def test_unscored_items_are_reachable_after_a_cursor_on_an_unscored_item(session):
+    unscored = add_items(session, [(None, hours) for hours in range(5)])
+
+    ids = fetch_all_pages(session, per_page=2)
+
+    assert ids == unscored
+
+
+def test_new_items_do_not_shift_later_pages(session):
+    add_items(session, [(score, 0) for score in (90, 80, 70, 60, 50, 40)])
+
+    first_page, cursor = fetch_page(session)
+
+    # 1ページ目を読んだ後に、より上位のアイテムが追加される
+    add_items(session, [(95, 0), (85, 0)], prefix='new')
+
+    second_page, _ = fetch_page(session, cursor)
+
+    assert [item.importance_score for item in first_page] == [90, 80, 70]
+    assert [item.importance_score for item in second_page] == [60, 50, 40]
+
+
+def test_cursor_round_trip_for_unscored_item(session):
+    item_id, = add_items(session, [(None, 0)])
+    item = session.get(Item, item_id)
+
+    position = decode_cursor(encode_cursor(item))
+
+    assert position['importance_score'] == -1
+    assert position['id'] == item_id
+
+
+def test_legacy_cursor_with_null_score_is_accepted():
+    raw = json.dumps([None, '2026-01-01T12:00:00', 7]).encode('utf-8')
+    cursor = base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+    assert decode_cursor(cursor)['importance_score'] == -1
+
+
+def test_invalid_cursor_is_rejected():
+    with pytest.raises(ValueError):
+        decode_cursor('not-a-cursor')
@@ -0,0 +1,144 @@
+"""
+キーワード検索（apply_keyword_filter / order_by_relevance）のテスト
+（SQLiteのFTS5トライグラム索引・LIKEへのフォールバック・PostgreSQLのILIKE）
+"""
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+import pytz
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.database.models import Base, Item
+from src.database.search import (
+    apply_keyword_filter, order_by_relevance, create_search_index, drop_search_index, search_index_ready
+)
+
+JST = pytz.timezone('Asia/Tokyo')
+
+ITEMS = [
+    ('https://example.com/1', '諸橋沙夏 主演ドラマ決定', '春の新ドラマで主演を務める。'),
+    ('https://example.com/2', '諸橋沙夏 写真集発売', '写真集の発売記念イベントを開催。'),
+    ('https://example.com/3', '新ドラマの主演が決定', '主演は諸橋沙夏。撮影は3月から。'),
+    ('https://example.com/4', '50%オフ_セール', '関連グッズのセール情報。'),
+]
+
+
+def add_items(session):
+    for url, title, content in ITEMS:
+        session.add(Item(source='yahoo_news', url=url, title=title, content=content, published_at=datetime.now(JST)))
+    session.commit()
+
+
+def search(session, keyword):
+    query = apply_keyword_filter(session.query(Item), session, keyword)
+    return {item.url for item in query}
+
+
+def compiled(query, dialect=None):
+    return str(query.statement.compile(dialect=dialect))
+
+
+@pytest.fixture
+def session(db_manager):
+    session = db_manager.get_session()
+    add_items(session)
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def plain_engine():
+    """
+    検索インデックスのないインメモリDB（マイグレーションを適用していないDB）
+    """
+    engine = create_engine('sqlite:///:memory:', connect_args={'check_same_thread': False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+def test_long_terms_use_the_fts_index(session):
+    query = apply_keyword_filter(session.query(Item), session, '諸橋沙夏')
+
+    assert 'items_fts MATCH' in compiled(query)
+    assert {item.url for item in query} == {
+        'https://example.com/1', 'https://example.com/2', 'https://example.com/3'
+    }
+
+
+def test_short_terms_fall_back_to_like(session):
+    query = apply_keyword_filter(session.query(Item), session, '主演')
+
+    assert 'items_fts' not in compiled(query)
+    assert {item.url for item in query} == {'https://example.com/1', 'https://example.com/3'}
+
+
+@pytest.mark.parametrize('keyword, expected', [
+    # 空白区切りの語は全てを含むもの（語の位置・順序は問わない）
+    ('諸橋沙夏 主演', {'https://example.com/1', 'https://example.com/3'}),
+    ('主演 諸橋沙夏', {'https://example.com/1', 'https://example.com/3'}),
+    ('諸橋沙夏 写真集 主演', set()),
+    # 以前の部分一致（キーワード全体）で見つかったものは引き続き見つかる
+    ('諸橋沙夏 主演ドラマ', {'https://example.com/1'}),
+    # % と _ は文字として検索する
+    ('50%', {'https://example.com/4'}),
+    ('_セ', {'https://example.com/4'}),
+    ('%オフ_', {'https://example.com/4'}),
+    ('"諸橋沙夏" OR 写真集', set()),
+    ('   ', {'https://example.com/1', 'https://example.com/2', 'https://example.com/3', 'https://example.com/4'}),
+])
+def test_all_terms_must_match(session, keyword, expected):
+    assert search(session, keyword) == expected
+
+
+def test_relevance_order_uses_bm25(session):
+    query = apply_keyword_filter(session.query(Item), session, '諸橋沙夏 写真集')
+    query = order_by_relevance(query, session, '諸橋沙夏 写真集')
+
+    assert 'rank' in compiled(query)
+    assert [item.url for item in query] == ['https://example.com/2']
+
+
+def test_without_index_searches_with_like(db_manager, session):
+    drop_search_index(db_manager.engine)
+
+    assert not search_index_ready(db_manager.engine)
+    query = apply_keyword_filter(session.query(Item), session, '諸橋沙夏 主演')
+    assert 'items_fts' not in compiled(query)
+    assert {item.url for item in query} == {'https://example.com/1', 'https://example.com/3'}
+
+    # 関連度順は計算できないため並び順を追加しない
+    assert order_by_relevance(query, session, '諸橋沙夏') is query
+
+
+def test_index_state_is_tracked_per_engine(db_manager, session, plain_engine):
+    # 同じURL（sqlite:///:memory:）でも、索引のあるDBの確認結果を別のエンジンに使わない
+    assert search_index_ready(db_manager.engine)
+    assert not search_index_ready(plain_engine)
+
+    other = sessionmaker(bind=plain_engine)()
+    try:
+        add_items(other)
+        assert search(other, '諸橋沙夏 主演') == {'https://example.com/1', 'https://example.com/3'}
+
+        assert create_search_index(plain_engine) == ['キーワード検索用のインデックスを作成']
+        assert search_index_ready(plain_engine)
+        assert 'items_fts MATCH' in compiled(apply_keyword_filter(other.query(Item), other, '諸橋沙夏'))
+        assert search(other, '諸橋沙夏 主演') == {'https://example.com/1', 'https://example.com/3'}
+    finally:
+        other.close()
+
+
+def test_postgresql_uses_ilike_for_every_term(session):
+    pg_session = SimpleNamespace(get_bind=lambda: SimpleNamespace(dialect=postgresql.dialect()))
+
+    query = apply_keyword_filter(session.query(Item), pg_session, '諸橋沙夏 主演')
+    sql = compiled(query, postgresql.dialect())
+
+    assert sql.count('ILIKE') == 2
+    assert 'coalesce(items.title' in sql
+    assert 'items_fts' not in sql
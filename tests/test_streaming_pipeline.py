@@ -0,0 +1,223 @@
+"""
+StreamingPipeline のテスト（収集・判定・保存のスレッド連携と、エラー時の中止）
+"""
+import copy
+import threading
+
+import pytest
+
+from main import NatsuAgentExecutor
+from src.database.models import Execution, Item
+
+BASE_CONTENT = '諸橋沙夏が春の新ドラマで主演を務めることが決定した。共演者も豪華な顔ぶれとなっている。'
+
+
+# ソースごとの記事URL（事前フィルタの url_patterns を通る形式）
+URL_FORMATS = {
+    'twitter': 'https://twitter.com/natsu_fan/status/{prefix}{i}',
+    'yahoo_news': 'https://news.yahoo.co.jp/articles/{prefix}{i}',
+    'modelpress': 'https://mdpr.jp/news/{prefix}{i}',
+}
+
+
+def make_items(source, count, prefix):
+    """
+    収集結果のアイテムを作成
+    """
+    return [
+        {
+            'source': source,
+            'title': f'諸橋沙夏 {prefix} {i}',
+            'content': f'{BASE_CONTENT}（{prefix} {i}）',
+            'url': URL_FORMATS[source].format(prefix=prefix, i=i),
+            'published_at': '2026-01-01T00:00:00+09:00',
+        }
+        for i in range(count)
+    ]
+
+
+def judge_all_high(items, model=None):
+    """
+    全件を重要度highと判定するClaude APIの代わり
+    """
+    return [
+        {
+            'url': item['url'],
+            'relevance_score': 90,
+            'importance_score': 85,
+            'importance_level': 'high',
+            'category': 'イベント',
+            'summary': item['title'],
+        }
+        for item in items
+    ]
+
+
+@pytest.fixture
+def executor(db_manager):
+    """
+    ネットワーク・Claude APIを使わないExecutor（各Agentは agent_items の内容を収集する）
+    """
+    executor = NatsuAgentExecutor()
+    executor.claude_processor.local_classifier = None
+    executor.claude_processor._call_claude_api = judge_all_high
+    executor.near_duplicate_clusterer = None
+
+    # 共有の設定辞書は変更しない
+    settings = copy.deepcopy(executor.claude_processor.settings)
+    settings['pipeline']['streaming'].update({'queue_size': 2, 'judge_batch_size': 5, 'judge_batch_timeout_sec': 0.2})
+    executor.claude_processor.settings = settings
+
+    executor.agent_items = {
+        'twitter': make_items('twitter', 3, 'tw'),
+        'yahoo': make_items('yahoo_news', 4, 'yahoo'),
+        'modelpress': make_items('modelpress', 5, 'mdpr'),
+    }
+    for agent in executor.agents:
+        agent.retry_interval = 0
+        agent.collect_stream = (lambda name=agent.name: iter(copy.deepcopy(executor.agent_items[name])))
+    return executor
+
+
+def run_with_timeout(func, timeout=30):
+    """
+    別スレッドで実行し、終わらない場合は失敗にする
+    """
+    result = {}
+    thread = threading.Thread(target=lambda: result.update(value=func()), daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), 'パイプラインが終了しませんでした'
+    return result['value']
+
+
+def saved_urls(db_manager):
+    session = db_manager.get_session()
+    try:
+        return {url for (url,) in session.query(Item.url)}
+    finally:
+        session.close()
+
+
+def test_streaming_run_saves_items_from_all_agents(executor, db_manager):
+    result = run_with_timeout(lambda: executor.execute(streaming=True))
+
+    assert result['status'] == 'success'
+    assert result['total_collected'] == 12
+    assert saved_urls(db_manager) == {
+        item['url'] for items in executor.agent_items.values() for item in items
+    }
+
+
+def load_execution(db_manager, execution_id):
+    session = db_manager.get_session()
+    try:
+        return session.query(Execution).filter_by(id=execution_id).one()
+    finally:
+        session.close()
+
+
+def test_retried_agent_counts_items_once_across_attempts(executor, db_manager):
+    attempts = {'count': 0}
+    items = executor.agent_items['modelpress']
+
+    def flaky_stream():
+        attempts['count'] += 1
+        yield dict(items[0])
+        yield dict(items[1])
+        if attempts['count'] == 1:
+            raise RuntimeError('接続が切断されました')
+        for item in items[2:]:
+            yield dict(item)
+
+    modelpress = next(agent for agent in executor.agents if agent.name == 'modelpress')
+    modelpress.collect_stream = flaky_stream
+
+    result = run_with_timeout(lambda: executor.execute(streaming=True))
+
+    assert result['status'] == 'success'
+    assert result['total_collected'] == 12
+
+    execution = load_execution(db_manager, result['execution_id'])
+    assert execution.total_collected == 12
+    assert execution.agent_results['modelpress']['attempts'] == 2
+    assert execution.agent_results['modelpress']['count'] == 5
+    assert execution.agent_results['modelpress']['new'] == 5
+
+
+def test_items_from_failed_attempts_are_counted(executor, db_manager):
+    # 1回目の試行だけで渡したアイテムも判定・保存されるため、収集件数とチェックポイントに含める
+    items = executor.agent_items['modelpress']
+    dropped = make_items('modelpress', 1, 'dropped')[0]
+    attempts = {'count': 0}
+
+    def flaky_stream():
+        attempts['count'] += 1
+        if attempts['count'] == 1:
+            yield dict(dropped)
+            raise RuntimeError('接続が切断されました')
+        for item in items:
+            yield dict(item)
+
+    # Yahoo!ニュースは全試行が失敗するが、失敗前に渡したアイテムは保存される
+    yahoo_items = executor.agent_items['yahoo']
+
+    def failing_stream():
+        yield dict(yahoo_items[0])
+        raise RuntimeError('503 Service Unavailable')
+
+    for agent in executor.agents:
+        if agent.name == 'modelpress':
+            agent.collect_stream = flaky_stream
+        elif agent.name == 'yahoo':
+            agent.collect_stream = failing_stream
+
+    checkpoints = {}
+    save_checkpoint = executor._save_checkpoint
+
+    def record_checkpoint(execution_id, stage, payload):
+        checkpoints[stage] = payload
+        save_checkpoint(execution_id, stage, payload)
+
+    executor._save_checkpoint = record_checkpoint
+
+    result = run_with_timeout(lambda: executor.execute(streaming=True))
+
+    assert result['status'] == 'partial'
+    saved = saved_urls(db_manager)
+    assert dropped['url'] in saved
+    assert yahoo_items[0]['url'] in saved
+
+    execution = load_execution(db_manager, result['execution_id'])
+    assert execution.total_collected == len(saved) == 3 + 1 + 5 + 1
+    assert execution.total_saved <= execution.total_collected
+    assert {item['url'] for item in checkpoints['collected']['items']} == saved
+
+
+def test_pre_filter_error_fails_run_without_hanging(executor, db_manager):
+    # キューの上限より多く収集しても、中止後に収集側がブロックしたままにならないこと
+    executor.agent_items['twitter'] = make_items('twitter', 30, 'tw')
+
+    def broken_filter(items):
+        raise RuntimeError('事前フィルタの設定が不正です')
+
+    executor.pre_filter.apply = broken_filter
+
+    result = run_with_timeout(lambda: executor.execute(streaming=True))
+
+    assert result['status'] == 'failed'
+    assert '事前フィルタ' in result['error']
+    assert saved_urls(db_manager) == set()
+
+
+def test_judge_error_fails_run(executor, db_manager):
+    def broken_judge(items, model=None):
+        raise RuntimeError('Claude APIが応答しません')
+
+    executor.claude_processor._call_claude_api = broken_judge
+
+    result = run_with_timeout(lambda: executor.execute(streaming=True))
+
+    assert result['status'] == 'failed'
+    assert 'Claude判定' in result['error']
+    assert saved_urls(db_manager) == set()
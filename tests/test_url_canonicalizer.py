@@ -0,0 +1,92 @@
+"""
+URL正規化（canonicalize_url / canonical_key）と既存アイテムのキー設定のテスト
+"""
+from datetime import datetime
+
+import pytest
+import pytz
+from sqlalchemy import text
+
+from src.database.migrations import _backfill_canonical_keys
+from src.utils.url_canonicalizer import canonicalize_url, canonical_key
+
+
+@pytest.mark.parametrize('url, expected', [
+    # X: ホストの別名・ユーザー名・写真ページ・クエリを統一
+    ('https://twitter.com/natsu_fan/status/123?s=20', 'https://x.com/i/status/123'),
+    ('http://mobile.twitter.com/natsu_fan/status/123/photo/1', 'https://x.com/i/status/123'),
+    ('https://x.com/i/web/status/123#reply', 'https://x.com/i/status/123'),
+    ('https://www.x.com/natsu_fan/statuses/123', 'https://x.com/i/status/123'),
+    ('https://twitter.com/natsu_fan?ref_src=twsrc', 'https://x.com/natsu_fan'),
+    # Yahoo!ニュース: 記事ID以下のページ・画像・コメントやパラメータを除去
+    ('https://news.yahoo.co.jp/articles/abc123/images/000', 'https://news.yahoo.co.jp/articles/abc123'),
+    ('https://news.yahoo.co.jp/articles/abc123?page=2&source=rss', 'https://news.yahoo.co.jp/articles/abc123'),
+    ('https://news.yahoo.co.jp/pickup/6400000/comments', 'https://news.yahoo.co.jp/pickup/6400000'),
+    # モデルプレス: 記事の表記揺れを統一
+    ('https://mdpr.jp/news/4000000', 'https://mdpr.jp/news/detail/4000000'),
+    ('https://m.mdpr.jp/news/detail/4000000/photo/2?from=top', 'https://mdpr.jp/news/detail/4000000'),
+    # 共通: スキーム・ホストの大文字小文字・フラグメント・末尾のスラッシュ・パラメータの順序
+    ('HTTP://Example.COM/path/?b=2&a=1#top', 'https://example.com/path?a=1&b=2'),
+    ('https://example.com/path?utm_source=x&fbclid=y&id=1', 'https://example.com/path?id=1'),
+    ('https://example.com:8080/a', 'https://example.com:8080/a'),
+    ('', ''),
+])
+def test_canonicalize_url(url, expected):
+    assert canonicalize_url(url) == expected
+
+
+@pytest.mark.parametrize('url, expected', [
+    # ホスト別のトラッキング用パラメータ（記事以外のページ）
+    ('https://news.yahoo.co.jp/ranking/access/news?source=rss&from=top', 'https://news.yahoo.co.jp/ranking/access/news'),
+    ('https://mdpr.jp/search?q=諸橋沙夏&from=header', 'https://mdpr.jp/search?q=%E8%AB%B8%E6%A9%8B%E6%B2%99%E5%A4%8F'),
+    # 他のホストでは from / source / ref はページの内容を表すため残す
+    ('https://example.com/timetable?from=2026-01-01', 'https://example.com/timetable?from=2026-01-01'),
+    ('https://example.com/feed?source=radio', 'https://example.com/feed?source=radio'),
+    ('https://example.com/repo?ref=main', 'https://example.com/repo?ref=main'),
+])
+def test_generic_params_are_removed_only_on_known_hosts(url, expected):
+    assert canonicalize_url(url) == expected
+
+
+def test_pages_distinguished_by_generic_params_get_different_keys():
+    assert (
+        canonical_key('https://example.com/timetable?from=2026-01-01')
+        != canonical_key('https://example.com/timetable?from=2026-02-01')
+    )
+
+
+def test_same_tweet_gets_same_key():
+    assert canonical_key('https://twitter.com/a/status/1') == canonical_key('https://x.com/b/status/1?s=20')
+    assert canonical_key('') == ''
+
+
+def test_backfill_rekeys_rows_keyed_by_old_rules(db_manager):
+    now = datetime.now(pytz.timezone('Asia/Tokyo'))
+    rows = [
+        # 旧ルールで from を除去したキーが付いている行
+        (1, 'https://example.com/timetable?from=2026-01-01', canonical_key('https://example.com/timetable')),
+        # キー未設定の行
+        (2, 'https://x.com/a/status/1', None),
+        # 正規化すると行2と同じになる行（キーを付けない）
+        (3, 'https://twitter.com/b/status/1', None),
+    ]
+    with db_manager.engine.begin() as conn:
+        for item_id, url, key in rows:
+            conn.execute(
+                text('INSERT INTO items (id, source, url, canonical_key, published_at) VALUES (:id, :source, :url, :key, :published_at)'),
+                {'id': item_id, 'source': 'twitter', 'url': url, 'key': key, 'published_at': now}
+            )
+
+    applied = _backfill_canonical_keys(db_manager.engine)
+
+    with db_manager.engine.connect() as conn:
+        keys = dict(conn.execute(text('SELECT id, canonical_key FROM items')).fetchall())
+    assert keys == {
+        1: canonical_key('https://example.com/timetable?from=2026-01-01'),
+        2: canonical_key('https://x.com/a/status/1'),
+        3: None,
+    }
+    assert applied
+
+    # 2回目は変更なし
+    assert _backfill_canonical_keys(db_manager.engine) == []